@@ -0,0 +1,75 @@
+"""
+Compares two benchmark result files and fails on regressions.
+
+A scenario regresses when its median time grew by more than --threshold
+percent AND by more than --min-delta milliseconds (so tiny scenarios don't
+fail on noise). Scenarios present in only one file are listed but never fail
+the comparison.
+
+Usage:
+    python benchmarks/compare.py baseline.json current.json --threshold 10
+Exit status is 1 if any scenario regressed, 2 if a file can't be read.
+"""
+import argparse
+import json
+import sys
+
+def load(path: str) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def compare(baseline: dict, current: dict, threshold: float, min_delta: float) -> tuple[list[tuple], list[str]]:
+    """
+    Returns (rows, regressions). Each row is (key, baseline ms, current ms, change %, verdict).
+    """
+    rows, regressions = [], []
+    base_results, current_results = baseline["results"], current["results"]
+    for key in sorted(set(base_results) | set(current_results)):
+        before, after = base_results.get(key, {}), current_results.get(key, {})
+        if "median" not in before or "median" not in after:
+            before_ms = before["median"] * 1000 if "median" in before else None
+            after_ms = after["median"] * 1000 if "median" in after else None
+            rows.append((key, before_ms, after_ms, None, "only in one file"))
+            continue
+        before_ms, after_ms = before["median"] * 1000, after["median"] * 1000
+        change = (after_ms - before_ms) / before_ms * 100 if before_ms else 0.0
+        if change > threshold and after_ms - before_ms > min_delta:
+            verdict = "REGRESSION"
+            regressions.append(key)
+        elif change < -threshold and before_ms - after_ms > min_delta:
+            verdict = "faster"
+        else:
+            verdict = "ok"
+        rows.append((key, before_ms, after_ms, change, verdict))
+    return rows, regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files.")
+    parser.add_argument("baseline", help="Results from the reference commit.")
+    parser.add_argument("current", help="Results from the commit under test.")
+    parser.add_argument("--threshold", "-t", type=float, default=10.0, help="Allowed slowdown in percent (default: 10).")
+    parser.add_argument("--min-delta", type=float, default=20.0, help="Ignore slowdowns smaller than this many milliseconds (default: 20).")
+    arguments = parser.parse_args()
+
+    try:
+        baseline, current = load(arguments.baseline), load(arguments.current)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(2)
+
+    print(f"baseline: {baseline['meta'].get('commit') or '?'}   current: {current['meta'].get('commit') or '?'}")
+    rows, regressions = compare(baseline, current, arguments.threshold, arguments.min_delta)
+    print(f"{'scenario':<28} {'baseline':>11} {'current':>11} {'change':>8}")
+    for key, before_ms, after_ms, change, verdict in rows:
+        before_text = f"{before_ms:8.1f} ms" if before_ms is not None else "-"
+        after_text = f"{after_ms:8.1f} ms" if after_ms is not None else "-"
+        change_text = f"{change:+7.1f}%" if change is not None else ""
+        print(f"{key:<28} {before_text:>11} {after_text:>11} {change_text:>8}  {verdict}")
+
+    if regressions:
+        print(f"\n{len(regressions)} scenario(s) slowed down by more than {arguments.threshold:g}%: {', '.join(regressions)}")
+        sys.exit(1)
+    print(f"\nNo scenario slowed down by more than {arguments.threshold:g}%.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""
+Generates a synthetic gfr project for benchmarking.
+
+The layout under the destination directory is:
+
+    remotes/super.git        bare remote of the superproject
+    remotes/svcNNN.git       bare remote of each submodule
+    super/                   the superproject, with every submodule checked out on 'develop'
+    gitconfig                the git configuration the fixture was built with
+
+Each submodule gets M files, K feature branches and T version tags (on a
+chain of T commits, plus a few untagged commits after the newest tag).
+Repositories are written with 'git fast-import', so even large fixtures are
+built in seconds. Everything is local; remotes are plain paths. Content,
+authors and dates are fixed, so the same parameters always produce the same
+commits.
+
+Usage:
+    python benchmarks/generate.py DEST --submodules 20 --files 200 --branches 20 --tags 100
+"""
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+from dataclasses import dataclass
+
+# Fixed identity and clock so generated commits are identical between runs
+_EPOCH = 1700000000
+GIT_ENV = {
+    "GIT_AUTHOR_NAME": "Bench",
+    "GIT_AUTHOR_EMAIL": "bench@example.com",
+    "GIT_COMMITTER_NAME": "Bench",
+    "GIT_COMMITTER_EMAIL": "bench@example.com",
+    "GIT_AUTHOR_DATE": f"{_EPOCH} +0000",
+    "GIT_COMMITTER_DATE": f"{_EPOCH} +0000",
+    "GIT_CONFIG_NOSYSTEM": "1",
+    "GIT_TERMINAL_PROMPT": "0",
+}
+GITCONFIG = """\
+[user]
+    name = Bench
+    email = bench@example.com
+[init]
+    defaultBranch = main
+[protocol "file"]
+    allow = always
+[advice]
+    detachedHead = false
+"""
+# Commits after the newest tag, so 'release start' has something to put in the notes
+UNRELEASED_COMMITS = 5
+
+@dataclass(frozen=True)
+class FixtureSize:
+    """How big a generated project is."""
+    submodules: int
+    files: int
+    branches: int
+    tags: int
+
+    def describe(self) -> str:
+        return f"{self.submodules} submodules x {self.files} files, {self.branches} branches, {self.tags} tags"
+
+def git_environment(dest: str) -> dict:
+    """The environment to run git (and ggg) with against a fixture: isolated from the user's config."""
+    env = dict(os.environ)
+    env.update(GIT_ENV)
+    env["GIT_CONFIG_GLOBAL"] = os.path.join(dest, "gitconfig")
+    return env
+
+def _git(args: list[str], cwd: str, env: dict, stdin: bytes = None) -> str:
+    result = subprocess.run(["git", *args], cwd=cwd, env=env, input=stdin, capture_output=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"git {' '.join(args)} failed in {cwd}:\n{result.stderr.decode(errors='replace')}")
+    return result.stdout.decode()
+
+def _fast_import_stream(name: str, size: FixtureSize) -> bytes:
+    """A fast-import stream: an initial commit with all files, a tagged commit per version, then unreleased commits."""
+    out = []
+
+    def data(content: bytes):
+        out.append(b"data %d\n" % len(content))
+        out.append(content)
+        out.append(b"\n")
+
+    def commit(mark: int, parent: int, message: str, files: dict[str, bytes], timestamp: int):
+        out.append(b"commit refs/heads/main\n")
+        out.append(b"mark :%d\n" % mark)
+        out.append(b"author Bench <bench@example.com> %d +0000\n" % timestamp)
+        out.append(b"committer Bench <bench@example.com> %d +0000\n" % timestamp)
+        data(message.encode())
+        if parent:
+            out.append(b"from :%d\n" % parent)
+        for path, content in files.items():
+            out.append(f"M 100644 inline {path}\n".encode())
+            data(content)
+
+    files = {
+        f"src/module_{index:04d}.py": f"# {name} module {index}\nVALUE = {index}\n".encode()
+        for index in range(size.files)
+    }
+    files["README.md"] = f"# {name}\n".encode()
+    commit(1, 0, "Initial commit", files, _EPOCH)
+
+    mark = 1
+    for version in range(1, size.tags + 1):
+        mark += 1
+        commit(mark, mark - 1, f"Add feature {version} (#{version})",
+               {"VERSION": f"0.{version}.0\n".encode()}, _EPOCH + version * 60)
+        out.append(f"reset refs/tags/v0.{version}.0\nfrom :{mark}\n\n".encode())
+    for extra in range(1, UNRELEASED_COMMITS + 1):
+        mark += 1
+        commit(mark, mark - 1, f"Improve {name} part {extra} (#{size.tags + extra})",
+               {f"src/unreleased_{extra}.py": f"PART = {extra}\n".encode()}, _EPOCH + (size.tags + extra) * 60)
+
+    out.append(f"reset refs/heads/develop\nfrom :{mark}\n\n".encode())
+    for branch in range(1, size.branches + 1):
+        # Spread branches over the history so they aren't all identical
+        out.append(f"reset refs/heads/feature/{branch}-bench-{branch}\nfrom :{max(1, mark - branch % mark)}\n\n".encode())
+    return b"".join(out)
+
+def generate(dest: str, size: FixtureSize, force: bool = False) -> str:
+    """
+    Builds a fixture in dest and returns the superproject's path.
+
+    Raises:
+        FileExistsError: If dest exists and force is False.
+    """
+    dest = os.path.abspath(dest)
+    if os.path.exists(dest):
+        if not force:
+            raise FileExistsError(f"{dest} already exists (use --force to replace it).")
+        shutil.rmtree(dest)
+    remotes = os.path.join(dest, "remotes")
+    os.makedirs(remotes)
+    with open(os.path.join(dest, "gitconfig"), "w", encoding="utf-8") as f:
+        f.write(GITCONFIG)
+    env = git_environment(dest)
+
+    names = [f"svc{index:03d}" for index in range(1, size.submodules + 1)]
+    for name in names:
+        bare = os.path.join(remotes, f"{name}.git")
+        _git(["init", "-q", "--bare", bare], dest, env)
+        _git(["fast-import", "--quiet"], bare, env, stdin=_fast_import_stream(name, size))
+        _git(["symbolic-ref", "HEAD", "refs/heads/develop"], bare, env)
+
+    super_remote = os.path.join(remotes, "super.git")
+    _git(["init", "-q", "--bare", super_remote], dest, env)
+    super_path = os.path.join(dest, "super")
+    _git(["clone", "-q", super_remote, super_path], dest, env)
+    _git(["checkout", "-q", "-b", "develop"], super_path, env)
+    with open(os.path.join(super_path, "README.md"), "w", encoding="utf-8") as f:
+        f.write("# Benchmark project\n")
+    _git(["add", "README.md"], super_path, env)
+    _git(["commit", "-q", "-m", "Initial commit"], super_path, env)
+    for name in names:
+        _git(["submodule", "add", "-q", "-b", "develop", os.path.join(remotes, f"{name}.git"), name], super_path, env)
+    _git(["commit", "-q", "-m", f"Add {len(names)} submodules"], super_path, env)
+    _git(["push", "-q", "-u", "origin", "develop"], super_path, env)
+    _git(["push", "-q", "origin", "develop:main"], super_path, env)
+    # Submodules are checked out detached; work on 'develop' like a real gfr project
+    _git(["submodule", "foreach", "-q", "git checkout -q develop"], super_path, env)
+    return super_path
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic superproject with submodules for benchmarking.")
+    parser.add_argument("dest", help="Directory to create.")
+    parser.add_argument("--submodules", "-n", type=int, default=10, help="Number of submodules (N).")
+    parser.add_argument("--files", "-m", type=int, default=100, help="Files per submodule (M).")
+    parser.add_argument("--branches", "-k", type=int, default=10, help="Feature branches per submodule (K).")
+    parser.add_argument("--tags", "-t", type=int, default=20, help="Version tags per submodule (T).")
+    parser.add_argument("--force", action="store_true", help="Replace dest if it exists.")
+    arguments = parser.parse_args()
+
+    size = FixtureSize(arguments.submodules, arguments.files, arguments.branches, arguments.tags)
+    try:
+        super_path = generate(arguments.dest, size, force=arguments.force)
+    except (FileExistsError, RuntimeError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    print(f"Generated {size.describe()} in {super_path}")
+    print(f"Run ggg there with GIT_CONFIG_GLOBAL={os.path.join(os.path.abspath(arguments.dest), 'gitconfig')}")
+
+if __name__ == "__main__":
+    main()
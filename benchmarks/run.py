@@ -0,0 +1,236 @@
+"""
+Times ggg commands on generated projects of several sizes.
+
+For every size, a fixture is generated once (see generate.py) and kept as a
+template. Before each timed run the template is copied back into place, so
+every run starts from the same state and commands that change the project
+(push, acp, release start) can be repeated. Each scenario is run once
+untimed to warm the on-disk caches, then --repeat times.
+
+Commands run as separate 'python -m gfr' processes from this checkout (or
+from the tree given with --gfr-path), so results include interpreter startup
+exactly as users see it and compare cleanly between commits. The daemon is
+bypassed unless --daemon is given.
+
+Usage:
+    python benchmarks/run.py --sizes small,medium --repeat 5 --output results.json
+    python benchmarks/run.py --scenarios status,link --sizes large
+    python benchmarks/run.py --gfr-path /tmp/gfr-main --output before.json
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from generate import FixtureSize, generate, git_environment
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SIZES = {
+    "small": FixtureSize(submodules=5, files=50, branches=5, tags=10),
+    "medium": FixtureSize(submodules=20, files=200, branches=20, tags=100),
+    "large": FixtureSize(submodules=50, files=500, branches=50, tags=1000),
+}
+
+@dataclass
+class Scenario:
+    """A ggg command to time, with an optional untimed setup step run on the fresh copy."""
+    name: str
+    args: list[str]
+    setup: Optional[Callable[[str, dict], None]] = None
+    # Lines fed to the command on stdin (for 'ggg batch')
+    stdin: str = ""
+    # A file the gfr tree under test must have for the scenario to run (older trees lack some commands)
+    requires: Optional[str] = None
+
+def _git(args: list[str], cwd: str, env: dict):
+    subprocess.run(["git", *args], cwd=cwd, env=env, check=True, capture_output=True)
+
+def _submodule_paths(super_path: str) -> list[str]:
+    return sorted(
+        os.path.join(super_path, name) for name in os.listdir(super_path)
+        if name.startswith("svc") and os.path.isdir(os.path.join(super_path, name))
+    )
+
+def _touch_every_submodule(super_path: str, env: dict):
+    """Leaves an uncommitted change in every submodule."""
+    for path in _submodule_paths(super_path):
+        with open(os.path.join(path, "README.md"), "a", encoding="utf-8") as f:
+            f.write("benchmark change\n")
+
+def _commit_in_every_repo(super_path: str, env: dict):
+    """Adds one unpushed commit to every submodule and to the superproject."""
+    _touch_every_submodule(super_path, env)
+    for path in _submodule_paths(super_path):
+        _git(["commit", "-q", "-am", "Benchmark change"], path, env)
+    _git(["commit", "-q", "-am", "Update submodules"], super_path, env)
+
+SCENARIOS = {
+    "status": Scenario("status", ["status"]),
+    "link": Scenario("link", ["link"]),
+    "push": Scenario("push", ["push"], setup=_commit_in_every_repo),
+    "acp-all": Scenario("acp-all", ["acp", "ALL", "Benchmark change"], setup=_touch_every_submodule),
+    # 'release start' asks for the release type; batch answers it
+    "release-start": Scenario("release-start", ["batch"], stdin="release svc001 start\n> minor\n", requires="gfr/commands/batch.py"),
+}
+
+@dataclass
+class Result:
+    size: str
+    scenario: str
+    times: list[float] = field(default_factory=list)
+    failures: int = 0
+
+    def to_dict(self) -> dict:
+        summary = {"size": self.size, "scenario": self.scenario, "runs": len(self.times), "failures": self.failures, "times": self.times}
+        if self.times:
+            summary.update(
+                median=statistics.median(self.times),
+                min=min(self.times),
+                max=max(self.times),
+                stdev=statistics.stdev(self.times) if len(self.times) > 1 else 0.0,
+            )
+        return summary
+
+def _restore(template: str, workdir: str):
+    """Replaces the working fixture with a pristine copy (timestamps kept, so mtime-keyed caches stay valid)."""
+    if os.path.exists(workdir):
+        shutil.rmtree(workdir)
+    shutil.copytree(template, workdir, symlinks=True)
+
+def _run_once(scenario: Scenario, super_path: str, env: dict, verbose: bool) -> Optional[float]:
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-m", "gfr", *scenario.args],
+        cwd=super_path,
+        env=env,
+        input=scenario.stdin.encode(),
+        capture_output=True,
+    )
+    elapsed = time.perf_counter() - start
+    if completed.returncode != 0:
+        if verbose:
+            sys.stderr.write(completed.stdout.decode(errors="replace") + completed.stderr.decode(errors="replace"))
+        return None
+    return elapsed
+
+def run_size(size_name: str, size: FixtureSize, scenarios: list[Scenario], repeat: int, base_dir: str, gfr_root: str, use_daemon: bool, verbose: bool) -> list[Result]:
+    print(f"== {size_name}: {size.describe()}")
+    # The fixture is generated where runs happen, then moved aside; copies land on the
+    # same path, so the absolute remote paths in its git config stay valid
+    workdir = os.path.join(base_dir, size_name)
+    template = os.path.join(base_dir, f"{size_name}.template")
+    started = time.perf_counter()
+    generate(workdir, size, force=True)
+    if os.path.exists(template):
+        shutil.rmtree(template)
+    os.rename(workdir, template)
+    print(f"   generated in {time.perf_counter() - started:.1f}s")
+
+    env = git_environment(workdir)
+    env["PYTHONPATH"] = gfr_root + os.pathsep + env.get("PYTHONPATH", "")
+    env["GFR_CACHE_DIR"] = os.path.join(base_dir, f"{size_name}.cache")
+    env["COLUMNS"] = "120"
+    if not use_daemon:
+        env["GFR_NO_DAEMON"] = "1"
+    super_path = os.path.join(workdir, "super")
+
+    results = []
+    for scenario in scenarios:
+        if scenario.requires and not os.path.exists(os.path.join(gfr_root, scenario.requires)):
+            print(f"   {scenario.name:<14} skipped ({scenario.requires} is missing from the tree under test)")
+            continue
+        result = Result(size_name, scenario.name)
+        for attempt in range(repeat + 1):
+            _restore(template, workdir)
+            if scenario.setup:
+                scenario.setup(super_path, env)
+            elapsed = _run_once(scenario, super_path, env, verbose)
+            if attempt == 0:
+                # Warm-up run: fills the caches a regular user would already have
+                continue
+            if elapsed is None:
+                result.failures += 1
+            else:
+                result.times.append(elapsed)
+        summary = result.to_dict()
+        if result.times:
+            print(f"   {scenario.name:<14} median {summary['median'] * 1000:8.1f} ms  (min {summary['min'] * 1000:.1f}, max {summary['max'] * 1000:.1f})"
+                  + (f"  [{result.failures} failed]" if result.failures else ""))
+        else:
+            print(f"   {scenario.name:<14} failed every run (use --verbose to see the output)")
+        results.append(result)
+    shutil.rmtree(workdir, ignore_errors=True)
+    return results
+
+def _metadata(gfr_root: str) -> dict:
+    def command_output(args: list[str]) -> Optional[str]:
+        try:
+            return subprocess.run(args, cwd=gfr_root, capture_output=True, text=True, check=True).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+    return {
+        "commit": command_output(["git", "rev-parse", "HEAD"]),
+        "dirty": bool(command_output(["git", "status", "--porcelain", "--untracked-files=no"])),
+        "git": command_output(["git", "--version"]),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ggg commands on synthetic submodule projects.")
+    parser.add_argument("--sizes", default="small,medium", help=f"Comma-separated sizes: {', '.join(SIZES)}.")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help=f"Comma-separated scenarios: {', '.join(SCENARIOS)}.")
+    parser.add_argument("--repeat", "-r", type=int, default=5, help="Timed runs per scenario (after one warm-up run).")
+    parser.add_argument("--output", "-o", help="Write results as JSON to this file.")
+    parser.add_argument("--workdir", help="Where fixtures are generated (default: a temporary directory).")
+    parser.add_argument("--gfr-path", default=REPO_ROOT, help="Time the gfr package in this directory, e.g. a worktree of another commit (default: this checkout).")
+    parser.add_argument("--daemon", action="store_true", help="Let commands go through a running 'ggg daemon'.")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Show the output of failed runs.")
+    arguments = parser.parse_args()
+
+    try:
+        sizes = {name: SIZES[name] for name in arguments.sizes.split(",")}
+        scenarios = [SCENARIOS[name] for name in arguments.scenarios.split(",")]
+    except KeyError as e:
+        parser.error(f"unknown size or scenario {e}")
+    if arguments.repeat < 1:
+        parser.error("--repeat must be at least 1")
+    gfr_root = os.path.abspath(arguments.gfr_path)
+    if not os.path.isfile(os.path.join(gfr_root, "gfr", "__main__.py")):
+        parser.error(f"no gfr package in {gfr_root}")
+
+    base_dir = arguments.workdir or tempfile.mkdtemp(prefix="gfr-bench-")
+    os.makedirs(base_dir, exist_ok=True)
+    results = []
+    try:
+        for size_name, size in sizes.items():
+            results += run_size(size_name, size, scenarios, arguments.repeat, base_dir, gfr_root, arguments.daemon, arguments.verbose)
+    finally:
+        if not arguments.workdir:
+            shutil.rmtree(base_dir, ignore_errors=True)
+
+    report = {
+        "meta": _metadata(gfr_root),
+        "sizes": {name: vars(size) for name, size in sizes.items()},
+        "results": {f"{result.size}/{result.scenario}": result.to_dict() for result in results},
+    }
+    if arguments.output:
+        with open(arguments.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to {arguments.output}")
+    if any(result.failures for result in results):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
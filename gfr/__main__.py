@@ -1,4 +1,4 @@
-from gfr.app import app
+from gfr.client import main
 
 if __name__ == "__main__":
-    app()
+    main()
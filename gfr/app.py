@@ -1,41 +1,100 @@
+import importlib
 import typer
-from gfr.commands import (
-    hello, create,
-    init, addmicro,
-    add, commit, push, ac, acp,
-    status, link,
-    addasset,
-    doc, dev,
-    feature, bugfix, release
-)
+from typing_extensions import Annotated
+from typer.core import TyperGroup
+
+from gfr.utils.config import flush_config
+from gfr.utils.settings import settings
+from gfr.utils.git.context import reset_repo_context
+from gfr.utils.tracing import trace_command
+
+# Registry of subcommands: command name -> module path.
+# Each module exposes a Typer `app` and is only imported when its command runs,
+# so local-only commands like 'status' don't pay for PyGithub, questionary, etc.
+COMMANDS = {
+    "hello": "gfr.commands.hello",
+    "create": "gfr.commands.create",
+    "init": "gfr.commands.init",
+    "addmicro": "gfr.commands.addmicro",
+    "am": "gfr.commands.addmicro",
+    "add": "gfr.commands.add",
+    "commit": "gfr.commands.commit",
+    "ac": "gfr.commands.ac",
+    "push": "gfr.commands.push",
+    "acp": "gfr.commands.acp",
+    "status": "gfr.commands.status",
+    "link": "gfr.commands.link",
+    "addasset": "gfr.commands.addasset",
+    "adda": "gfr.commands.addasset",
+    "dev": "gfr.commands.dev",
+    "doc": "gfr.commands.doc",
+    "feature": "gfr.commands.feature",
+    "bugfix": "gfr.commands.bugfix",
+    "release": "gfr.commands.release",
+    "batch": "gfr.commands.batch",
+    "daemon": "gfr.commands.daemon",
+}
+
+
+class LazyCommandGroup(TyperGroup):
+    """
+    A command group that resolves subcommands from the COMMANDS registry,
+    importing a command's module only when that command is requested.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._loaded_commands = {}
+
+    def list_commands(self, ctx) -> list[str]:
+        """Lists every registered command without importing any of them."""
+        return sorted(COMMANDS)
+
+    def get_command(self, ctx, cmd_name: str):
+        """Imports the command's module on first use and builds its click command."""
+        if cmd_name not in COMMANDS:
+            return None
+        if cmd_name not in self._loaded_commands:
+            module = importlib.import_module(COMMANDS[cmd_name])
+            command = typer.main.get_group(module.app)
+            command.name = cmd_name
+            self._loaded_commands[cmd_name] = command
+        return self._loaded_commands[cmd_name]
+
+    def invoke(self, ctx):
+        """
+        Runs a command with a fresh RepoContext, so memoized lookups never leak
+        between commands, and saves config changes once it is done.
+        """
+        reset_repo_context()
+        try:
+            return super().invoke(ctx)
+        finally:
+            flush_config()
+
 
 # Create the main Typer application
 app = typer.Typer(
     name="ggg",
     help="Git Flow Assistant of Rahmasir (gfr) helps with git and GitHub workflows.",
     add_completion=False,
+    cls=LazyCommandGroup,
 )
 
-# Add subcommands from the commands module
-app.add_typer(hello.app, name="hello")
-app.add_typer(create.app, name="create")
-app.add_typer(init.app, name="init")
-app.add_typer(addmicro.app, name="addmicro")
-app.add_typer(addmicro.app, name="am")
-app.add_typer(add.app, name="add")
-app.add_typer(commit.app, name='commit')
-app.add_typer(ac.app, name='ac')
-app.add_typer(push.app, name='push')
-app.add_typer(acp.app, name='acp')
-app.add_typer(status.app, name='status')
-app.add_typer(link.app, name='link')
-app.add_typer(addasset.app, name='addasset')
-app.add_typer(addasset.app, name='adda')
-app.add_typer(dev.app, name='dev')
-app.add_typer(doc.app, name='doc')
-app.add_typer(feature.app, name='feature')
-app.add_typer(bugfix.app, name='bugfix')
-app.add_typer(release.app, name='release')
+
+@app.callback()
+def main(
+    ctx: typer.Context,
+    verbose: Annotated[bool, typer.Option("--verbose", "-v", help="Show extra details, such as the remaining GitHub API budget.")] = False,
+    profile: Annotated[bool, typer.Option("--profile", help="Time every git command and GitHub call and print a summary tree.")] = False,
+    trace_file: Annotated[str, typer.Option("--trace-file", help="Write the timings as a Chrome trace (open it in ui.perfetto.dev).")] = None,
+):
+    """
+    Git Flow Assistant of Rahmasir (gfr) helps with git and GitHub workflows.
+    """
+    settings.verbose = verbose
+    # Closed when the command finishes, which records its span and prints/writes the profile
+    ctx.with_resource(trace_command(f"ggg {ctx.invoked_subcommand}", profile=profile, trace_file=trace_file))
+
 
 if __name__ == "__main__":
     app()
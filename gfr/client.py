@@ -0,0 +1,147 @@
+# gfr/client.py
+"""
+The 'ggg' entry point.
+
+When a 'ggg daemon' is running, the command is handed to it over a Unix
+socket together with the terminal (stdin/stdout/stderr), the working
+directory and the environment, and the daemon runs it in a process that
+already has everything imported and cached. Otherwise, or if the daemon
+can't be reached, the command runs in this process as usual.
+
+This module is imported on every invocation, so it only uses the standard
+library and must stay small.
+"""
+import json
+import os
+import signal
+import socket
+import struct
+import sys
+
+from gfr.utils.cache import get_cache_dir
+
+PROTOCOL_VERSION = 1
+# Messages are a 4-byte big-endian length followed by that many bytes of JSON
+_LENGTH = struct.Struct("!I")
+# Commands that must not be forwarded: the daemon can't manage itself from inside a request
+_LOCAL_COMMANDS = {"daemon"}
+_FORWARDED_SIGNALS = ("SIGINT", "SIGTERM", "SIGHUP")
+
+def get_socket_path() -> str:
+    """The daemon's socket: $GFR_DAEMON_SOCKET, or daemon.sock in the cache directory."""
+    return os.getenv("GFR_DAEMON_SOCKET") or os.path.join(get_cache_dir(), "daemon.sock")
+
+def daemon_supported() -> bool:
+    """Whether this platform can pass file descriptors over Unix sockets."""
+    return hasattr(socket, "AF_UNIX") and hasattr(socket, "send_fds")
+
+def encode_message(message: dict) -> bytes:
+    data = json.dumps(message).encode("utf-8")
+    return _LENGTH.pack(len(data)) + data
+
+def read_message(sock: socket.socket, prefix: bytes = b"") -> dict | None:
+    """Reads one length-prefixed message. Returns None if the peer closed the connection."""
+    data = prefix
+    while len(data) < _LENGTH.size:
+        chunk = sock.recv(65536)
+        if not chunk:
+            return None
+        data += chunk
+    (length,) = _LENGTH.unpack_from(data)
+    data = data[_LENGTH.size:]
+    while len(data) < length:
+        chunk = sock.recv(max(65536, length - len(data)))
+        if not chunk:
+            return None
+        data += chunk
+    return json.loads(data[:length].decode("utf-8"))
+
+def connect(path: str | None = None, timeout: float | None = 0.5) -> socket.socket | None:
+    """Connects to the daemon, or returns None if none is listening."""
+    if not daemon_supported():
+        return None
+    path = path or get_socket_path()
+    if not os.path.exists(path):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(path)
+    except OSError:
+        # A socket file left behind by a daemon that is gone
+        sock.close()
+        return None
+    sock.settimeout(None)
+    return sock
+
+def request(message: dict, path: str | None = None) -> dict | None:
+    """Sends a control message ('status', 'stop') and returns the reply, or None if no daemon is running."""
+    sock = connect(path)
+    if sock is None:
+        return None
+    with sock:
+        sock.sendall(encode_message({"version": PROTOCOL_VERSION, **message}))
+        return read_message(sock)
+
+def _run_remote(argv: list[str]) -> int | None:
+    """
+    Runs a command in the daemon. Returns its exit code, or None if the daemon
+    didn't accept it (in which case nothing was run and it's safe to run locally).
+    """
+    sock = connect()
+    if sock is None:
+        return None
+    with sock:
+        message = encode_message({
+            "version": PROTOCOL_VERSION,
+            "command": "run",
+            "argv": argv,
+            "cwd": os.getcwd(),
+            "env": dict(os.environ),
+        })
+        try:
+            for stream in (sys.stdout, sys.stderr):
+                stream.flush()
+            socket.send_fds(sock, [message], [0, 1, 2])
+            accepted = read_message(sock)
+        except OSError:
+            return None
+        if not accepted or "pid" not in accepted:
+            return None
+
+        # The command runs in a process the terminal doesn't know about, so pass on Ctrl+C etc.
+        pid = accepted["pid"]
+        def forward(signum, frame):
+            try:
+                os.kill(pid, signum)
+            except OSError:
+                pass
+        for name in _FORWARDED_SIGNALS:
+            if hasattr(signal, name):
+                signal.signal(getattr(signal, name), forward)
+
+        while True:
+            try:
+                result = read_message(sock)
+                break
+            except InterruptedError:
+                continue
+        if result is None:
+            print("ggg: lost the connection to the daemon while running the command.", file=sys.stderr)
+            return 1
+        return result.get("exit", 1)
+
+def main():
+    """Runs 'ggg', through the daemon if one is running."""
+    argv = sys.argv[1:]
+    use_daemon = (
+        not os.getenv("GFR_NO_DAEMON")
+        and not _LOCAL_COMMANDS.intersection(argv[:1])
+    )
+    if use_daemon:
+        exit_code = _run_remote(argv)
+        if exit_code is not None:
+            sys.exit(exit_code)
+
+    from gfr.app import app
+    app(prog_name="ggg")
@@ -1,51 +1,132 @@
 # gfr/commands/acp.py
 import typer
 from rich.console import Console
+from rich.markup import escape
+from typing_extensions import Annotated
 
 # Import the other command modules to reuse their logic
 from . import add as add_command
 from . import commit as commit_command
-from . import push as push_command
-from gfr.utils.git.operations import GitOperations
+from gfr.utils.git.context import RepoContext, get_repo_context
+from gfr.utils.parallel import DEFAULT_JOBS
+from gfr.utils.scheduler import TaskScheduler
 
 app = typer.Typer(name="acp", help="Add, commit, and push all changes in one step.", no_args_is_help=True)
 console = Console()
 
+def _display_name(repo_path: str) -> str:
+    return "root" if repo_path == "." else repo_path
+
+def _parent_of(repo_path: str, repos: list[str]) -> str:
+    """Finds the closest repository that contains repo_path ('.' for the root)."""
+    candidates = [r for r in repos if r != repo_path and repo_path.startswith(r + "/")]
+    return max(candidates, key=len) if candidates else "."
+
+def _add_and_commit(repo_ctx: RepoContext, repo_path: str, message: str, skip_add: bool = False) -> bool:
+    """
+    Stages everything in one repository and commits it. Returns False if there was nothing to commit.
+    With skip_add=True the repository is known to be clean, so no git process is spawned at all.
+    """
+    name = _display_name(repo_path)
+    if skip_add:
+        console.print(f"- Nothing to commit in [bold cyan]{name}[/bold cyan].")
+        return False
+
+    git_ops = repo_ctx.git_ops
+    repo_dir = repo_ctx.resolve_path(repo_path)
+    git_ops.add(["."], path=repo_dir)
+    if not git_ops.has_staged_changes(path=repo_dir):
+        console.print(f"- Nothing to commit in [bold cyan]{name}[/bold cyan].")
+        return False
+
+    issue_number = commit_command._extract_issue_number(repo_ctx.get_current_branch(path=repo_dir))
+    git_ops.commit(f"{message} (#{issue_number})" if issue_number else message, path=repo_dir)
+    console.print(f"✔ Committed in [bold cyan]{name}[/bold cyan].")
+    return True
+
+def _push(repo_ctx: RepoContext, repo_path: str):
+    """Pushes all branches of one repository."""
+    repo_ctx.git_ops.push_all(path=repo_ctx.resolve_path(repo_path))
+    console.print(f"✔ Pushed all branches for [bold cyan]{_display_name(repo_path)}[/bold cyan].")
+
+def _acp_all(message: str, jobs: int):
+    """
+    Adds, commits and pushes every repository in the project using a dependency graph:
+    - a repository is committed only after all of its submodules are committed,
+      so the parent records their new commits;
+    - a repository is pushed as soon as its own commit lands and its submodules
+      are pushed, so a parent never references unpublished submodule commits.
+    """
+    repo_ctx = get_repo_context()
+    git_ops = repo_ctx.git_ops
+    if not git_ops.is_git_repo():
+        console.print("[bold red]Error:[/bold red] This command must be run from within a Git repository.")
+        raise typer.Exit(code=1)
+
+    # One tree inspection gives every repository (nested ones included) and whether it is dirty.
+    # Inspecting from the root keeps the paths root-relative, wherever the command runs from.
+    tree_status = git_ops.get_tree_status(path=repo_ctx.get_root(), jobs=jobs)
+    statuses = {repo_status.path: repo_status for repo_status in tree_status}
+    submodules = [path for path in statuses if path != "."]
+    all_repos = submodules + ["."]
+    children = {repo: [] for repo in all_repos}
+    for repo in submodules:
+        children[_parent_of(repo, submodules)].append(repo)
+
+    console.print(f"[bold blue]>>> Starting 'acp' process for ALL {len(all_repos)} repositories...[/bold blue]")
+
+    # Repositories committed during this run; a clean parent only needs 'git add'
+    # if one of its submodules moved to a new commit.
+    committed = set()
+
+    def _commit_step(repo: str):
+        clean = statuses[repo].is_clean and not statuses[repo].error
+        skip_add = clean and not any(child in committed for child in children[repo])
+        if _add_and_commit(repo_ctx, repo, message, skip_add=skip_add):
+            committed.add(repo)
+
+    scheduler = TaskScheduler(jobs)
+    for repo in all_repos:
+        scheduler.add(
+            f"commit:{repo}",
+            lambda repo=repo: _commit_step(repo),
+            depends_on=[f"commit:{child}" for child in children[repo]],
+        )
+        scheduler.add(
+            f"push:{repo}",
+            lambda repo=repo: _push(repo_ctx, repo),
+            depends_on=[f"commit:{repo}"] + [f"push:{child}" for child in children[repo]],
+        )
+
+    results = scheduler.run()
+
+    problems = [(name, result) for name, result in results.items() if result.state != "done"]
+    for name, result in problems:
+        step, repo = name.split(":", 1)
+        if result.state == "failed":
+            console.print(f"[bold red]✘ {step} failed for {escape(_display_name(repo))}:[/bold red] {escape(str(result.error))}")
+        else:
+            console.print(f"[yellow]- {step} skipped for {escape(_display_name(repo))} because a dependency failed.[/yellow]")
+    if problems:
+        raise typer.Exit(code=1)
+
 @app.callback(invoke_without_command=True)
 def acp(
     microservice_name: str = typer.Argument(..., help="The target service (use '.' for parent, '-' for last used)."),
-    message: str = typer.Argument(..., help="The commit message.")
+    message: str = typer.Argument(..., help="The commit message."),
+    jobs: Annotated[int, typer.Option("--jobs", "-j", min=1, help="Number of repositories to process concurrently with 'ALL'.")] = DEFAULT_JOBS
 ):
     """
     Stages all changes, commits them, and pushes all branches in one step by
     sequentially calling the 'add', 'commit', and 'push' commands.
+
+    With 'ALL', every repository (including nested submodules) is processed
+    concurrently: a parent is committed only after all of its submodules are,
+    and each repository is pushed as soon as its own commit lands.
     """
     try:
         if microservice_name == "ALL":
-            git_ops = GitOperations()
-            if not git_ops.is_git_repo():
-                console.print("[bold red]Error:[/bold red] This command must be run from within a Git repository.")
-                raise typer.Exit(code=1)
-
-            submodules = git_ops.get_submodules()
-            all_services = submodules + ["."] # Process submodules first, then parent
-
-            console.print(f"[bold blue]>>> Starting 'acp' process for ALL {len(submodules) + 1} repositories...[/bold blue]")
-
-            for service in all_services:
-                service_name_for_display = "root" if service == "." else service
-                console.print(f"\n[bold magenta]--- Processing {service_name_for_display} ---[/bold magenta]")
-                
-                # Add all changes for the current service
-                add_command.add(microservice_name=service, files_to_add=['.'])
-                
-                # Commit the changes for the current service
-                commit_command.commit(microservice_name=service, message=message)
-
-            # After all services are committed, push everything
-            console.print("\n[bold blue]>>> Running 'push' step for all repositories...[/bold blue]")
-            push_command.push()
-            console.print(f"[bold blue]<<< 'push' step complete.[/bold blue]")
+            _acp_all(message, jobs)
         else:
             # --- Step 1: Execute the 'add' command's logic ---
             console.print(f"[bold blue]>>> Running 'add' step...[/bold blue]")
@@ -58,10 +139,12 @@ def acp(
             console.print(f"[bold blue]<<< 'commit' step complete.[/bold blue]\n")
 
             # --- Step 3: Execute the 'push' command's logic ---
-            git_ops = GitOperations()
+            repo_ctx = get_repo_context()
+            git_ops = repo_ctx.git_ops
             console.print(f"[bold blue]>>> Running 'push' step...[/bold blue]")
-            current_branch = git_ops.get_current_branch(path=microservice_name)
-            git_ops.push_branch(current_branch, True, microservice_name)
+            repo_dir = repo_ctx.resolve_path(microservice_name)
+            current_branch = repo_ctx.get_current_branch(path=repo_dir)
+            git_ops.push_branch(current_branch, True, repo_dir)
             console.print(f"[bold blue]<<< 'push' step complete.[/bold blue]")
         
         console.print("\n[bold green]✔ Add, commit, and push sequence completed successfully![/bold green]")
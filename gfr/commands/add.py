@@ -3,7 +3,8 @@ import typer
 from rich.console import Console
 from typing import List
 
-from gfr.utils.git.operations import GitOperations, GitError
+from gfr.utils.git.operations import GitError
+from gfr.utils.git.context import get_repo_context
 from gfr.utils.config import GFRConfig
 
 app = typer.Typer(name="add", help="Add file contents to the index for the root repo or a microservice.", no_args_is_help=True)
@@ -23,7 +24,8 @@ def add(
     - ggg add - .                   (Stage all changes in the last used microservice)
     """
     try:
-        git_ops = GitOperations()
+        repo_ctx = get_repo_context()
+        git_ops = repo_ctx.git_ops
         config = GFRConfig()
 
         if not git_ops.is_git_repo():
@@ -46,14 +48,15 @@ def add(
 
         # Validate the target path for microservices
         if target_path != ".":
-            submodules = git_ops.get_submodules()
+            submodules = repo_ctx.get_submodule_paths_from_root()
             if target_path not in submodules:
                 console.print(f"[bold red]Error:[/bold red] '{target_name}' is not a valid submodule in this project.")
                 raise typer.Exit(code=1)
 
         # --- Execute the add operation ---
+        # Files are given relative to the target repository, wherever the command runs from
         console.print(f"Staging files in [bold cyan]{target_name}[/bold cyan]...")
-        git_ops.add(files_to_add, path=target_path)
+        git_ops.add(files_to_add, path=repo_ctx.resolve_path(target_path))
         console.print(f"✔ Successfully staged changes in [bold cyan]{target_name}[/bold cyan].")
 
         config.set_last_used_microservice(target_path)
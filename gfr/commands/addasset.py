@@ -3,7 +3,8 @@ import typer
 import os
 from rich.console import Console
 
-from gfr.utils.git.operations import GitOperations, GitError
+from gfr.utils.git.operations import GitError
+from gfr.utils.git.context import get_repo_context
 from gfr.utils.config import GFRConfig
 from gfr.assets import mit
 
@@ -26,7 +27,8 @@ def addasset(
     Creates a new file within a specified service using a predefined asset template.
     """
     try:
-        git_ops = GitOperations()
+        repo_ctx = get_repo_context()
+        git_ops = repo_ctx.git_ops
         config = GFRConfig()
 
         if not git_ops.is_git_repo():
@@ -57,13 +59,13 @@ def addasset(
 
         # Validate the target path for microservices
         if target_path != ".":
-            submodules = git_ops.get_submodules()
+            submodules = repo_ctx.get_submodule_paths_from_root()
             if target_path not in submodules:
                 console.print(f"[bold red]Error:[/bold red] '{target_name}' is not a valid submodule in this project.")
                 raise typer.Exit(code=1)
 
         # --- Create the asset file ---
-        final_destination_path = os.path.join(target_path, destination_file_name)
+        final_destination_path = os.path.join(repo_ctx.resolve_path(target_path), destination_file_name)
         
         if os.path.exists(final_destination_path):
             console.print(f"[bold red]Error:[/bold red] File '{final_destination_path}' already exists.")
@@ -76,7 +78,7 @@ def addasset(
         console.print(f"\n[bold green]✔ Success![/bold green] Asset '{destination_file_name}' created.")
         console.print(f"Remember to stage and commit the new file using 'ggg add' and 'ggg commit'.")
 
-        config.set_last_used_microservice(target_name)
+        config.set_last_used_microservice(target_path)
 
     except GitError as e:
         console.print(f"\n[bold red]Error:[/bold red] {e}")
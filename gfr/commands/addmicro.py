@@ -1,12 +1,12 @@
 import typer
-import questionary
 import os
 from rich.console import Console
-from rich.prompt import Prompt
 
-from gfr.utils.github.api import GitHubAPI
+from gfr.utils.github.api import get_github_api
 from gfr.utils.github.exceptions import GitHubError
-from gfr.utils.git.operations import GitOperations, GitError
+from gfr.utils.git.operations import GitError
+from gfr.utils.git.context import get_repo_context
+from gfr.utils.console import prompt_text, select
 
 app = typer.Typer()
 console = Console()
@@ -21,11 +21,12 @@ def main(
     """
     try:
         # --- Initialize APIs ---
-        git_ops = GitOperations()
-        github_api = GitHubAPI()
+        git_ops = get_repo_context().git_ops
+        github_api = get_github_api()
         
         # --- Pre-flight Checks ---
-        if not git_ops.is_git_repo():
+        # The new directory is added as a submodule relative to the current directory
+        if not git_ops.is_repo_root():
             console.print("[bold red]Error:[/bold red] This command must be run from the root of a Git repository.")
             raise typer.Exit(code=1)
             
@@ -33,28 +34,28 @@ def main(
             console.print(f"[bold red]Error:[/bold red] Directory '{micro_service_name}' not found.")
             raise typer.Exit(code=1)
 
-        if git_ops.is_git_repo(path=micro_service_name):
+        if git_ops.is_repo_root(path=micro_service_name):
             console.print(f"[bold red]Error:[/bold red] '{micro_service_name}' is already a Git repository.")
             raise typer.Exit(code=1)
 
         console.print(f"Authenticated as [bold green]{github_api.username}[/bold green] for organization [bold green]{github_api.org_name}[/bold green].")
         
         # --- Get Repository Details ---
-        repo_name = Prompt.ask("[bold cyan]Enter repository name[/bold cyan]", default=micro_service_name)
+        repo_name = prompt_text("[bold cyan]Enter repository name[/bold cyan]", default=micro_service_name)
         if not repo_name:
             console.print("[bold red]Repository name cannot be empty. Aborting.[/bold red]")
             raise typer.Exit()
 
-        description = Prompt.ask("[bold cyan]Enter repository description[/bold cyan]")
+        description = prompt_text("[bold cyan]Enter repository description[/bold cyan]")
 
-        is_private = questionary.select(
+        is_private = select(
             "Select repository visibility:",
             choices=[
                 {"name": "Public", "value": False},
                 {"name": "Private", "value": True}
             ],
             use_indicator=True
-        ).ask()
+        )
 
         if is_private is None:
             console.print("[bold red]No selection made. Aborting.[/bold red]")
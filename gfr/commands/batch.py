@@ -0,0 +1,150 @@
+# gfr/commands/batch.py
+import shlex
+import sys
+import click
+import typer
+from dataclasses import dataclass, field
+from rich.console import Console
+from rich.markup import escape
+from typing_extensions import Annotated
+
+from gfr.utils.console import scripted_answers
+from gfr.utils.settings import settings
+
+app = typer.Typer(name="batch", help="Run many ggg commands, read from a file or stdin, in one process.")
+console = Console()
+
+ANSWER_PREFIX = ">"
+
+@dataclass
+class BatchStep:
+    """One command line of a batch file and the answers for its prompts."""
+    line_number: int
+    args: list[str]
+    answers: list[str] = field(default_factory=list)
+
+    @property
+    def text(self) -> str:
+        return shlex.join(self.args)
+
+def parse_batch(lines) -> list[BatchStep]:
+    """
+    Parses a batch file.
+
+    Each line is a ggg command without the leading 'ggg' (it is accepted and
+    ignored if present). Blank lines and lines starting with '#' are skipped.
+    Lines starting with '>' are answers to the prompts of the command above
+    them, in the order the prompts appear; '>' alone answers with an empty line.
+
+    Raises:
+        ValueError: If a line can't be split or an answer has no command.
+    """
+    steps: list[BatchStep] = []
+    for line_number, line in enumerate(lines, start=1):
+        line = line.rstrip("\r\n")
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        if stripped.startswith(ANSWER_PREFIX):
+            if not steps:
+                raise ValueError(f"line {line_number}: answer given before any command.")
+            answer = stripped[len(ANSWER_PREFIX):]
+            steps[-1].answers.append(answer[1:] if answer.startswith(" ") else answer)
+            continue
+        try:
+            args = shlex.split(stripped)
+        except ValueError as e:
+            raise ValueError(f"line {line_number}: {e}.")
+        if args[0] == "ggg":
+            args = args[1:]
+        if not args:
+            continue
+        if args[0] == "batch":
+            raise ValueError(f"line {line_number}: 'batch' can't be nested.")
+        steps.append(BatchStep(line_number=line_number, args=args))
+    return steps
+
+def _run_step(root: click.Command, step: BatchStep) -> int:
+    """Runs one command through the root command group and returns its exit code."""
+    args = (["--verbose"] if settings.verbose else []) + step.args
+    with scripted_answers(step.answers) as remaining:
+        try:
+            exit_code = root.main(args, prog_name="ggg", standalone_mode=False)
+        except click.ClickException as e:
+            e.show()
+            return e.exit_code
+        except click.Abort:
+            console.print("\n[bold yellow]Operation cancelled.[/bold yellow]")
+            return 1
+        except Exception as e:
+            # Commands only catch the errors they expect; one step must not end the whole batch
+            console.print(f"[bold red]Error:[/bold red] line {step.line_number}: {escape(str(e) or type(e).__name__)}")
+            return 1
+        if remaining:
+            console.print(f"[yellow]Warning:[/yellow] {len(remaining)} answer(s) for line {step.line_number} were not used.")
+    # Commands that finish normally return their result (usually None) instead of an exit code
+    return exit_code if isinstance(exit_code, int) else 0
+
+@app.callback(invoke_without_command=True)
+def batch(
+    file: Annotated[str, typer.Argument(help="File with one command per line ('-' reads stdin).")] = "-",
+    keep_going: Annotated[bool, typer.Option("--keep-going", "-k", help="Continue with the next command when one fails.")] = False,
+):
+    """
+    Runs a list of ggg commands in a single process.
+
+    The commands share one Git helper, one GitHub session and one config
+    store, so scripts avoid paying the startup, import and authentication
+    cost for every command. Prompts are answered from '>' lines that follow
+    a command; a prompt with no answer left is treated as empty/cancelled.
+
+    Examples:
+    - ggg batch steps.txt           (Stop at the first failing command)
+    - ggg batch -k steps.txt        (Run every command and report failures)
+    - printf 'add . .\\ncommit . "msg"\\n' | ggg batch
+
+    A steps file could look like:
+
+        add svc1 .
+        commit svc1 "Add login page"
+        feature start svc1 login
+        > Adds the login page
+        > '''
+    """
+    try:
+        if file == "-":
+            lines = sys.stdin.readlines()
+        else:
+            with open(file, "r", encoding="utf-8") as f:
+                lines = f.readlines()
+        steps = parse_batch(lines)
+    except (OSError, ValueError) as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        raise typer.Exit(code=1)
+
+    if not steps:
+        console.print("[yellow]No commands to run.[/yellow]")
+        return
+
+    root = click.get_current_context().find_root().command
+    failed: list[BatchStep] = []
+    ran = 0
+    for step in steps:
+        console.rule(f"[bold cyan]ggg {escape(step.text)}[/bold cyan]", align="left")
+        ran += 1
+        if _run_step(root, step) != 0:
+            failed.append(step)
+            if not keep_going:
+                break
+
+    console.print()
+    skipped = len(steps) - ran
+    summary = f"Ran {ran} of {len(steps)} command(s): {ran - len(failed)} succeeded, {len(failed)} failed"
+    if skipped:
+        summary += f", {skipped} skipped"
+    if failed:
+        console.print(f"[bold red]{summary}.[/bold red]")
+        for step in failed:
+            console.print(f"  - line {step.line_number}: ggg {escape(step.text)}")
+        raise typer.Exit(code=1)
+    console.print(f"[bold green]✔ {summary}.[/bold green]")
@@ -3,7 +3,8 @@ import typer
 import re
 from rich.console import Console
 
-from gfr.utils.git.operations import GitOperations, GitError
+from gfr.utils.git.operations import GitError
+from gfr.utils.git.context import get_repo_context
 from gfr.utils.config import GFRConfig
 
 app = typer.Typer(name="commit", help="Commit staged changes for the root repo or a microservice.", no_args_is_help=True)
@@ -23,7 +24,8 @@ def commit(
     Commits staged changes with an optional issue number prefixed to the message.
     """
     try:
-        git_ops = GitOperations()
+        repo_ctx = get_repo_context()
+        git_ops = repo_ctx.git_ops
         config = GFRConfig()
 
         if not git_ops.is_git_repo():
@@ -46,13 +48,17 @@ def commit(
 
         # Validate the target path for microservices
         if target_path != ".":
-            submodules = git_ops.get_submodules()
+            submodules = repo_ctx.get_submodule_paths_from_root()
             if target_path not in submodules:
                 console.print(f"[bold red]Error:[/bold red] '{target_name}' is not a valid submodule in this project.")
                 raise typer.Exit(code=1)
 
+        # target_path is relative to the repository root; git runs in the resolved directories
+        repo_dir = repo_ctx.resolve_path(target_path)
+        root_dir = repo_ctx.resolve_path(".")
+
         # --- Format the commit message ---
-        branch_name = git_ops.get_current_branch(path=target_path)
+        branch_name = repo_ctx.get_current_branch(path=repo_dir)
         issue_number = _extract_issue_number(branch_name)
         
         if issue_number:
@@ -65,15 +71,15 @@ def commit(
 
         # --- Execute the commit operation ---
         console.print(f"Committing in [bold cyan]{target_name}[/bold cyan]...")
-        git_ops.commit(microservice_message, path=target_path)
+        git_ops.commit(microservice_message, path=repo_dir)
         console.print(f"✔ Successfully committed in [bold cyan]{target_name}[/bold cyan].")
 
         # If we committed in a submodule, we must also stage and commit that change in the root repo
         if target_path != ".":
             console.print(f"Staging and committing updated [bold cyan]{target_name}[/bold cyan] submodule in root project...")
-            git_ops.add([target_path], path=".")
+            git_ops.add([target_path], path=root_dir)
             # The root commit message does not get the issue number prefix
-            git_ops.commit(parent_message, path=".")
+            git_ops.commit(parent_message, path=root_dir)
             console.print(f"✔ Successfully committed submodule update in root project.")
 
         config.set_last_used_microservice(target_path)
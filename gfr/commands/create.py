@@ -1,10 +1,10 @@
 import typer
-import questionary
 from rich.console import Console
-from rich.prompt import Prompt
 
-from gfr.utils.github.api import GitHubAPI, GitHubError
-from gfr.utils.git.operations import GitOperations
+from gfr.utils.github.api import get_github_api, GitHubError
+from gfr.utils.git.context import get_repo_context
+from gfr.utils.console import prompt_text, select
+from gfr.utils.transfer_progress import status_progress
 
 # Create a Typer app for the 'create' command
 app = typer.Typer()
@@ -17,31 +17,31 @@ def main():
     """
     try:
         # Initialize the GitHub API client
-        github_api = GitHubAPI()
-        git_operations = GitOperations()
+        github_api = get_github_api()
+        git_operations = get_repo_context().git_ops
         console.print(f"Authenticated as [bold green]{github_api.username}[/bold green] for organization [bold green]{github_api.org_name}[/bold green].")
 
         # --- Get Repository Name ---
-        repo_name = Prompt.ask("[bold cyan]Enter repository name[/bold cyan]")
+        repo_name = prompt_text("[bold cyan]Enter repository name[/bold cyan]")
 
         # --- Get Repository Description ---
-        description = Prompt.ask("\n[bold cyan]Enter repository description[/bold cyan]")
+        description = prompt_text("\n[bold cyan]Enter repository description[/bold cyan]")
 
         # --- Get Repository Visibility ---
-        is_private = questionary.select(
+        is_private = select(
             "Select repository visibility:",
             choices=[
                 {"name": "Public", "value": False},
                 {"name": "Private", "value": True},
             ],
             use_indicator=True
-        ).ask()        
+        )        
         
         if is_private is None:
             console.print("[bold red]No selection made. Aborting.[/bold red]")
             raise typer.Exit()
 
-        readmefile = Prompt.ask("Do you want to add a readme file?", choices=['y', 'n'], default='n').lower() == 'y'
+        readmefile = prompt_text("Do you want to add a readme file?", choices=['y', 'n'], default='n').lower() == 'y'
 
         # --- Create Repository ---
         with console.status("[bold yellow]Creating repository...[/bold yellow]", spinner="dots"):
@@ -51,8 +51,9 @@ def main():
         console.print(f"  [link={repo.html_url}]{repo.html_url}[/link]")
         
         
-        with console.status("[bold yellow]Cloning repository...[/bold yellow]", spinner="dots"):
-            repo_path = git_operations.clone(repo.html_url, repo_name)
+        with console.status("[bold yellow]Cloning repository...[/bold yellow]", spinner="dots") as status:
+            progress = status_progress(status, "[bold yellow]Cloning repository...[/bold yellow]")
+            repo_path = git_operations.clone(repo.html_url, repo_name, progress=progress)
             
         console.print(f"\n[bold green]✔ Repository '{repo.full_name}' cloned successfully![/bold green]")
 
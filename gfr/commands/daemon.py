@@ -0,0 +1,107 @@
+# gfr/commands/daemon.py
+import os
+import subprocess
+import sys
+import time
+import typer
+from rich.console import Console
+from typing_extensions import Annotated
+
+from gfr.client import daemon_supported, get_socket_path, request
+from gfr.utils.cache import get_cache_dir
+
+app = typer.Typer(name="daemon", help="Start, stop or check the background ggg daemon.", no_args_is_help=True)
+console = Console()
+
+# How long 'start' waits for a new daemon to accept connections
+STARTUP_TIMEOUT = 10.0
+
+def _start(foreground: bool):
+    status = request({"command": "status"})
+    if status is not None:
+        console.print(f"[yellow]The daemon is already running (pid {status.get('pid')}).[/yellow]")
+        return
+
+    if foreground:
+        from gfr.daemon import serve
+        serve()
+        return
+
+    log_path = os.path.join(get_cache_dir(), "daemon.log")
+    with open(log_path, "a", encoding="utf-8") as log:
+        subprocess.Popen(
+            [sys.executable, "-m", "gfr.daemon", "--socket", get_socket_path()],
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=log,
+            start_new_session=True,
+        )
+
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    with console.status("Starting the daemon..."):
+        while time.monotonic() < deadline:
+            status = request({"command": "status"})
+            if status is not None:
+                console.print(f"✔ Daemon started (pid {status.get('pid')}). Log: {log_path}")
+                return
+            time.sleep(0.1)
+    console.print(f"[bold red]Error:[/bold red] The daemon did not start. See {log_path} for details.")
+    raise typer.Exit(code=1)
+
+def _stop():
+    if request({"command": "stop"}) is None:
+        console.print("[yellow]The daemon is not running.[/yellow]")
+        return
+    console.print("✔ Daemon stopped.")
+
+def _status():
+    status = request({"command": "status"})
+    if status is None:
+        console.print("The daemon is [bold]not running[/bold]; commands run in their own process.")
+        return
+    if "error" in status:
+        console.print(f"[bold red]Error:[/bold red] {status['error']}")
+        raise typer.Exit(code=1)
+    console.print(f"The daemon is [bold green]running[/bold green] (pid {status['pid']}).")
+    console.print(f"  Socket:         {status['socket']}")
+    console.print(f"  Uptime:         {status['uptime']}s")
+    console.print(f"  Commands run:   {status['requests']}")
+    console.print(f"  Cached lookups: {status['cached_entries']}")
+
+@app.callback(invoke_without_command=True)
+def daemon(
+    action: Annotated[str, typer.Argument(help="The action to perform: 'start', 'stop' or 'status'.")],
+    foreground: Annotated[bool, typer.Option("--foreground", "-f", help="With 'start': run in this terminal instead of in the background.")] = False,
+):
+    """
+    Manages a background process that keeps ggg warm between commands.
+
+    While the daemon runs, every 'ggg' command is handed to it and runs in a
+    process that already has its modules imported, its GitHub client
+    authenticated and the project's submodules, branches and tags looked up
+    (re-checked against .gitmodules and HEAD files before each command).
+    If it isn't running, commands simply run on their own. Set GFR_NO_DAEMON=1
+    to bypass a running daemon.
+
+    Commands run by the daemon can't prompt for git credentials on the
+    terminal; use a credential helper or SSH keys.
+
+    Examples:
+    - ggg daemon start
+    - ggg daemon status
+    - ggg daemon stop
+    """
+    if not daemon_supported():
+        console.print("[bold red]Error:[/bold red] The daemon is not supported on this platform.")
+        raise typer.Exit(code=1)
+
+    action = action.lower()
+    if action == "start":
+        _start(foreground)
+    elif action == "stop":
+        _stop()
+    elif action == "status":
+        _status()
+    else:
+        console.print(f"[bold red]Error:[/bold red] Invalid action '{action}'. Please use 'start', 'stop' or 'status'.")
+        raise typer.Exit(code=1)
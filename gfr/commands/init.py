@@ -1,13 +1,12 @@
 import typer
-import questionary
 import os
 from rich.console import Console
-from rich.prompt import Prompt
 
-from gfr.utils.console import get_multiline_input
-from gfr.utils.github.api import GitHubAPI
+from gfr.utils.console import prompt_text, select
+from gfr.utils.github.api import get_github_api
 from gfr.utils.github.exceptions import GitHubError
-from gfr.utils.git.operations import GitOperations, GitError
+from gfr.utils.git.operations import GitError
+from gfr.utils.git.context import get_repo_context
 
 app = typer.Typer()
 console = Console()
@@ -20,11 +19,11 @@ def main():
     """
     try:
         # --- Initialize APIs ---
-        git_ops = GitOperations()
-        github_api = GitHubAPI()
+        git_ops = get_repo_context().git_ops
+        github_api = get_github_api()
 
         # --- Pre-flight Check ---
-        if git_ops.is_git_repo():
+        if git_ops.is_repo_root():
             console.print("[bold red]Error:[/bold red] This directory is already a Git repository.")
             raise typer.Exit(code=1)
 
@@ -33,21 +32,21 @@ def main():
         # --- Get Repository Details ---
         # Default repo name to the current directory's name
         default_repo_name = os.path.basename(os.getcwd())
-        repo_name = Prompt.ask("[bold cyan]Enter repository name[/bold cyan]", default=default_repo_name)
+        repo_name = prompt_text("[bold cyan]Enter repository name[/bold cyan]", default=default_repo_name)
         if not repo_name:
             console.print("[bold red]Repository name cannot be empty. Aborting.[/bold red]")
             raise typer.Exit()
 
-        description = Prompt.ask("[bold cyan]Enter repository description[/bold cyan]")
+        description = prompt_text("[bold cyan]Enter repository description[/bold cyan]")
 
-        is_private = questionary.select(
+        is_private = select(
             "Select repository visibility:",
             choices=[
                 {"name": "Public", "value": False},
                 {"name": "Private", "value": True},
             ],
             use_indicator=True
-        ).ask()
+        )
 
         if is_private is None:
             console.print("[bold red]No selection made. Aborting.[/bold red]")
@@ -2,7 +2,9 @@ import typer
 from rich.console import Console
 from rich.table import Table
 
-from gfr.utils.git.operations import GitOperations, GitError
+from gfr.utils.git.operations import GitError
+from gfr.utils.git.context import get_repo_context
+from gfr.utils.git.submodules import resolve_submodule_url
 from gfr.utils.command_helpers import format_git_url_to_http
 
 app = typer.Typer(name="link", help="Display GitHub links for the parent repo and all submodules.")
@@ -14,27 +16,31 @@ def link():
     Displays the GitHub links for the main project and all its submodules.
     """
     try:
-        git_ops = GitOperations()
+        repo_ctx = get_repo_context()
 
-        if not git_ops.is_git_repo():
+        if not repo_ctx.git_ops.is_git_repo():
             console.print("[bold red]Error:[/bold red] This command must be run from within a Git repository.")
             raise typer.Exit(code=1)
 
-        # Get all repositories (parent + submodules)
-        all_repos = ["."] + git_ops.get_submodules()
-
         table = Table(title="Project GitHub Links", show_header=True, header_style="bold magenta")
         table.add_column("Repository", style="cyan", no_wrap=True)
         table.add_column("GitHub Link", style="green")
 
-        console.print("Fetching remote URLs...")
-        for repo_path in all_repos:
-            repo_name = "root" if repo_path == "." else repo_path
-            try:
-                remote_url = git_ops.get_remote_url(path=repo_path)
+        # Remote URLs come from .git/config and .gitmodules; no git process is started
+        try:
+            root_url = repo_ctx.git_ops.get_remote_url(path=repo_ctx.get_root())
+        except GitError:
+            root_url = None
+        all_repos = [("root", root_url)] + [
+            (submodule.path, resolve_submodule_url(submodule.url, root_url) if submodule.url else None)
+            for submodule in repo_ctx.get_submodule_index(recursive=True)
+        ]
+
+        for repo_name, remote_url in all_repos:
+            if remote_url:
                 http_url = format_git_url_to_http(remote_url)
                 table.add_row(repo_name, f"[link={http_url}]{http_url}[/link]")
-            except GitError:
+            else:
                 table.add_row(repo_name, "[dim]No remote found[/dim]")
 
         console.print(table)
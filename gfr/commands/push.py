@@ -1,36 +1,98 @@
 # gfr/commands/push.py
+import time
 import typer
+from dataclasses import dataclass
 from rich.console import Console
+from rich.markup import escape
+from rich.table import Table
+from typing_extensions import Annotated
 
 from gfr.utils.git.operations import GitOperations, GitError
+from gfr.utils.git.context import get_repo_context
+from gfr.utils.parallel import run_ordered, DEFAULT_JOBS
+from gfr.utils.git.progress import ProgressCallback
+from gfr.utils.transfer_progress import TransferProgress
 
 app = typer.Typer(name="push", help="Push all branches for the parent repo and all microservices.")
 console = Console()
 
+RESULT_STYLES = {
+    "success": "[bold green]success[/bold green]",
+    "rejected": "[bold yellow]rejected[/bold yellow]",
+    "failed": "[bold red]failed[/bold red]",
+}
+
+@dataclass
+class PushResult:
+    """The outcome of pushing a single repository."""
+    result: str
+    duration: float
+    error: str = ""
+
+def _push_repo(git_ops: GitOperations, repo_path: str, progress: ProgressCallback | None = None) -> PushResult:
+    """Pushes all branches of one repository and classifies the outcome."""
+    start = time.perf_counter()
+    try:
+        git_ops.push_all(path=repo_path, progress=progress)
+        return PushResult("success", time.perf_counter() - start)
+    except GitError as e:
+        result = "rejected" if "[rejected]" in str(e) else "failed"
+        return PushResult(result, time.perf_counter() - start, str(e))
+
 @app.callback(invoke_without_command=True)
-def push():
+def push(
+    jobs: Annotated[int, typer.Option("--jobs", "-j", min=1, help="Number of repositories to push concurrently.")] = DEFAULT_JOBS
+):
     """
     Pushes all branches (--all) for the main project and every submodule.
+    Repositories are pushed concurrently and summarized at the end.
     """
     try:
-        git_ops = GitOperations()
+        repo_ctx = get_repo_context()
+        git_ops = repo_ctx.git_ops
 
         if not git_ops.is_git_repo():
             console.print("[bold red]Error:[/bold red] This command must be run from within a Git repository.")
             raise typer.Exit(code=1)
 
         # --- Get all repositories (parent + submodules) ---
-        submodules = git_ops.get_submodules()
+        submodules = repo_ctx.get_submodule_paths_from_root()
         all_repos = ["."] + submodules  # "." represents the parent repo
+        # Repository paths are relative to the root, which need not be the current directory
+        repo_dirs = {path: repo_ctx.resolve_path(path) for path in all_repos}
 
         console.print(f"Found [bold yellow]{len(submodules)}[/bold yellow] submodule(s).")
-        
+        console.print(f"Pushing all branches for [bold yellow]{len(all_repos)}[/bold yellow] repositories...\n")
+
         # --- Push all branches for each repository ---
-        for repo_path in all_repos:
-            repo_name = "root project" if repo_path == "." else repo_path
-            console.print(f"\nPushing all branches for [bold cyan]{repo_name}[/bold cyan]...")
-            git_ops.push_all(path=repo_path)
-            console.print(f"✔ Successfully pushed all branches for [bold cyan]{repo_name}[/bold cyan].")
+        table = Table(title="Push Summary", show_header=True, header_style="bold magenta")
+        table.add_column("Repository", style="cyan", no_wrap=True)
+        table.add_column("Result")
+        table.add_column("Time", justify="right")
+
+        failures = 0
+        # One live progress bar per repository while pushes are running
+        with TransferProgress(console) as bars:
+            callbacks = {path: bars.track("root project" if path == "." else path) for path in all_repos}
+            for repo_path, outcome, error in run_ordered(lambda path: _push_repo(git_ops, repo_dirs[path], callbacks[path]), all_repos, jobs):
+                repo_name = "root project" if repo_path == "." else repo_path
+                bars.finish(repo_name)
+                if error is not None:
+                    # Anything but a GitError escaped _push_repo; report it like any other failure
+                    outcome = PushResult("failed", 0.0, str(error) or type(error).__name__)
+                if outcome.result == "success":
+                    console.print(f"✔ Successfully pushed all branches for [bold cyan]{repo_name}[/bold cyan].")
+                else:
+                    failures += 1
+                    console.print(f"✘ Push {outcome.result} for [bold cyan]{repo_name}[/bold cyan]: {escape(outcome.error)}")
+                table.add_row(repo_name, RESULT_STYLES[outcome.result], f"{outcome.duration:.2f}s")
+
+        console.print()
+        console.print(table)
+
+        if failures:
+            console.print(f"\n[bold red]Error:[/bold red] {failures} of {len(all_repos)} repositories failed to push.")
+            raise typer.Exit(code=1)
 
         console.print("\n[bold green]✔ All repositories have been pushed successfully![/bold green]")
 
@@ -1,61 +1,75 @@
 import typer
-import questionary
 import os
-import re
 from datetime import datetime
 from rich.console import Console
+from rich.markup import escape
 
-from gfr.utils.git.operations import GitOperations, GitError
-from gfr.utils.github.api import GitHubAPI, GitHubError
+from gfr.utils.git.operations import GitError, GitOperations
+from gfr.utils.git.release_notes import ReleaseNotes, build_release_notes
+from gfr.utils.git.tags import parse_version
+from gfr.utils.git.context import RepoContext, get_repo_context
+from gfr.utils.github.api import GitHubAPI, get_github_api, GitHubError
 from gfr.utils.config import GFRConfig
 from gfr.utils.command_helpers import validate_and_get_repo_details, format_git_url_to_http
-from gfr.utils.console import get_multiline_input
+from gfr.utils.changelog import insert_changelog_entry
+from gfr.utils.console import get_multiline_input, read_line, select
+from gfr.utils.scheduler import TaskScheduler
 from gfr.assets.changelog import CHANGELOG_TEMPLATE
 
 app = typer.Typer(name="release", help="Start or finish a release.", no_args_is_help=True)
 console = Console()
 
 def _get_next_version(current_version: str, release_type: str) -> str:
-    """Calculates the next semantic version number."""
-    if not current_version:
+    """Calculates the next semantic version number (prerelease and non-'v' tags included)."""
+    version = parse_version(current_version) if current_version else None
+    if version is None:
         return "0.1.0" if release_type == "minor" else "1.0.0"
+    return str(version.bump(release_type))
 
-    major, minor, patch = map(int, current_version.lstrip('v').split('.'))
-    if release_type == "major":
-        major += 1
-        minor = 0
-        patch = 0
-    else: # minor
-        minor += 1
-        patch = 0
-    return f"{major}.{minor}.{patch}"
-
-def _prompt_for_changes(category: str) -> list[str]:
-    """Prompts the user for a list of changes for a specific category."""
-    console.print(f"\n[bold cyan]Enter '{category}' items (one per line, empty line to finish):[/bold cyan]")
-    items = []
+def _prompt_for_changes(category: str, suggestions: list[str] = ()) -> list[str]:
+    """
+    Prompts the user for a list of changes for a specific category.
+    Suggested items (from the git history) are kept unless the user enters '-'.
+    """
+    items = list(suggestions)
+    if items:
+        console.print(f"\n[bold cyan]Suggested '{category}' items from the git history:[/bold cyan]")
+        for item in items:
+            console.print(f"  - {escape(item)}")
+        console.print("[bold cyan]Enter more items (one per line, empty line to finish), or '-' to drop the suggestions:[/bold cyan]")
+    else:
+        console.print(f"\n[bold cyan]Enter '{category}' items (one per line, empty line to finish):[/bold cyan]")
     while True:
-        item = input()
+        item = read_line()
         if not item:
             break
+        if item == "-":
+            items.clear()
+            continue
         items.append(item)
     return items
 
-def _start_release(git_ops: GitOperations, config: GFRConfig, microservice_name: str):
+def _collect_release_notes(git_ops: GitOperations, rev_range: str, path: str) -> ReleaseNotes:
+    """Builds release notes for a revision range from the local git history."""
+    return build_release_notes(git_ops.iter_log(rev_range, path=path))
+
+def _start_release(repo_ctx: RepoContext, config: GFRConfig, microservice_name: str):
     """Handles the logic for starting a new release."""
-    target_path, target_name, repo_name_for_github = validate_and_get_repo_details(git_ops, config, microservice_name)
+    git_ops = repo_ctx.git_ops
+    target_path, target_name, repo_name_for_github = validate_and_get_repo_details(repo_ctx, config, microservice_name)
+    repo_dir = repo_ctx.resolve_path(target_path)
 
     console.print("[bold yellow]Starting release process...[/bold yellow]")
     # --- Get latest version from Git tags ---
     console.print("[bold yellow]Fetching latest tag...[/bold yellow]")
-    current_version = git_ops.get_latest_tag(path=target_path)
+    current_version = repo_ctx.get_tag_index(path=repo_dir).latest()
     console.print(f"Current version from tag: [bold yellow]{current_version or '0.0.0'}[/bold yellow]")
 
     # --- Ask for release type ---
-    release_type = questionary.select(
+    release_type = select(
         "What type of release is this?",
         choices=["minor", "major"]
-    ).ask()
+    )
     if not release_type:
         raise typer.Exit()
 
@@ -67,20 +81,21 @@ def _start_release(git_ops: GitOperations, config: GFRConfig, microservice_name:
     console.print(f"[bold yellow]Creating branch '{branch_name}'...[/bold yellow]")
     
     
-    git_ops.create_branch(branch_name, path=target_path)
-    git_ops.switch_branch(branch_name, path=target_path)
+    git_ops.create_branch(branch_name, path=repo_dir)
+    git_ops.switch_branch(branch_name, path=repo_dir)
     console.print(f"✔ Switched to new branch [bold yellow]{branch_name}[/bold yellow].")
 
     # --- Gather Changelog Info ---
-    added = _prompt_for_changes("Added")
-    changed = _prompt_for_changes("Changed")
-    fixed = _prompt_for_changes("Fixed")
+    notes = _collect_release_notes(git_ops, f"{current_version}..HEAD" if current_version else "HEAD", repo_dir)
+    added = _prompt_for_changes("Added", notes.items("Added"))
+    changed = _prompt_for_changes("Changed", notes.items("Changed"))
+    fixed = _prompt_for_changes("Fixed", notes.items("Fixed"))
 
     # --- Update CHANGELOG.md ---
     console.print("[bold yellow]Updating CHANGELOG.md...[/bold yellow]")
-    changelog_path = os.path.join(target_path, "CHANGELOG.md")
+    changelog_path = os.path.join(repo_dir, "CHANGELOG.md")
     
-    remote_url = git_ops.get_remote_url(path=target_path)
+    remote_url = git_ops.get_remote_url(path=repo_dir)
     http_url = format_git_url_to_http(remote_url)
     
     release_date = datetime.now().strftime("%Y-%m-%d")
@@ -94,14 +109,7 @@ def _start_release(git_ops: GitOperations, config: GFRConfig, microservice_name:
     if fixed:
         new_entry += "### Fixed\n" + "\n".join(f"- {item}" for item in fixed) + "\n"
 
-    if os.path.exists(changelog_path):
-        with open(changelog_path, 'r+') as f:
-            content = f.read()
-            f.seek(0, 0)
-            f.write(re.sub(r'(# Changelog\n\n.*?\n\n)', fr'\1{new_entry}\n', content, 1, re.DOTALL))
-    else:
-        with open(changelog_path, 'w') as f:
-            f.write(CHANGELOG_TEMPLATE.strip() + "\n\n" + new_entry)
+    insert_changelog_entry(changelog_path, new_entry, template=CHANGELOG_TEMPLATE)
     
     console.print("✔ Updated CHANGELOG.md.")
 
@@ -109,65 +117,115 @@ def _start_release(git_ops: GitOperations, config: GFRConfig, microservice_name:
     console.print("Review CHANGELOG.md, then run 'ggg add' and 'ggg commit'.")
 
 
-def _finish_release(git_ops: GitOperations, github_api: GitHubAPI, config: GFRConfig, microservice_name: str):
-    """Handles the logic for finishing a release."""
-    target_path, target_name, repo_name_for_github = validate_and_get_repo_details(git_ops, config, microservice_name)
+def _finish_release(repo_ctx: RepoContext, github_api: GitHubAPI, config: GFRConfig, microservice_name: str):
+    """
+    Handles the logic for finishing a release.
+
+    The steps form a dependency graph run by a TaskScheduler, so independent
+    work overlaps: the repository and label lookups run while the branch is
+    pushed, and the PRs into develop and main are created and merged in
+    parallel. Local git steps stay strictly ordered in a single chain
+    (main is pulled only after its PR is merged, then tagged, then the tags
+    are pushed), and the GitHub Release is created once the tag is pushed.
+    """
+    git_ops = repo_ctx.git_ops
+    target_path, target_name, repo_name_for_github = validate_and_get_repo_details(repo_ctx, config, microservice_name)
+    repo_dir = repo_ctx.resolve_path(target_path)
     
     console.print("[bold yellow]Finishing release process...[/bold yellow]")
-    current_branch = git_ops.get_current_branch(path=target_path)
+    current_branch = repo_ctx.get_current_branch(path=repo_dir)
     if not current_branch.startswith("release/"):
         console.print(f"[bold red]Error:[/bold red] You must be on a release branch to finish a release.")
         raise typer.Exit(code=1)
     
     version = current_branch.split('/')[-1]
     tag_name = f"v{version}"
-    repo = github_api.repos.get(repo_name_for_github)
-    release_label = github_api.repos.get_or_create_label(repo, "release", "0FB8B2", "Indicates a release pull request")
 
-    # --- Push, PR, and Merge ---
-    console.print(f"[bold yellow]Pushing '{current_branch}' to remote...[/bold yellow]")
-    git_ops.push_branch(current_branch, set_upstream=True, path=target_path)
+    # Asked up front, so nothing interactive happens while steps run in parallel
+    console.print("\n[bold cyan]Enter any additional notes for the GitHub Release:[/bold cyan]")
+    extra_notes = get_multiline_input()
+
+    # Values produced by earlier steps, read by the steps that depend on them
+    outputs = {}
+
+    def _push_branch():
+        git_ops.push_branch(current_branch, set_upstream=True, path=repo_dir)
+        console.print(f"✔ Pushed [bold yellow]{current_branch}[/bold yellow] to remote.")
+
+    def _get_label():
+        return github_api.repos.get_or_create_label(outputs["repo"], "release", "0FB8B2", "Indicates a release pull request")
 
-    for base_branch in ["develop", "main"]:
-        console.print(f"[bold yellow]Creating and merging PR to '{base_branch}'...[/bold yellow]")
-        pr = github_api.prs.create(repo, f"Release {tag_name}", f"Release branch for version {version}", head=current_branch, base=base_branch, labels=[release_label])
-        github_api.prs.merge(pr)
+    def _merge_into(base_branch: str):
+        github_api.prs.create_and_merge(
+            repo_name_for_github, f"Release {tag_name}", f"Release branch for version {version}",
+            head=current_branch, base=base_branch, labels=[outputs["label"]],
+        )
         console.print(f"✔ Merged PR to [bold yellow]{base_branch}[/bold yellow].")
 
-    # --- Tagging and GitHub Release ---
-    console.print("[bold yellow]Tagging new release...[/bold yellow]")
-    git_ops.switch_branch("main", path=target_path)
-    git_ops.pull("main", path=target_path)
-    git_ops.create_tag(tag_name, f"Release {version}", path=target_path)
-    git_ops.push_tags(path=target_path)
-    console.print(f"✔ Created and pushed tag [bold yellow]{tag_name}[/bold yellow].")
-
-    console.print("[bold yellow]Generating release notes...[/bold yellow]")
-    previous_tag = git_ops.get_latest_tag(path=target_path).splitlines()[1] if len(git_ops.get_latest_tag(path=target_path).splitlines()) > 1 else None
-    commit_log = github_api.repos.compare_commits(repo, previous_tag, tag_name) if previous_tag else ["- Initial Release"]
-    
-    console.print("\n[bold cyan]Enter any additional notes for the GitHub Release:[/bold cyan]")
-    extra_notes = get_multiline_input()
-    commits_link = f"{repo.html_url}/commits/{tag_name}"
-    release_notes = (
-        f"## Changelog\n"
-        f"See the [CHANGELOG.md]({repo.html_url}/blob/main/CHANGELOG.md) for detailed changes.\n\n"
-        f"## Commits\n"
-        f"[View the full list of commits for this release]({commits_link})\n\n"
-        f"## Notes\n{extra_notes}"
-    )
-    
-    console.print("[bold yellow]Creating GitHub Release...[/bold yellow]")
-    github_api.repos.create_release(repo, tag_name, f"Release {version}", release_notes)
-    console.print("✔ Created GitHub Release.")
-
-    # --- Cleanup ---
-    console.print("[bold yellow]Cleaning up branches...[/bold yellow]")
-    git_ops.delete_remote_branch(current_branch, path=target_path)
-    git_ops.delete_local_branch(current_branch, path=target_path)
-    git_ops.switch_branch("develop", path=target_path)
-    git_ops.pull("develop", path=target_path)
-    console.print(f"✔ Cleaned up branches and switched to [bold yellow]develop[/bold yellow].")
+    def _tag():
+        git_ops.create_tag(tag_name, f"Release {version}", path=repo_dir)
+        git_ops.push_tags(path=repo_dir)
+        console.print(f"✔ Created and pushed tag [bold yellow]{tag_name}[/bold yellow].")
+
+    def _notes():
+        # create_tag invalidated the index, so this sees the new tag
+        previous_tag = repo_ctx.get_tag_index(path=repo_dir).before(tag_name)
+        return _collect_release_notes(git_ops, f"{previous_tag}..{tag_name}" if previous_tag else tag_name, repo_dir)
+
+    def _create_release():
+        repo = outputs["repo"]
+        commits_link = f"{repo.html_url}/commits/{tag_name}"
+        release_notes = (
+            f"## Changelog\n"
+            f"See the [CHANGELOG.md]({repo.html_url}/blob/main/CHANGELOG.md) for detailed changes.\n\n"
+            f"## Commits\n"
+            f"[View the full list of commits for this release]({commits_link})\n\n"
+        )
+        if not outputs["notes"].is_empty:
+            release_notes += f"## What's Changed\n{outputs['notes'].to_markdown()}\n\n"
+        release_notes += f"## Notes\n{extra_notes}"
+        github_api.repos.create_release(repo, tag_name, f"Release {version}", release_notes)
+        console.print("✔ Created GitHub Release.")
+
+    def _cleanup():
+        git_ops.delete_remote_branch(current_branch, path=repo_dir)
+        git_ops.delete_local_branch(current_branch, path=repo_dir)
+        git_ops.switch_branch("develop", path=repo_dir)
+        git_ops.pull("develop", path=repo_dir)
+        console.print(f"✔ Cleaned up branches and switched to [bold yellow]develop[/bold yellow].")
+
+    def _step(name: str, func):
+        def run():
+            outputs[name] = func()
+        return run
+
+    scheduler = TaskScheduler()
+    # GitHub lookups overlap with the push
+    scheduler.add("push", _step("push", _push_branch))
+    scheduler.add("repo", _step("repo", lambda: github_api.repos.get(repo_name_for_github)))
+    scheduler.add("label", _step("label", _get_label), depends_on=["repo"])
+    # The two PRs are independent of each other
+    scheduler.add("merge:develop", _step("merge:develop", lambda: _merge_into("develop")), depends_on=["push", "label"])
+    scheduler.add("merge:main", _step("merge:main", lambda: _merge_into("main")), depends_on=["push", "label"])
+    # Local git steps form one chain, so they never race on the same repository
+    scheduler.add("checkout:main", _step("checkout:main", lambda: git_ops.switch_branch("main", path=repo_dir)), depends_on=["push"])
+    scheduler.add("pull:main", _step("pull:main", lambda: git_ops.pull("main", path=repo_dir)), depends_on=["checkout:main", "merge:main"])
+    scheduler.add("tag", _step("tag", _tag), depends_on=["pull:main"])
+    scheduler.add("notes", _step("notes", _notes), depends_on=["tag"])
+    scheduler.add("release", _step("release", _create_release), depends_on=["notes", "repo"])
+    scheduler.add("cleanup", _step("cleanup", _cleanup), depends_on=["tag", "merge:develop"])
+
+    with console.status("[bold yellow]Publishing release...[/bold yellow]", spinner="dots"):
+        results = scheduler.run()
+
+    problems = [(name, result) for name, result in results.items() if result.state != "done"]
+    for name, result in problems:
+        if result.state == "failed":
+            console.print(f"[bold red]✘ Step '{name}' failed:[/bold red] {escape(str(result.error))}")
+        else:
+            console.print(f"[yellow]- Step '{name}' skipped because a step it depends on failed.[/yellow]")
+    if problems:
+        raise typer.Exit(code=1)
 
     console.print(f"\n[bold green]✔ Success![/bold green] Release {version} has been published.")
 
@@ -181,14 +239,15 @@ def release(
     Manages the release workflow by starting or finishing a release.
     """
     try:
-        git_ops = GitOperations()
-        github_api = GitHubAPI()
+        repo_ctx = get_repo_context()
         config = GFRConfig()
 
         if action.lower() == "start":
-            _start_release(git_ops, config, microservice_name)
+            _start_release(repo_ctx, config, microservice_name)
         elif action.lower() == "finish":
-            _finish_release(git_ops, github_api, config, microservice_name) # This will be added later
+            # Only finishing a release talks to GitHub
+            github_api = get_github_api()
+            _finish_release(repo_ctx, github_api, config, microservice_name)
         else:
             console.print(f"[bold red]Error:[/bold red] Invalid action '{action}'. Please use 'start' or 'finish'.")
             raise typer.Exit(code=1)
@@ -1,53 +1,72 @@
 # gfr/commands/status.py
 import typer
 from rich.console import Console
+from rich.markup import escape
 from rich.panel import Panel
+from typing_extensions import Annotated
 
-from gfr.utils.git.operations import GitOperations, GitError
+from gfr.utils.git.operations import GitError
+from gfr.utils.git.context import get_repo_context
+from gfr.utils.git.repo_status import RepoStatus
+from gfr.utils.parallel import DEFAULT_JOBS
 
 app = typer.Typer(name="status", help="Show the working tree status for all repositories.")
 console = Console()
 
+def _print_repo_status(repo_name: str, repo_status: RepoStatus):
+    """Prints the branch line and file lists for a single repository."""
+    tracking = ""
+    if repo_status.ahead or repo_status.behind:
+        tracking = f" [dim](ahead {repo_status.ahead}, behind {repo_status.behind})[/dim]"
+    console.print(f'[bold blue]{repo_name}[/bold blue]: [yellow]{repo_status.branch}[/yellow]{tracking}')
+
+    renamed_from = {new: original for original, new in repo_status.renamed}
+    if repo_status.staged:
+        console.print("  Staged changes:")
+        for file in repo_status.staged:
+            if file in renamed_from:
+                console.print(f"  - [bold green]{escape(renamed_from[file])} -> {escape(file)}[/bold green]")
+            else:
+                console.print(f"  - [bold green]{escape(file)}[/bold green]")
+    if repo_status.unstaged:
+        console.print("  Unstaged changes:")
+        for file in repo_status.unstaged:
+            console.print(f"  - [bold red]{escape(file)}[/bold red]")
+    if repo_status.untracked:
+        console.print("  Untracked changes:")
+        for file in repo_status.untracked:
+            console.print(f"  - [red]{escape(file)}[/red]")
+
 @app.callback(invoke_without_command=True)
-def status():
+def status(
+    jobs: Annotated[int, typer.Option("--jobs", "-j", min=1, help="Number of repositories to inspect concurrently (2 or less: one bulk pass over all submodules).")] = DEFAULT_JOBS
+):
     """
-    Displays the detailed status of the main project and all its submodules.
+    Displays the detailed status of the main project and all its submodules
+    (including nested ones), inspecting up to --jobs repositories at once.
     """
     try:
-        git_ops = GitOperations()
+        repo_ctx = get_repo_context()
+        git_ops = repo_ctx.git_ops
 
         if not git_ops.is_git_repo():
             console.print("[bold red]Error:[/bold red] This command must be run from within a Git repository.")
             raise typer.Exit(code=1)
 
-        # Get all repositories (parent + submodules)
-        all_repos = ["."] + git_ops.get_submodules()
+        # Get the status of all repositories (parent + submodules), named relative to the root
+        all_statuses = git_ops.get_tree_status(path=repo_ctx.get_root(), jobs=jobs)
 
         console.print("\n[bold]Project Status Overview[/bold]")
 
-        for i, repo_path in enumerate(all_repos):
-            repo_name = "root" if repo_path == "." else repo_path
-            
-            try:
-                repo_status = git_ops.get_status(path=repo_path)
-            except GitError as e:
-                console.print(Panel(f"[bold red]Error checking status:[/bold red] {e}", title=f"[bold cyan]{repo_name}", border_style="red"))
+        for repo_status in all_statuses:
+            repo_name = "root" if repo_status.path == "." else repo_status.path
+
+            if repo_status.error:
+                console.print(Panel(f"[bold red]Error checking status:[/bold red] {repo_status.error}", title=f"[bold cyan]{repo_name}", border_style="red"))
                 continue
 
-            console.print(f'[bold blue]{repo_name}[/bold blue]: [yellow]{repo_status.branch}[/yellow]')
-            if repo_status.staged:
-                console.print("  Staged changes:")
-                for file in repo_status.staged:
-                    console.print(f"  - [bold green]{file}[/bold green]")
-            if repo_status.unstaged:
-                console.print("  Unstaged changes:")
-                for file in repo_status.unstaged:
-                    console.print(f"  - [bold red]{file}[/bold red]")
-            if repo_status.untracked:
-                console.print("  Untracked changes:")
-                for file in repo_status.untracked:
-                    console.print(f"  - [red]{file}[/red]")
-                    
+            _print_repo_status(repo_name, repo_status)
+
     except GitError as e:
         console.print(f"\n[bold red]Error:[/bold red] {e}")
         raise typer.Exit(code=1)
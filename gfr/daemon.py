@@ -0,0 +1,362 @@
+# gfr/daemon.py
+"""
+The resident 'ggg daemon' process.
+
+The daemon imports every command once, keeps an authenticated GitHub client
+and remembers repository lookups (locations, submodule index, current
+branches, tags) for the projects it has served. For each command, the
+'ggg' client (see gfr.client) sends its argv, working directory,
+environment and terminal; the daemon forks, and the child runs the command
+exactly like a normal 'ggg' process would, only without the startup cost.
+
+Remembered lookups are only handed to a command if the files they were read
+from are unchanged: each entry records the stat signature (inode, size,
+mtime) of the files it depends on, such as '.gitmodules' and each
+repository's HEAD, and is checked against them before every command.
+"""
+import argparse
+import importlib
+import os
+import signal
+import socket
+import sys
+import time
+import traceback
+from typing import Any, Callable, Optional
+
+from gfr.client import PROTOCOL_VERSION, daemon_supported, encode_message, get_socket_path, read_message
+from gfr.utils.git.context import RepoContext, set_context_seed
+from gfr.utils.git.discovery import discover_repository, is_worktree_root
+from gfr.utils.git.operations import GitError, GitOperations
+from gfr.utils.git.submodules import load_submodules
+
+# Settings that decide which GitHub client a command would build
+_GITHUB_SETTINGS = ("GITHUB_TOKEN", "GITHUB_ORGANIZATION", "GITHUB_USERNAME", "GITHUB_API_URL", "GITHUB_GRAPHQL")
+
+def _signature(paths: list[str]) -> tuple:
+    """The stat signature of some files; missing files are part of it too."""
+    signature = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            signature.append((stat.st_ino, stat.st_size, stat.st_mtime_ns))
+        except OSError:
+            signature.append(None)
+    return tuple(signature)
+
+class RepoWatcher:
+    """
+    Remembers RepoContext entries for the projects the daemon has served, each
+    with the files it was read from, so stale entries can be detected by
+    comparing stat signatures instead of asking git again.
+    """
+    def __init__(self, git_ops: Optional[GitOperations] = None):
+        self.git_ops = git_ops or GitOperations()
+        # RepoContext key -> (value, watched paths, signature of those paths)
+        self._entries: dict[tuple, tuple[Any, list[str], tuple]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def valid_entries(self, cwd: str) -> dict:
+        """
+        The remembered entries for the project containing cwd whose files are
+        unchanged. Stale entries are dropped. Only stats files.
+        """
+        project_root = self._project_root(cwd)
+        if project_root is None:
+            return {}
+        valid = {}
+        for key, (value, paths, signature) in list(self._entries.items()):
+            if not self._belongs_to(key[1], project_root):
+                continue
+            if _signature(paths) == signature:
+                valid[key] = value
+            else:
+                del self._entries[key]
+        return valid
+
+    def refresh(self, cwd: str):
+        """Loads whatever is missing for the project containing cwd."""
+        project_root = self._project_root(cwd)
+        if project_root is None:
+            return
+        submodules = self._load(
+            "submodules-recursive", project_root,
+            lambda: self._gitmodules_files(project_root),
+            lambda: load_submodules(project_root, recursive=True),
+        )
+        self._load(
+            "submodules", project_root,
+            lambda: [os.path.join(project_root, ".gitmodules")],
+            lambda: load_submodules(project_root),
+        )
+        repos = [project_root] + [os.path.join(project_root, submodule.path) for submodule in submodules]
+        for repo in repos:
+            location = discover_repository(repo)
+            if location is None or not is_worktree_root(repo):
+                # A submodule that isn't checked out
+                continue
+            self._load("root", repo, lambda: [os.path.join(repo, ".git")], lambda: location)
+            self._load("branch", repo, lambda: [os.path.join(location.git_dir, "HEAD")],
+                       lambda: self.git_ops.get_current_branch(repo))
+            self._load("tags", repo,
+                       lambda: [os.path.join(location.common_dir, "packed-refs"), os.path.join(location.common_dir, "refs", "tags")],
+                       lambda: self.git_ops.get_tag_index(repo))
+
+    def _load(self, kind: str, path: str, watched: Callable[[], list[str]], loader: Callable[[], Any]) -> Any:
+        key = RepoContext._key(kind, path)
+        if key in self._entries:
+            return self._entries[key][0]
+        # Stat before loading: a change made while loading then shows up as stale next time
+        paths = watched()
+        signature = _signature(paths)
+        value = loader()
+        self._entries[key] = (value, paths, signature)
+        return value
+
+    @staticmethod
+    def _gitmodules_files(project_root: str) -> list[str]:
+        """Every .gitmodules file the recursive submodule index is read from."""
+        paths = [os.path.join(project_root, ".gitmodules")]
+        paths += [os.path.join(project_root, submodule.path, ".gitmodules")
+                  for submodule in load_submodules(project_root, recursive=True)]
+        return paths
+
+    @staticmethod
+    def _project_root(cwd: str) -> Optional[str]:
+        location = discover_repository(cwd)
+        return location.superproject_root if location else None
+
+    @staticmethod
+    def _belongs_to(path: str, project_root: str) -> bool:
+        return path == project_root or path.startswith(project_root + os.sep)
+
+class DaemonServer:
+    """Accepts commands on a Unix socket and runs each one in a forked child."""
+    def __init__(self, socket_path: str):
+        self.socket_path = socket_path
+        self.watcher = RepoWatcher()
+        self.started = time.time()
+        self.requests = 0
+        self._running = True
+        self._github_settings = None
+        self._sock = None
+
+    def warm(self):
+        """Imports every command and connects the GitHub client ahead of the first command."""
+        from gfr.app import COMMANDS
+        for module in sorted(set(COMMANDS.values())):
+            importlib.import_module(module)
+
+        self._github_settings = _github_settings(os.environ)
+        try:
+            from gfr.utils.github.api import get_github_api
+            api = get_github_api()
+            api.org, api.user
+            # Children must not share the parent's connections; they reconnect on demand
+            api.close()
+            self._log(f"GitHub client ready for '{api.org_name}'.")
+        except Exception as e:
+            self._log(f"GitHub client not warmed up: {e}")
+
+    def serve_forever(self):
+        self._bind()
+        signal.signal(signal.SIGTERM, self._stop)
+        self._log(f"Listening on {self.socket_path} (pid {os.getpid()}).")
+        try:
+            while self._running:
+                self._reap_children()
+                try:
+                    conn, _ = self._sock.accept()
+                except socket.timeout:
+                    continue
+                except InterruptedError:
+                    continue
+                with conn:
+                    try:
+                        self._handle(conn)
+                    except Exception:
+                        self._log(traceback.format_exc())
+        finally:
+            self._sock.close()
+            try:
+                os.unlink(self.socket_path)
+            except OSError:
+                pass
+            self._log("Stopped.")
+
+    def _bind(self):
+        if os.path.exists(self.socket_path):
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(self.socket_path)
+                raise RuntimeError(f"A daemon is already listening on {self.socket_path}.")
+            except OSError:
+                # Left behind by a daemon that didn't shut down cleanly
+                os.unlink(self.socket_path)
+            finally:
+                probe.close()
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        # Only the owner may connect: commands run with the daemon's permissions
+        previous_umask = os.umask(0o077)
+        try:
+            self._sock.bind(self.socket_path)
+        finally:
+            os.umask(previous_umask)
+        self._sock.listen(16)
+        self._sock.settimeout(1.0)
+
+    def _handle(self, conn: socket.socket):
+        conn.settimeout(5.0)
+        data, fds, _, _ = socket.recv_fds(conn, 65536, 3)
+        try:
+            message = read_message(conn, prefix=data)
+            if message is None:
+                return
+            if message.get("version") != PROTOCOL_VERSION:
+                conn.sendall(encode_message({"error": "The daemon runs a different version of ggg; restart it."}))
+                return
+            command = message.get("command")
+            if command == "status":
+                conn.sendall(encode_message(self._status()))
+            elif command == "stop":
+                self._running = False
+                conn.sendall(encode_message({"exit": 0}))
+            elif command == "run" and len(fds) == 3:
+                conn.settimeout(None)
+                self._run(conn, fds, message)
+            else:
+                conn.sendall(encode_message({"error": f"Unknown request '{command}'."}))
+        finally:
+            for fd in fds:
+                os.close(fd)
+
+    def _run(self, conn: socket.socket, fds: list[int], message: dict):
+        self.requests += 1
+        cwd = message["cwd"]
+        set_context_seed(self.watcher.valid_entries(cwd))
+        for stream in (sys.stdout, sys.stderr):
+            stream.flush()
+
+        pid = os.fork()
+        if pid == 0:
+            self._sock.close()
+            exit_code = 1
+            try:
+                exit_code = _run_command(conn, fds, message, self._github_settings)
+            except BaseException:
+                traceback.print_exc()
+            finally:
+                os._exit(exit_code)
+
+        # Meanwhile, load what this project was missing so the next command finds it
+        try:
+            self.watcher.refresh(cwd)
+        except (GitError, OSError) as e:
+            self._log(f"Could not index {cwd}: {e}")
+
+    def _status(self) -> dict:
+        return {
+            "pid": os.getpid(),
+            "socket": self.socket_path,
+            "uptime": round(time.time() - self.started),
+            "requests": self.requests,
+            "cached_entries": len(self.watcher),
+        }
+
+    def _stop(self, signum, frame):
+        self._running = False
+
+    @staticmethod
+    def _reap_children():
+        try:
+            while os.waitpid(-1, os.WNOHANG)[0] > 0:
+                pass
+        except ChildProcessError:
+            pass
+
+    @staticmethod
+    def _log(text: str):
+        print(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] {text}", flush=True)
+
+def _github_settings(environ) -> tuple:
+    return tuple(environ.get(name) for name in _GITHUB_SETTINGS)
+
+def _run_command(conn: socket.socket, fds: list[int], message: dict, github_settings: Optional[tuple]) -> int:
+    """Runs in the forked child: takes over the client's terminal, cwd and environment, then runs the command."""
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+    conn.sendall(encode_message({"pid": os.getpid()}))
+
+    for target, fd in enumerate(fds):
+        os.dup2(fd, target)
+    sys.stdin = open(0, "r", encoding="utf-8", errors="replace", closefd=False)
+    sys.stdout = open(1, "w", encoding="utf-8", errors="replace", closefd=False, buffering=1)
+    sys.stderr = open(2, "w", encoding="utf-8", errors="replace", closefd=False, buffering=1)
+    os.chdir(message["cwd"])
+    os.environ.clear()
+    os.environ.update(message["env"])
+
+    import gfr.utils.github.api as github_api
+    if _github_settings(os.environ) != github_settings:
+        # The client uses different credentials than the daemon was started with
+        github_api._shared_api = None
+    _refresh_consoles()
+
+    from gfr.app import app
+    from gfr.utils.config import flush_config
+    exit_code = 0
+    try:
+        app(args=message["argv"], prog_name="ggg")
+    except SystemExit as e:
+        if isinstance(e.code, str):
+            print(e.code, file=sys.stderr)
+            exit_code = 1
+        else:
+            exit_code = e.code or 0
+    except KeyboardInterrupt:
+        exit_code = 130
+    except BaseException:
+        traceback.print_exc()
+        exit_code = 1
+    finally:
+        flush_config()
+        for stream in (sys.stdout, sys.stderr):
+            stream.flush()
+
+    try:
+        conn.sendall(encode_message({"exit": exit_code}))
+    except OSError:
+        pass
+    return 0
+
+def _refresh_consoles():
+    """
+    Recreates the module-level rich consoles. They detect color support and
+    terminal features when created, which happened in the daemon, not on the
+    client's terminal.
+    """
+    from rich.console import Console
+    for name, module in list(sys.modules.items()):
+        console = getattr(module, "console", None) if name.startswith("gfr.") else None
+        if isinstance(console, Console):
+            module.console = Console(stderr=console.stderr)
+
+def serve(socket_path: Optional[str] = None):
+    """Runs the daemon in the foreground until it is stopped."""
+    if not daemon_supported():
+        raise RuntimeError("The daemon needs Unix domain sockets with file descriptor passing.")
+    server = DaemonServer(socket_path or get_socket_path())
+    server.warm()
+    server.serve_forever()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python -m gfr.daemon", description="Runs the ggg daemon in the foreground.")
+    parser.add_argument("--socket", help="Socket path (default: daemon.sock in the gfr cache directory).")
+    arguments = parser.parse_args()
+    try:
+        serve(arguments.socket)
+    except RuntimeError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
@@ -0,0 +1,115 @@
+# gfr/utils/cache.py
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from typing import Any, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+try:
+    import msvcrt
+except ImportError:  # POSIX
+    msvcrt = None
+
+# Read once at import, as os.umask can only be queried by changing it
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+def get_cache_dir() -> str:
+    """
+    Returns the gfr cache directory, creating it if needed.
+
+    Uses $GFR_CACHE_DIR if set, otherwise the platform's user cache location
+    (%LOCALAPPDATA%\\gfr\\cache on Windows, $XDG_CACHE_HOME/gfr or ~/.cache/gfr elsewhere).
+    """
+    cache_dir = os.getenv("GFR_CACHE_DIR")
+    if not cache_dir:
+        if os.name == "nt" and os.getenv("LOCALAPPDATA"):
+            cache_dir = os.path.join(os.environ["LOCALAPPDATA"], "gfr", "cache")
+        else:
+            base = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+            cache_dir = os.path.join(base, "gfr")
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
+
+def cache_key(*parts: str) -> str:
+    """Builds a stable, filesystem-safe key from arbitrary strings."""
+    return hashlib.sha1("\0".join(parts).encode("utf-8")).hexdigest()
+
+@contextmanager
+def atomic_file(path: str, mode: Optional[int] = None):
+    """
+    Opens a temporary file next to path for binary writing and renames it over
+    path once the block finishes, so readers never see a partial file. The file
+    gets the given permission mode, or else keeps an existing file's. On error
+    the original is untouched.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".gfr-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            yield f
+        if mode is not None:
+            os.chmod(tmp_path, mode)
+        elif os.path.exists(path):
+            shutil.copymode(path, tmp_path)
+        else:
+            # mkstemp creates files readable only by the owner; use the usual default
+            os.chmod(tmp_path, 0o666 & ~_UMASK)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+def atomic_write(path: str, data: bytes, mode: Optional[int] = None):
+    """Writes a file by renaming a fully written temporary file into place (see atomic_file)."""
+    with atomic_file(path, mode) as f:
+        f.write(data)
+
+def read_json_cache(name: str) -> Optional[Any]:
+    """Reads a JSON cache entry, returning None if it is missing or unreadable."""
+    try:
+        with open(os.path.join(get_cache_dir(), name), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def write_json_cache(name: str, data: Any):
+    """Writes a JSON cache entry. The cache is best-effort, so failures are ignored."""
+    try:
+        atomic_write(os.path.join(get_cache_dir(), name), json.dumps(data).encode("utf-8"))
+    except OSError:
+        pass
+
+@contextmanager
+def file_lock(name: str):
+    """
+    Holds an exclusive advisory lock shared by every gfr process on this machine.
+
+    The lock file lives in the cache directory under the given name. Locking
+    uses fcntl on POSIX and msvcrt on Windows; if neither is available the
+    block simply runs unlocked.
+    """
+    lock_dir = os.path.join(get_cache_dir(), "locks")
+    os.makedirs(lock_dir, exist_ok=True)
+    with open(os.path.join(lock_dir, name), "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        elif msvcrt is not None:
+            f.seek(0)
+            # LK_LOCK retries for ~10 seconds before giving up
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            elif msvcrt is not None:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
@@ -0,0 +1,147 @@
+# gfr/utils/changelog.py
+import os
+import re
+import shutil
+from dataclasses import dataclass, asdict
+from typing import Optional
+
+from .cache import atomic_file, atomic_write, cache_key, read_json_cache, write_json_cache
+
+# '## [1.2.0](https://.../releases/tag/v1.2.0) - 2025-01-31' or '## 1.2.0 - ...' or '## [Unreleased]'
+_VERSION_RE = re.compile(rb"^## \[?(?P<version>[^\]\s(]+)")
+
+@dataclass
+class ChangelogHeading:
+    """A '## ' section heading and the byte offset where it starts."""
+    version: str
+    offset: int
+
+def insert_changelog_entry(path: str, entry: str, template: str = "") -> None:
+    """
+    Inserts a release entry above the newest section of a changelog.
+
+    Only the part of the file before the first '## ' heading is read line by
+    line; the rest is streamed unchanged into a temporary file, which is then
+    renamed over the original. Memory use stays bounded regardless of the
+    changelog's size, and an interrupted write never leaves a damaged file.
+    If the file doesn't exist, it is created from the template.
+
+    Args:
+        path (str): Path to CHANGELOG.md.
+        entry (str): The new section, starting with its '## ' heading.
+        template (str): Header used when creating a new changelog.
+    """
+    entry_bytes = entry.encode("utf-8")
+    if not entry_bytes.endswith(b"\n"):
+        entry_bytes += b"\n"
+
+    if not os.path.exists(path):
+        header = template.strip().encode("utf-8") + b"\n\n"
+        atomic_write(path, header + entry_bytes)
+        _store_index(path, [ChangelogHeading(_heading_version(entry_bytes), len(header))])
+        return
+
+    previous_index = _cached_index(path)
+    with open(path, "rb") as src, atomic_file(path) as dst:
+        insert_at = 0
+        heading = b""
+        for line in iter(src.readline, b""):
+            if line.startswith(b"## "):
+                heading = line
+                break
+            dst.write(line)
+            insert_at += len(line)
+
+        if heading:
+            # Keep a blank line between the new entry and the previous newest one
+            dst.write(entry_bytes + b"\n" + heading)
+            shutil.copyfileobj(src, dst)
+        else:
+            # No releases yet: make sure the entry is separated from the header
+            if insert_at and not _ends_with_blank_line(path, insert_at):
+                separator = b"\n" if _ends_with_newline(path, insert_at) else b"\n\n"
+                dst.write(separator)
+                insert_at += len(separator)
+            dst.write(entry_bytes)
+
+    if previous_index is not None:
+        # Everything after the insertion point moved down by the inserted bytes
+        shift = len(entry_bytes) + (1 if heading else 0)
+        headings = [ChangelogHeading(_heading_version(entry_bytes), insert_at)]
+        headings += [ChangelogHeading(h.version, h.offset + shift) for h in previous_index]
+        _store_index(path, headings)
+
+def get_changelog_index(path: str) -> list[ChangelogHeading]:
+    """
+    Lists the '## ' sections of a changelog with their byte offsets, newest first.
+
+    The index is cached on disk and reused until the file changes, and
+    insert_changelog_entry keeps it up to date, so it is rarely rebuilt.
+    """
+    cached = _cached_index(path)
+    if cached is not None:
+        return cached
+
+    headings = []
+    offset = 0
+    with open(path, "rb") as f:
+        for line in f:
+            if line.startswith(b"## "):
+                headings.append(ChangelogHeading(_heading_version(line), offset))
+            offset += len(line)
+    _store_index(path, headings)
+    return headings
+
+def read_changelog_section(path: str, version: str) -> Optional[str]:
+    """
+    Returns the section for a version (heading included), or None if it isn't there.
+    Seeks straight to the section using the heading index.
+    """
+    headings = get_changelog_index(path)
+    version = version.lstrip("v")
+    for position, heading in enumerate(headings):
+        if heading.version.lstrip("v") == version:
+            end = headings[position + 1].offset if position + 1 < len(headings) else None
+            with open(path, "rb") as f:
+                f.seek(heading.offset)
+                data = f.read(end - heading.offset) if end is not None else f.read()
+            return data.decode("utf-8").rstrip("\n") + "\n"
+    return None
+
+def _heading_version(heading: bytes) -> str:
+    match = _VERSION_RE.match(heading)
+    return match.group("version").decode("utf-8", errors="replace") if match else ""
+
+def _ends_with_newline(path: str, size: int) -> bool:
+    with open(path, "rb") as f:
+        f.seek(size - 1)
+        return f.read(1) == b"\n"
+
+def _ends_with_blank_line(path: str, size: int) -> bool:
+    if size < 2:
+        return False
+    with open(path, "rb") as f:
+        f.seek(size - 2)
+        return f.read(2) == b"\n\n"
+
+def _index_cache_name(path: str) -> str:
+    return f"changelog-{cache_key(os.path.abspath(path))}.json"
+
+def _cached_index(path: str) -> Optional[list[ChangelogHeading]]:
+    """The cached heading index, if it still matches the file on disk."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    cached = read_json_cache(_index_cache_name(path))
+    if cached and cached.get("mtime_ns") == stat.st_mtime_ns and cached.get("size") == stat.st_size:
+        return [ChangelogHeading(**heading) for heading in cached["headings"]]
+    return None
+
+def _store_index(path: str, headings: list[ChangelogHeading]):
+    stat = os.stat(path)
+    write_json_cache(_index_cache_name(path), {
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "headings": [asdict(heading) for heading in headings],
+    })
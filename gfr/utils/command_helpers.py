@@ -4,8 +4,9 @@ import os
 import re
 from .console import get_multiline_input
 
-from .git.operations import GitOperations, GitError
-from .github.api import GitHubAPI, GitHubError
+from .git.operations import GitError
+from .git.context import RepoContext, get_repo_context
+from .github.exceptions import GitHubError
 from .config import GFRConfig
 
 console = Console()
@@ -16,13 +17,14 @@ def switch_to_branch(target_branch: str):
     Contains shared logic for commands like 'dev' and 'doc'.
     """
     try:
-        git_ops = GitOperations()
+        repo_ctx = get_repo_context()
+        git_ops = repo_ctx.git_ops
 
         if not git_ops.is_git_repo():
             console.print("[bold red]Error:[/bold red] This command must be run from within a Git repository.")
             raise typer.Exit(code=1)
 
-        current_branch = git_ops.get_current_branch()
+        current_branch = repo_ctx.get_current_branch()
 
         if current_branch == target_branch:
             console.print(f"[bold yellow]You are already on the '{target_branch}' branch.[/bold yellow]")
@@ -48,9 +50,13 @@ def start_new_task(task_type: str, microservice_name: str, task_name: str):
     - Creates a GitHub issue.
     - Creates and switches to a new local branch.
     """
+    # Imported here so branch-switching helpers don't load PyGithub
+    from .github.api import get_github_api
+
     try:
-        git_ops = GitOperations()
-        github_api = GitHubAPI()
+        repo_ctx = get_repo_context()
+        git_ops = repo_ctx.git_ops
+        github_api = get_github_api()
         config = GFRConfig()
 
         if not git_ops.is_git_repo():
@@ -61,7 +67,7 @@ def start_new_task(task_type: str, microservice_name: str, task_name: str):
         if microservice_name == '.':
             target_path = "."
             target_name = "root project"
-            repo_name_for_github = git_ops.get_root().split('/')[-1]
+            repo_name_for_github = repo_ctx.get_root().split('/')[-1]
         elif microservice_name == '-':
             target_path = config.get_last_used_microservice()
             if not target_path:
@@ -73,6 +79,7 @@ def start_new_task(task_type: str, microservice_name: str, task_name: str):
             target_path = microservice_name
             target_name = microservice_name
             repo_name_for_github = microservice_name
+        repo_dir = repo_ctx.resolve_path(target_path)
 
         # --- Get Issue Details ---
         console.print(f"\n[bold cyan]Enter description for the {task_type} '{task_name}'.[/bold cyan]")
@@ -93,8 +100,8 @@ def start_new_task(task_type: str, microservice_name: str, task_name: str):
             branch_name = f"{task_type}/{issue.number}-{task_name.lower().replace(' ', '-')}"
             status.update(f"[bold yellow]Creating and switching to branch '{branch_name}'...[/bold yellow]")
             
-            git_ops.create_branch(branch_name, path=target_path)
-            git_ops.switch_branch(branch_name, path=target_path)
+            git_ops.create_branch(branch_name, path=repo_dir)
+            git_ops.switch_branch(branch_name, path=repo_dir)
             console.print(f"✔ Switched to new branch [bold yellow]{branch_name}[/bold yellow] in [bold cyan]{target_name}[/bold cyan].")
 
             config.set_last_used_microservice(target_path)
@@ -115,16 +122,22 @@ def finish_task(task_type: str, microservice_name: str):
     - Creates and merges a pull request.
     - Cleans up the branch.
     """
+    # Imported here so branch-switching helpers don't load PyGithub
+    from .github.api import get_github_api
+
     try:
-        git_ops = GitOperations()
-        github_api = GitHubAPI()
+        repo_ctx = get_repo_context()
+        git_ops = repo_ctx.git_ops
+        github_api = get_github_api()
         config = GFRConfig()
 
         # --- Determine target repository ---
-        target_path, target_name, repo_name_for_github = validate_and_get_repo_details(git_ops, config, microservice_name)
+        target_path, target_name, repo_name_for_github = validate_and_get_repo_details(repo_ctx, config, microservice_name)
+        repo_dir = repo_ctx.resolve_path(target_path)
+        root_dir = repo_ctx.resolve_path(".")
 
         # --- Pre-flight Checks ---
-        current_branch = git_ops.get_current_branch(path=target_path)
+        current_branch = repo_ctx.get_current_branch(path=repo_dir)
         if not current_branch.startswith(f"{task_type}/"):
             console.print(f"[bold red]Error:[/bold red] You are not on a {task_type} branch in '{target_name}'.")
             raise typer.Exit(code=1)
@@ -144,44 +157,40 @@ def finish_task(task_type: str, microservice_name: str):
 
         labels = ["enhancement" if task_type == "feature" else "bug"]
 
+        from .transfer_progress import status_progress
         with console.status(f"[bold yellow]Finishing {task_type} on GitHub...[/bold yellow]", spinner="dots") as status:
             # --- Push Branch ---
-            status.update(f"[bold yellow]Pushing branch '{current_branch}'...[/bold yellow]")
-            git_ops.push_branch(current_branch, set_upstream=True, path=target_path)
+            progress = status_progress(status, f"[bold yellow]Pushing branch '{current_branch}'...[/bold yellow]")
+            git_ops.push_branch(current_branch, set_upstream=True, path=repo_dir, progress=progress)
             console.print("✔ Branch pushed to remote.")
 
-            # --- Create Pull Request ---
-            status.update("[bold yellow]Creating pull request...[/bold yellow]")
-            repo = github_api.repos.get(repo_name_for_github)
-            pr = github_api.prs.create(repo, pr_title, final_description, head=current_branch, base="develop", labels=labels)
-            console.print(f"✔ Created Pull Request: {pr.html_url}")
-
-            # --- Merge Pull Request ---
-            status.update("[bold yellow]Merging pull request...[/bold yellow]")
-            github_api.prs.merge(pr)
+            # --- Create and Merge Pull Request ---
+            status.update("[bold yellow]Creating and merging pull request...[/bold yellow]")
+            pr_url = github_api.prs.create_and_merge(repo_name_for_github, pr_title, final_description, head=current_branch, base="develop", labels=labels)
+            console.print(f"✔ Created Pull Request: {pr_url}")
             console.print("✔ Pull request merged.")
 
             # --- Local Cleanup ---
             status.update("[bold yellow]Cleaning up local repository...[/bold yellow]")
-            git_ops.switch_branch("develop", path=target_path)
-            git_ops.pull("develop", path=target_path)
-            git_ops.delete_local_branch(current_branch, path=target_path)
+            git_ops.switch_branch("develop", path=repo_dir)
+            progress = status_progress(status, "[bold yellow]Pulling 'develop'...[/bold yellow]")
+            git_ops.pull("develop", path=repo_dir, progress=progress)
+            git_ops.delete_local_branch(current_branch, path=repo_dir)
             console.print(f"✔ Switched to 'develop', pulled latest, and deleted local branch '{current_branch}'.")
 
             # --- Remote Cleanup ---
             status.update("[bold yellow]Deleting remote branch...[/bold yellow]")
-            git_ops.delete_remote_branch(current_branch, path=target_path)
+            git_ops.delete_remote_branch(current_branch, path=repo_dir)
             console.print(f"✔ Deleted remote branch '{current_branch}'.")
 
             if target_path != ".":
                 status.update(f"[bold yellow]Updating parent repository...[/bold yellow]")
-                parent_branch = git_ops.get_current_branch(path=".")
-                git_ops.add([target_path], path=".")
+                parent_branch = repo_ctx.get_current_branch(path=root_dir)
+                git_ops.add([target_path], path=root_dir)
                 commit_message = f"Update '{target_name}' submodule after finishing '{current_branch}'"
-                git_ops.commit(commit_message, path=".")
-                git_ops.push_branch(parent_branch, path=".")
+                git_ops.commit(commit_message, path=root_dir)
+                git_ops.push_branch(parent_branch, path=root_dir)
                 console.print(f"✔ Updated, committed, and pushed parent repository on branch '{parent_branch}'.")
-                config.set_last_used_microservice(target_path)
 
         config.set_last_used_microservice(target_path)
         console.print(f"\n[bold green]✔ Success![/bold green] The {task_type} has been finished and merged.")
@@ -193,23 +202,24 @@ def finish_task(task_type: str, microservice_name: str):
         console.print("\n[bold yellow]Operation cancelled by user.[/bold yellow]")
         raise typer.Exit()
 
-def validate_and_get_repo_details(git_ops: GitOperations, config: GFRConfig, microservice_name: str) -> tuple[str, str, str]:
+def validate_and_get_repo_details(repo_ctx: RepoContext, config: GFRConfig, microservice_name: str) -> tuple[str, str, str]:
     """
     Validates that the command is run in a git repo and the service name is valid.
+    Lookups go through the command's RepoContext, so they are shared with the caller.
 
     Returns a tuple containing:
-    - target_path (str): The local file path for git operations.
+    - target_path (str): The repository path relative to the root (see RepoContext.resolve_path).
     - target_name (str): The display name for console output.
     - repo_name_for_github (str): The repository name for GitHub API calls.
     """
-    if not git_ops.is_git_repo():
+    if not repo_ctx.git_ops.is_git_repo():
         console.print("[bold red]Error:[/bold red] This command must be run from within a Git repository.")
         raise typer.Exit(code=1)
 
     if microservice_name == '.':
         target_path = "."
         target_name = "root project"
-        repo_name_for_github = os.path.basename(git_ops.get_root())
+        repo_name_for_github = os.path.basename(repo_ctx.get_root())
     elif microservice_name == '-':
         target_path = config.get_last_used_microservice()
         if not target_path:
@@ -222,12 +232,12 @@ def validate_and_get_repo_details(git_ops: GitOperations, config: GFRConfig, mic
         target_name = microservice_name
         repo_name_for_github = microservice_name
         # Validate that the named microservice is a real submodule
-        submodules = git_ops.get_submodules()
+        submodules = repo_ctx.get_submodule_paths_from_root()
         if target_path not in submodules:
             console.print(f"[bold red]Error:[/bold red] '{target_name}' is not a valid submodule in this project.")
             raise typer.Exit(code=1)
     
-    config.set_last_used_microservice(microservice_name)
+    config.set_last_used_microservice(target_path)
     
     return target_path, target_name, repo_name_for_github
     
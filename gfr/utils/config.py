@@ -1,42 +1,162 @@
 # gfr/utils/config.py
-import yaml
+import atexit
 import os
-from .git.operations import GitOperations, GitError
+import sys
+import threading
+from typing import Any, Optional
+
+from .cache import atomic_write, cache_key, file_lock, read_json_cache, write_json_cache
+from .git.operations import GitError
+from .git.context import get_repo_context
+
+class ConfigStore:
+    """
+    The contents of one .gfr.yml file, shared by every GFRConfig in the process.
+
+    Changes are only recorded in memory and marked dirty; flush() writes them
+    once, merged with whatever is on disk at that moment, under a lock shared
+    with other gfr processes. Setting a key to its current value is a no-op.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self.data = _read_config(path)
+        self._dirty = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            return self.data.get(key, default)
+
+    def set(self, key: str, value: Any):
+        with self._lock:
+            if key not in self._dirty and self.data.get(key) == value:
+                return
+            self.data[key] = value
+            self._dirty[key] = value
+
+    def flush(self):
+        """Writes pending changes to disk. Does nothing if there are none."""
+        with self._lock:
+            if not self._dirty:
+                return
+            dirty, self._dirty = self._dirty, {}
+
+        try:
+            with file_lock(f"config-{cache_key(self.path)}.lock"):
+                # Re-read under the lock so keys written by other processes survive
+                on_disk = _read_config(self.path, use_cache=False)
+                merged = {**on_disk, **dirty}
+                if merged != on_disk:
+                    import yaml
+                    atomic_write(self.path, yaml.safe_dump(merged).encode("utf-8"))
+                    _remember_config(self.path, merged)
+        except BaseException:
+            # Keep the changes pending for the next flush (values set meanwhile win)
+            with self._lock:
+                self._dirty = {**dirty, **self._dirty}
+            raise
+
+        with self._lock:
+            self.data = {**merged, **self._dirty}
+
+
+_stores: dict[str, ConfigStore] = {}
+_stores_lock = threading.Lock()
+
+def get_config_store(path: str) -> ConfigStore:
+    """Returns the process-wide store for a config file, loading it on first use."""
+    path = os.path.realpath(path)
+    with _stores_lock:
+        if path not in _stores:
+            _stores[path] = ConfigStore(path)
+        return _stores[path]
+
+def flush_config():
+    """
+    Writes every store with pending changes. Called once when a command
+    finishes (and at interpreter exit); a failed write only prints a warning,
+    as the config just remembers defaults.
+    """
+    with _stores_lock:
+        stores = list(_stores.values())
+    for store in stores:
+        try:
+            store.flush()
+        except OSError as e:
+            print(f"Warning: could not save {store.path}: {e}", file=sys.stderr)
+
+atexit.register(flush_config)
+
+
+def _read_config(path: str, use_cache: bool = True) -> dict:
+    """
+    Reads a config file. The parsed form is kept in a JSON sidecar in the cache
+    directory and reused until the file's mtime or size changes, so YAML is
+    only parsed after the file was edited.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return {}
+
+    if use_cache:
+        cached = read_json_cache(_cache_name(path))
+        if cached and cached.get("mtime_ns") == stat.st_mtime_ns and cached.get("size") == stat.st_size:
+            return cached["config"]
+
+    import yaml
+    with open(path, "r", encoding="utf-8") as f:
+        config = yaml.safe_load(f) or {}
+    _remember_config(path, config, stat)
+    return config
+
+def _remember_config(path: str, config: dict, stat: Optional[os.stat_result] = None):
+    """Stores the parsed form of a config file in the sidecar cache."""
+    try:
+        stat = stat or os.stat(path)
+    except OSError:
+        return
+    write_json_cache(_cache_name(path), {
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "config": config,
+    })
+
+def _cache_name(path: str) -> str:
+    return f"config-{cache_key(os.path.abspath(path))}.json"
+
 
 class GFRConfig:
     """
     Manages the .gfr.yml configuration file at the root of the project.
+
+    Changes are written once per process (see ConfigStore), not on every call.
     """
     def __init__(self):
         try:
-            git_ops = GitOperations()
-            self.root_path = git_ops.get_root()
+            # .gfr.yml belongs to the whole project, so use the superproject's root
+            self.root_path = get_repo_context().get_project_root()
             self.config_path = os.path.join(self.root_path, ".gfr.yml")
-            self.config = self._read_config()
+            self._store = get_config_store(self.config_path)
         except GitError:
             # Handle case where we are not in a git repo
             self.root_path = None
             self.config_path = None
-            self.config = {}
-
-    def _read_config(self) -> dict:
-        """Reads the YAML configuration file."""
-        if self.config_path and os.path.exists(self.config_path):
-            with open(self.config_path, 'r') as f:
-                return yaml.safe_load(f) or {}
-        return {}
+            self._store = None
 
-    def _write_config(self):
-        """Writes the current configuration to the YAML file."""
-        if self.config_path:
-            with open(self.config_path, 'w') as f:
-                yaml.safe_dump(self.config, f)
+    @property
+    def config(self) -> dict:
+        """The current configuration."""
+        return dict(self._store.data) if self._store else {}
 
     def get_last_used_microservice(self) -> str | None:
-        """Retrieves the name of the last used microservice."""
-        return self.config.get("last_used_microservice")
+        """
+        Retrieves the last used microservice, as a path relative to the repository
+        root ('.' for the root project) rather than to the current directory.
+        """
+        return self._store.get("last_used_microservice") if self._store else None
 
-    def set_last_used_microservice(self, name: str):
-        """Updates the name of the last used microservice."""
-        self.config["last_used_microservice"] = name
-        self._write_config()
+    def set_last_used_microservice(self, path: str):
+        """Updates the last used microservice (a path relative to the repository root)."""
+        if self._store:
+            self._store.set("last_used_microservice", path)
@@ -1,11 +1,79 @@
 # gfr/utils/console.py
 
 import sys
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Iterable, Optional
+
+# Lines queued by scripted_answers(); None means prompts are interactive
+_answers: Optional[deque] = None
+
+@contextmanager
+def scripted_answers(lines: Iterable[str]):
+    """
+    Answers prompts from a list of lines instead of the terminal.
+
+    Each line is consumed exactly as if the user had typed it, so a multi-line
+    input takes several lines (ended by "'''" or by running out of lines).
+    Used by 'ggg batch'.
+
+    Yields:
+        deque: The queue of remaining answers.
+    """
+    global _answers
+    previous, _answers = _answers, deque(lines)
+    try:
+        yield _answers
+    finally:
+        _answers = previous
+
+def _next_answer() -> Optional[str]:
+    """Pops the next scripted line, or returns None when none are left."""
+    return _answers.popleft() if _answers else None
+
+def read_line() -> str:
+    """Reads one line of input (without the newline). Returns '' at end of input."""
+    if _answers is not None:
+        return _next_answer() or ""
+    try:
+        return input()
+    except EOFError:
+        return ""
+
+def prompt_text(message: str, default: Optional[str] = None, choices: Optional[list[str]] = None) -> str:
+    """Asks for a single value, like rich's Prompt.ask."""
+    if _answers is not None:
+        answer = _next_answer()
+        return answer if answer else (default or "")
+    from rich.prompt import Prompt
+    if default is None:
+        return Prompt.ask(message, choices=choices)
+    return Prompt.ask(message, default=default, choices=choices)
+
+def select(message: str, choices: list, **kwargs) -> Any:
+    """
+    Asks the user to pick one of several choices, like questionary.select.
+
+    Choices are strings or {"name": ..., "value": ...} dicts. A scripted answer
+    may give a choice's name or value. Returns None if the prompt is cancelled
+    or no scripted answer is left.
+    """
+    if _answers is not None:
+        answer = _next_answer()
+        if answer is None:
+            return None
+        for choice in choices:
+            name, value = (choice["name"], choice["value"]) if isinstance(choice, dict) else (choice, choice)
+            if answer.strip().lower() in (str(name).lower(), str(value).lower()):
+                return value
+        return None
+    import questionary
+    return questionary.select(message, choices=choices, **kwargs).ask()
 
 def get_multiline_input() -> str:
     """
     Captures multi-line text input from the user.
-    
+
     Input is terminated when the user presses Ctrl+C or Ctrl+D on a blank line
     and then hits Enter.
 
@@ -16,18 +84,25 @@ def get_multiline_input() -> str:
 
     while True:
         try:
-            line = sys.stdin.readline()
+            if _answers is not None:
+                answer = _next_answer()
+                line = "" if answer is None else answer + "\n"
+            else:
+                line = sys.stdin.readline()
+            if not line:
+                # End of input (readline returns '' instead of raising EOFError)
+                break
             if line.strip() == "'''":
                 # Stop on '''
                 break
             elif line.strip() == "'''delete":
-                lines.pop()
+                if lines:
+                    lines.pop()
                 continue
             lines.append(line)
         except (EOFError, KeyboardInterrupt):
             # Handle Ctrl+D or Ctrl+C as termination
             break
-            
+
     # Join the lines, stripping trailing newlines from each line before joining
     return "".join(lines)
-
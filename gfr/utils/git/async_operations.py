@@ -0,0 +1,667 @@
+import asyncio
+import os
+import re
+import signal
+import tempfile
+import threading
+import weakref
+from concurrent.futures import Future
+from collections import deque
+from typing import AsyncIterator, Awaitable, Callable, Iterator, Optional, TypeVar
+from .exceptions import GitError
+from .repo_status import RepoStatus
+from .discovery import RepoLocation, discover_repository, is_worktree_root
+from .gitconfig import read_git_config
+from .log import LOG_FORMAT, RECORD_SEPARATOR, LogEntry, parse_log_record
+from .porcelain import StatusParser, REPO_MARKER
+from .submodules import load_submodules
+from .progress import DIAGNOSTIC_LINES, ProgressCallback, parse_progress_line
+from .tags import TagIndex, read_tag_names
+from ..tracing import span
+
+T = TypeVar("T")
+
+# Upper bound on git processes running at once on one event loop, however
+# many repositories a command fans out to (GFR_GIT_PROCESSES overrides it).
+# Git mostly waits on disk and network, so this guards against running out
+# of processes and file descriptors rather than CPU.
+MAX_GIT_PROCESSES = int(os.getenv("GFR_GIT_PROCESSES") or 0) or 32
+_CHUNK_SIZE = 65536
+# Seconds to wait for a killed or cancelled git call to clean up
+_CLEANUP_TIMEOUT = 5
+# Progress updates end in '\r', everything else in '\n'
+_LINE_END_RE = re.compile(rb"[\r\n]")
+
+_semaphores: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]' = weakref.WeakKeyDictionary()
+
+def _span_name(command: list[str]) -> str:
+    """'git push', 'git submodule update', ... for profiles."""
+    words = [word for word in command[:3] if not word.startswith("-")]
+    return " ".join(words[:3 if len(words) > 2 and words[1] == "submodule" else 2])
+
+def _process_slot() -> asyncio.Semaphore:
+    """The semaphore capping git processes on the running event loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _semaphores[loop] = asyncio.Semaphore(MAX_GIT_PROCESSES)
+    return semaphore
+
+async def _kill(process: asyncio.subprocess.Process, group: bool = False):
+    """
+    Kills a git process that is still running and reaps it. With group=True
+    (for processes started in a session of their own), everything git started
+    is killed too.
+    """
+    try:
+        if group and hasattr(os, "killpg"):
+            # A grandchild (a 'submodule foreach' script) can hold the pipes open after git is gone
+            os.killpg(process.pid, signal.SIGKILL)
+        elif process.returncode is None:
+            process.kill()
+    except ProcessLookupError:
+        pass
+    try:
+        # wait() also waits for the pipes to close
+        await asyncio.wait_for(process.wait(), _CLEANUP_TIMEOUT)
+    except asyncio.TimeoutError:
+        pass
+
+def _decode(data: bytes) -> str:
+    return data.decode("utf-8", errors="surrogateescape")
+
+async def _read_lines(stream: asyncio.StreamReader, on_line: Callable[[str], None]):
+    """Reads a pipe until EOF, calling on_line for every non-empty line ('\r' or '\n' terminated)."""
+    pending = b""
+    while True:
+        chunk = await stream.read(_CHUNK_SIZE)
+        if not chunk:
+            break
+        *lines, pending = _LINE_END_RE.split(pending + chunk)
+        # A line that never ends can't grow without bound
+        pending = pending[-_CHUNK_SIZE:]
+        for line in lines:
+            if line.strip():
+                on_line(_decode(line))
+    if pending.strip():
+        on_line(_decode(pending))
+
+class AsyncGitOperations:
+    """
+    Runs local Git commands as asyncio subprocesses.
+
+    It has the same methods as GitOperations; the ones that run git are
+    coroutines, and lookups answered without git (is_git_repo, get_location,
+    get_root, get_tag_index, get_latest_tag) stay plain methods. A command can
+    therefore start git in hundreds of repositories from one event loop:
+
+        results = await asyncio.gather(*(git.push_all(path) for path in repos))
+
+    Every call waits for a slot on a per-loop semaphore (MAX_GIT_PROCESSES),
+    can be bounded by a timeout, and kills its git process when it times out
+    or is cancelled.
+    """
+
+    # Set by RepoContext (through GitOperations) so mutating operations can invalidate memoized lookups
+    context = None
+
+    def __init__(self, timeout: Optional[float] = None):
+        """
+        Args:
+            timeout: Seconds a single git call may take before it is killed
+                     (None waits forever).
+        """
+        self.timeout = timeout
+
+    def _invalidate(self, *kinds: str, path: str = "."):
+        """Drops the affected entries from the attached RepoContext, if any."""
+        if self.context is not None:
+            self.context.invalidate(*kinds, path=path)
+
+    async def _run_command(self, command: list[str], cwd: str = ".", strip: bool = True, timeout: Optional[float] = None) -> str:
+        """
+        A private helper to run git commands and handle errors.
+
+        Args:
+            command (list[str]): The command to execute.
+            cwd (str): The working directory to run the command in.
+            timeout (float): Overrides the instance's timeout for this call.
+
+        Raises:
+            GitError: If the command fails or times out.
+        """
+        timeout = timeout if timeout is not None else self.timeout
+        abs_cwd = os.path.abspath(cwd)
+        try:
+            async with _process_slot():
+                with span(_span_name(command), "git", argv=command, cwd=abs_cwd) as current:
+                    process = await asyncio.create_subprocess_exec(
+                        *command, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE, cwd=abs_cwd
+                    )
+                    try:
+                        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+                    except asyncio.TimeoutError:
+                        await _kill(process)
+                        raise GitError(f"Git command timed out after {timeout:g}s: {command}")
+                    except BaseException:
+                        # Cancelled (e.g. Ctrl+C in a synchronous caller): don't leave git running
+                        await _kill(process)
+                        raise
+                    if current:
+                        current.set(exit=process.returncode, bytes=len(stdout))
+        except FileNotFoundError:
+            raise GitError("`git` command not found. Is Git installed and in your PATH?")
+        except (GitError, asyncio.CancelledError):
+            raise
+        except Exception as e:
+            raise GitError(f"An unexpected error occurred: {e}")
+
+        if process.returncode != 0:
+            raise GitError(f"Git command failed: {command}\nError: {_decode(stderr).strip()}")
+        output = _decode(stdout)
+        return output.strip() if strip else output
+
+    async def _stream_chunks(self, command: list[str], cwd: str = ".", separator: str = "\0") -> AsyncIterator[list[str]]:
+        """
+        A private helper that runs a git command and yields its output as
+        lists of records, one list per chunk read.
+
+        The output is split on the separator as it arrives, so large outputs
+        are never held in memory as a single string. The timeout applies to
+        the whole command.
+
+        Raises:
+            GitError: If the command fails or times out.
+        """
+        sep = separator.encode()
+        abs_cwd = os.path.abspath(cwd)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout if self.timeout is not None else None
+        # Stderr goes to a temporary file so a chatty command can't block on a full pipe
+        # (the span isn't activated: this generator's body runs interleaved with the consumer)
+        async with _process_slot():
+            with tempfile.TemporaryFile() as stderr_file, span(_span_name(command), "git", activate=False, argv=command, cwd=abs_cwd) as current:
+                try:
+                    # In a session of its own, so stopping early can kill what git started as well
+                    process = await asyncio.create_subprocess_exec(
+                        *command, stdout=asyncio.subprocess.PIPE, stderr=stderr_file, cwd=abs_cwd, start_new_session=True
+                    )
+                except FileNotFoundError:
+                    raise GitError("`git` command not found. Is Git installed and in your PATH?")
+
+                received = 0
+                finished = False
+                try:
+                    pending = b""
+                    while True:
+                        read = process.stdout.read(_CHUNK_SIZE)
+                        try:
+                            chunk = await (asyncio.wait_for(read, deadline - loop.time()) if deadline is not None else read)
+                        except asyncio.TimeoutError:
+                            raise GitError(f"Git command timed out after {self.timeout:g}s: {command}")
+                        if not chunk:
+                            break
+                        received += len(chunk)
+                        pending += chunk
+                        *records, pending = pending.split(sep)
+                        if records:
+                            yield [_decode(record) for record in records]
+                    if pending:
+                        yield [_decode(pending)]
+                    finished = True
+                finally:
+                    if finished:
+                        await process.wait()
+                    else:
+                        # The consumer stopped early, timed out or was cancelled; don't leave the child running
+                        await _kill(process, group=True)
+                    current.set(exit=process.returncode, bytes=received)
+
+                if process.returncode != 0:
+                    stderr_file.seek(0)
+                    stderr = stderr_file.read().decode("utf-8", errors="replace")
+                    raise GitError(f"Git command failed: {command}\nError: {stderr.strip()}")
+
+    async def _run_with_progress(self, command: list[str], cwd: str = ".", progress: Optional[ProgressCallback] = None) -> str:
+        """
+        Runs a transfer command (clone, fetch, pull, push) with --progress and
+        reports git's progress to the callback as it arrives.
+
+        Unlike _run_command, output isn't buffered until the process exits:
+        only the last DIAGNOSTIC_LINES lines of stdout and of stderr (minus
+        the progress updates) are kept, for the result and for error messages.
+
+        Returns:
+            str: The kept tail of stdout.
+
+        Raises:
+            GitError: If the command fails or times out.
+        """
+        # '--progress' goes right after the subcommand ('git push --progress origin main')
+        command = command[:2] + ["--progress"] + command[2:]
+        abs_cwd = os.path.abspath(cwd)
+        stdout_tail: deque[str] = deque(maxlen=DIAGNOSTIC_LINES)
+        stderr_tail: deque[str] = deque(maxlen=DIAGNOSTIC_LINES)
+
+        def on_stderr(line: str):
+            update = parse_progress_line(line)
+            if update is None:
+                stderr_tail.append(line.rstrip())
+            elif progress is not None:
+                progress(update)
+
+        try:
+            async with _process_slot():
+                with span(_span_name(command), "git", argv=command, cwd=abs_cwd) as current:
+                    process = await asyncio.create_subprocess_exec(
+                        *command, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE, cwd=abs_cwd
+                    )
+                    readers = asyncio.gather(
+                        _read_lines(process.stdout, lambda line: stdout_tail.append(line.rstrip())),
+                        _read_lines(process.stderr, on_stderr),
+                        process.wait(),
+                    )
+                    try:
+                        await asyncio.wait_for(readers, self.timeout)
+                    except asyncio.TimeoutError:
+                        await _kill(process)
+                        raise GitError(f"Git command timed out after {self.timeout:g}s: {command}")
+                    except BaseException:
+                        await _kill(process)
+                        raise
+                    if current:
+                        current.set(exit=process.returncode)
+        except FileNotFoundError:
+            raise GitError("`git` command not found. Is Git installed and in your PATH?")
+        except (GitError, asyncio.CancelledError):
+            raise
+        except Exception as e:
+            raise GitError(f"An unexpected error occurred: {e}")
+
+        if process.returncode != 0:
+            diagnostics = "\n".join(stderr_tail)
+            raise GitError(f"Git command failed: {command}\nError: {diagnostics}")
+        return "\n".join(stdout_tail)
+
+    async def _transfer(self, command: list[str], cwd: str, progress: Optional[ProgressCallback]) -> str:
+        """Runs a transfer command, streaming its progress when someone is watching."""
+        if progress is None:
+            return await self._run_command(command, cwd=cwd)
+        return await self._run_with_progress(command, cwd=cwd, progress=progress)
+
+    async def _stream_command(self, command: list[str], cwd: str = ".", separator: str = "\0") -> AsyncIterator[str]:
+        """Runs a git command and yields its output record by record (see _stream_chunks)."""
+        async for records in self._stream_chunks(command, cwd, separator):
+            for record in records:
+                yield record
+
+    def is_git_repo(self, path: str = ".") -> bool:
+        """Checks if the given path is inside a Git repository (including submodules and worktrees)."""
+        return discover_repository(path) is not None
+
+    def is_repo_root(self, path: str = ".") -> bool:
+        """Checks if the given path is itself the top level of a Git repository."""
+        return is_worktree_root(path)
+
+    def get_location(self, path: str = ".") -> RepoLocation:
+        """
+        Finds the worktree root, git directory and superproject root for a path,
+        without running git.
+
+        Raises:
+            GitError: If the path is not inside a Git repository.
+        """
+        location = discover_repository(path)
+        if location is None:
+            raise GitError(f"'{os.path.abspath(path)}' is not inside a Git repository.")
+        return location
+
+    async def init(self, path: str = "."):
+        """Initializes a new Git repository in the specified path."""
+        await self._run_command(["git", "init"], cwd=path)
+        self._invalidate(path=path)
+
+    async def add_remote(self, remote_url: str, path: str = "."):
+        """Adds a new remote named 'origin'."""
+        await self._run_command(["git", "remote", "add", "origin", remote_url], cwd=path)
+
+    async def pull(self, branch_name: str, path: str = ".", progress: Optional[ProgressCallback] = None):
+        """Pulls a branch from the 'origin' remote (reporting transfer progress to the callback, if given)."""
+        await self._transfer(["git", "pull", "origin", branch_name], path, progress)
+        # A pull can bring in changes to .gitmodules, and new tags
+        self._invalidate("submodules", "tags", path=path)
+
+    async def create_branch(self, branch_name: str, start_point: str = "HEAD", path: str = "."):
+        """Creates a new branch from a starting point."""
+        await self._run_command(["git", "branch", branch_name, start_point], cwd=path)
+
+    async def switch_branch(self, branch_name: str, path: str = "."):
+        """Switches to an existing branch."""
+        await self._run_command(["git", "checkout", branch_name], cwd=path)
+        self._invalidate("branch", "submodules", path=path)
+
+    async def push_branch(self, branch_name: str, set_upstream: bool = False, path: str = ".", progress: Optional[ProgressCallback] = None):
+        """Pushes a branch to the 'origin' remote."""
+        cmd = ["git", "push", "origin", branch_name]
+        if set_upstream:
+            cmd.insert(2, "-u")
+        await self._transfer(cmd, path, progress)
+
+    async def fetch(self, remote: str = "origin", path: str = ".", progress: Optional[ProgressCallback] = None):
+        """Fetches updates from a remote repository."""
+        await self._transfer(["git", "fetch", remote], path, progress)
+
+    async def clone(self, clone_url: str, repo_name: str, target_dir: str = ".", progress: Optional[ProgressCallback] = None) -> str:
+        """
+        Clones a repository into a specific target directory.
+        'git clone' will create a new folder named after the repo inside the target_dir.
+        """
+        abs_target_dir = os.path.abspath(target_dir)
+        final_repo_path = os.path.join(abs_target_dir, repo_name)
+
+        if os.path.exists(final_repo_path):
+            raise GitError(f"Destination path '{final_repo_path}' already exists.")
+
+        try:
+            os.makedirs(abs_target_dir, exist_ok=True)
+        except OSError as e:
+            raise GitError(f"Could not create target directory '{abs_target_dir}': {e}")
+
+        await self._transfer(["git", "clone", clone_url], abs_target_dir, progress)
+        return final_repo_path
+
+    async def add_submodule(self, repo_url: str, path: str, parent_path: str = "."):
+        """Adds a new Git submodule."""
+        await self._run_command(["git", "submodule", "add", repo_url, path], cwd=parent_path)
+        self._invalidate("submodules", path=parent_path)
+
+    async def add(self, files: list[str], path: str = "."):
+        """Adds file contents to the index."""
+        await self._run_command(["git", "add"] + files, cwd=path)
+        # Staging can add or remove gitlinks
+        self._invalidate("submodules", path=path)
+
+    async def commit(self, message: str, path: str = "."):
+        """Records changes to the repository."""
+        # A commit changes none of the memoized lookups (root, submodules, branch)
+        await self._run_command(["git", "commit", "-m", message], cwd=path)
+
+    async def has_staged_changes(self, path: str = ".") -> bool:
+        """Checks whether the index contains changes that are ready to be committed."""
+        return bool(await self._run_command(["git", "diff", "--cached", "--name-only"], cwd=path))
+
+    def get_root(self, path: str = ".") -> str:
+        """Finds the root directory of the git repository."""
+        return self.get_location(path).worktree_root
+
+    async def get_submodules(self, path: str = ".", recursive: bool = False) -> list[str]:
+        """
+        Gets a list of submodule paths.
+        With recursive=True, nested submodules are included (relative to path).
+        """
+        try:
+            # This command lists submodules, e.g., " 1234abcd... path/to/submodule (HEAD)"
+            cmd = ["git", "submodule", "status"]
+            if recursive:
+                cmd.append("--recursive")
+            status_output = await self._run_command(cmd, cwd=path)
+            if not status_output:
+                return []
+            # Extract just the path part
+            return [line.strip().split()[1] for line in status_output.splitlines()]
+        except GitError:
+            # If the command fails (e.g., no submodules), return an empty list
+            return []
+
+    async def get_current_branch(self, path: str = ".") -> str:
+        """Gets the name of the current active branch."""
+        return await self._run_command(["git", "rev-parse", "--abbrev-ref", "HEAD"], cwd=path)
+
+    async def push_all(self, path: str = ".", progress: Optional[ProgressCallback] = None):
+        """Pushes all branches to the remote."""
+        await self._transfer(["git", "push", "--all"], path, progress)
+
+    async def get_status(self, path: str = ".") -> RepoStatus:
+        """
+        Gets the detailed status of the repository at the given path, including
+        lists of files for each state.
+
+        Uses a single `git status --porcelain=v2 --branch -z` call, so the branch,
+        upstream and ahead/behind counts come from the same process as the file list.
+        """
+        parser = StatusParser()
+        async for record in self._stream_command(["git", "status", "--porcelain=v2", "--branch", "-z"], cwd=path):
+            parser.feed(record)
+        return parser.close()
+
+    async def get_tree_status(self, path: str = ".", with_remotes: bool = False, jobs: int = 2) -> list[RepoStatus]:
+        """
+        Gets the status of a repository and all of its submodules (recursively).
+
+        With jobs of 2 or less, it takes two git invocations instead of one or
+        more per repository:
+        - `git status --porcelain=v2` for the repository itself;
+        - one `git submodule foreach --recursive` pass that emits the same
+          output for every checked-out submodule, separated by marker headers.
+        The foreach pass visits submodules one after another, so with more jobs
+        the checked-out submodules (read from .gitmodules, without git) get a
+        `git status` each instead, with at most 'jobs' of them running at once.
+
+        Args:
+            path (str): The path to the superproject.
+            with_remotes (bool): Also fill in each repository's 'origin' URL.
+            jobs (int): The number of git status processes to run at once
+                        (with 2, the root and the foreach pass run concurrently).
+
+        Returns:
+            list[RepoStatus]: The root (path '.') followed by every submodule in
+            recursive order, each with its path relative to the superproject.
+            A submodule whose status could not be read has its 'error' set.
+        """
+        async def _repo_status(repo_path: str, relative_path: str) -> RepoStatus:
+            try:
+                repo_status = await self.get_status(repo_path)
+            except GitError:
+                if relative_path == ".":
+                    raise
+                return RepoStatus(branch="HEAD", path=relative_path, error="Could not read the status of this submodule.")
+            repo_status.path = relative_path
+            if with_remotes:
+                try:
+                    repo_status.remote_url = await self.get_remote_url(path=repo_path)
+                except GitError:
+                    repo_status.remote_url = None
+            return repo_status
+
+        async def _submodule_pass() -> list[RepoStatus]:
+            # Shell snippet run inside every submodule; '\0' keeps the output NUL-delimited
+            script = f"printf '{REPO_MARKER}%s\\0' \"$displaypath\"; "
+            if with_remotes:
+                script += "printf '# gfr.remote %s\\0' \"$(git config --get remote.origin.url)\"; "
+            script += (
+                "git status --porcelain=v2 --branch -z 2>/dev/null"
+                " || printf '# gfr.error %s\\0' 'Could not read the status of this submodule.'"
+            )
+            command = ["git", "submodule", "foreach", "--quiet", "--recursive", script]
+            parser = StatusParser(tree=True)
+            statuses = []
+            async for record in self._stream_command(command, cwd=path):
+                finished = parser.feed(record)
+                if finished is not None:
+                    statuses.append(finished)
+            last = parser.close()
+            return statuses + [last] if last is not None else statuses
+
+        if jobs > 2:
+            root = self.get_root(path)
+            # In foreach's order: by path, each submodule followed by its nested ones
+            submodules = sorted(load_submodules(root, recursive=True), key=lambda submodule: submodule.path.split("/"))
+            submodule_paths = [os.path.join(root, submodule.path) for submodule in submodules]
+            # Like foreach, skip submodules that aren't checked out
+            repo_paths = [os.path.abspath(path)] + [sub for sub in submodule_paths if is_worktree_root(sub)]
+            slots = asyncio.Semaphore(jobs)
+
+            async def _bounded(repo_path: str) -> RepoStatus:
+                async with slots:
+                    relative_path = os.path.relpath(repo_path, path).replace(os.sep, "/")
+                    return await _repo_status(repo_path, relative_path)
+
+            return list(await asyncio.gather(*(_bounded(repo_path) for repo_path in repo_paths)))
+
+        if jobs == 2:
+            root, submodules = await asyncio.gather(_repo_status(path, "."), _submodule_pass())
+        else:
+            root, submodules = await _repo_status(path, "."), await _submodule_pass()
+        return [root] + submodules
+
+    async def get_remote_url(self, remote_name: str = "origin", path: str = ".") -> str:
+        """
+        Gets the URL of a specified remote.
+        Read straight from the repository's config file; git is only asked
+        when the remote is not defined there (e.g. it comes from an include).
+        """
+        location = discover_repository(path)
+        if location is not None:
+            config = read_git_config(os.path.join(location.common_dir, "config"))
+            url = config.get(("remote", remote_name), {}).get("url")
+            if url:
+                return url
+        return await self._run_command(["git", "config", "--get", f"remote.{remote_name}.url"], cwd=path)
+
+    async def delete_remote_branch(self, branch_name: str, remote_name: str = "origin", path: str = "."):
+        """Deletes a branch from the specified remote."""
+        await self._run_command(["git", "push", remote_name, "--delete", branch_name], cwd=path)
+
+    async def delete_local_branch(self, branch_name: str, force: bool = False, path: str = "."):
+        """Deletes a local branch."""
+        cmd = ["git", "branch", "-d", branch_name]
+        if force:
+            cmd[2] = "-D"
+        # Git refuses to delete the checked-out branch, so the memoized branch stays valid
+        await self._run_command(cmd, cwd=path)
+
+    async def _iter_log_chunks(self, rev_range: str = "HEAD", path: str = ".") -> AsyncIterator[list[LogEntry]]:
+        """Streams the parsed commits of a revision range, one list per chunk of output (see iter_log)."""
+        command = ["git", "log", f"--format={LOG_FORMAT}", rev_range, "--"]
+        async for records in self._stream_chunks(command, cwd=path, separator=RECORD_SEPARATOR):
+            entries = [entry for entry in map(parse_log_record, records) if entry is not None]
+            if entries:
+                yield entries
+
+    async def iter_log(self, rev_range: str = "HEAD", path: str = ".") -> AsyncIterator[LogEntry]:
+        """
+        Streams the commits in a revision range (e.g. 'v1.0.0..v1.1.0'), newest first.
+
+        Uses a single `git log` with control-character separators, parsed as
+        the output arrives, so large ranges cost no extra memory or round trips.
+        """
+        async for entries in self._iter_log_chunks(rev_range, path):
+            for entry in entries:
+                yield entry
+
+    def get_tag_index(self, path: str = ".") -> TagIndex:
+        """Builds a semver index of the repository's tags, reading refs in-process."""
+        return TagIndex(read_tag_names(self.get_location(path).common_dir))
+
+    def get_latest_tag(self, path: str = ".") -> str | None:
+        """
+        Gets the latest version tag from the repository using semantic version sorting.
+        Returns None if no tags are found.
+        """
+        index = self.context.get_tag_index(path) if self.context else self.get_tag_index(path)
+        return index.latest()
+
+    async def create_tag(self, tag_name: str, message: str, path: str = "."):
+        """Creates a new annotated tag."""
+        await self._run_command(["git", "tag", "-a", tag_name, "-m", message], cwd=path)
+        self._invalidate("tags", path=path)
+
+    async def push_tags(self, path: str = "."):
+        """Pushes all tags to the remote."""
+        await self._run_command(["git", "push", "--tags"], cwd=path)
+
+class _GitLoop:
+    """An event loop on a daemon thread, running the git calls of synchronous code."""
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, name="gfr-git", daemon=True)
+        self.thread.start()
+
+_git_loop: Optional[_GitLoop] = None
+_git_loop_lock = threading.Lock()
+
+def _forget_git_loop():
+    # A forked child (see gfr.daemon) has the loop object but not its thread
+    global _git_loop, _git_loop_lock
+    _git_loop = None
+    _git_loop_lock = threading.Lock()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_git_loop)
+
+def _get_git_loop() -> _GitLoop:
+    global _git_loop
+    with _git_loop_lock:
+        if _git_loop is None:
+            _git_loop = _GitLoop()
+        return _git_loop
+
+def run_sync(awaitable: Awaitable[T]) -> T:
+    """
+    Runs a coroutine on the shared git event loop and waits for its result.
+
+    All synchronous callers, including worker threads, share the loop, so
+    MAX_GIT_PROCESSES caps git processes for the whole process. The caller's
+    context (e.g. the current profiling span) is carried over. If the wait
+    is interrupted (Ctrl+C), the coroutine is cancelled and its git process
+    killed before the exception propagates.
+
+    Raises:
+        RuntimeError: When called from a coroutine on the git loop itself;
+                      such code must await instead.
+    """
+    git_loop = _get_git_loop()
+    if threading.current_thread() is git_loop.thread:
+        if asyncio.iscoroutine(awaitable):
+            awaitable.close()
+        raise RuntimeError("run_sync() was called on the git event loop; await the coroutine instead.")
+    finished = threading.Event()
+
+    async def _guarded() -> T:
+        try:
+            return await awaitable
+        finally:
+            finished.set()
+
+    future: Future = asyncio.run_coroutine_threadsafe(_guarded(), git_loop.loop)
+    try:
+        return future.result()
+    except BaseException:
+        if future.cancel():
+            # Give the coroutine a moment to kill its git process
+            finished.wait(timeout=_CLEANUP_TIMEOUT)
+        raise
+
+def iterate_chunks_sync(chunks: AsyncIterator[list[T]]) -> Iterator[T]:
+    """
+    Iterates, from synchronous code, an async iterator of record lists (see
+    AsyncGitOperations._stream_chunks), crossing to the git loop once per
+    chunk rather than once per record. Stopping early closes the iterator,
+    which kills its git process.
+    """
+    _end = object()
+
+    async def _next():
+        try:
+            return await chunks.__anext__()
+        except StopAsyncIteration:
+            return _end
+
+    try:
+        while True:
+            records = run_sync(_next())
+            if records is _end:
+                return
+            yield from records
+    finally:
+        run_sync(chunks.aclose())
@@ -0,0 +1,152 @@
+# gfr/utils/git/context.py
+import os
+import threading
+from typing import Callable, Optional
+
+from .discovery import RepoLocation
+from .operations import GitOperations
+from .submodules import Submodule, load_submodules
+from .tags import TagIndex
+
+class RepoContext:
+    """
+    Memoizes repository lookups (root, submodules, current branch, tags) for the
+    lifetime of a single command.
+
+    The context attaches itself to its GitOperations instance, so mutating
+    operations such as switch_branch or add_submodule drop only the cache
+    entries they affect.
+    """
+    def __init__(self, git_ops: Optional[GitOperations] = None):
+        self.git_ops = git_ops or GitOperations()
+        self.git_ops.context = self
+        self._cache = {}
+        # Commands may look things up from worker threads (e.g. 'acp ALL')
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(kind: str, path: str) -> tuple:
+        return kind, os.path.realpath(path)
+
+    def _memoize(self, kind: str, path: str, loader: Callable):
+        key = self._key(kind, path)
+        with self._lock:
+            if key in self._cache:
+                return self._cache[key]
+        value = loader()
+        with self._lock:
+            self._cache[key] = value
+        return value
+
+    def get_location(self, path: str = ".") -> RepoLocation:
+        """Finds the worktree, git directory and superproject of a path (memoized)."""
+        return self._memoize("root", path, lambda: self.git_ops.get_location(path))
+
+    def get_root(self, path: str = ".") -> str:
+        """Finds the root directory of the git repository (memoized)."""
+        return self.get_location(path).worktree_root
+
+    def get_project_root(self, path: str = ".") -> str:
+        """Finds the root of the whole project: the outermost superproject, or the repository itself."""
+        return self.get_location(path).superproject_root
+
+    def get_submodule_index(self, path: str = ".", recursive: bool = False) -> list[Submodule]:
+        """
+        Gets the submodules (name, path, URL, branch) of the repository containing
+        path, read from its .gitmodules file without running git (memoized).
+        """
+        kind = "submodules-recursive" if recursive else "submodules"
+        return list(self._memoize(kind, path, lambda: load_submodules(self.get_root(path), recursive=recursive)))
+
+    def get_submodule_paths_from_root(self, path: str = ".", recursive: bool = False) -> list[str]:
+        """
+        Gets a list of submodule paths, relative to the repository root rather than
+        to path (memoized). Use resolve_path to run git in one of them.
+        """
+        return [submodule.path for submodule in self.get_submodule_index(path, recursive=recursive)]
+
+    def resolve_path(self, repo_path: str, path: str = ".") -> str:
+        """
+        Turns a path relative to the repository root ('.' for the root itself, or a
+        submodule path) into one usable from the current directory.
+        """
+        return os.path.normpath(os.path.join(self.get_root(path), repo_path))
+
+    def get_current_branch(self, path: str = ".") -> str:
+        """Gets the name of the current active branch (memoized)."""
+        return self._memoize("branch", path, lambda: self.git_ops.get_current_branch(path))
+
+    def get_tag_index(self, path: str = ".") -> TagIndex:
+        """Gets the semver index of the repository's tags (memoized)."""
+        return self._memoize("tags", path, lambda: self.git_ops.get_tag_index(path))
+
+    def invalidate(self, *kinds: str, path: str = "."):
+        """
+        Drops cached entries for a path.
+
+        Args:
+            kinds: The kinds to drop ('root', 'submodules', 'branch', 'tags').
+                   Dropping 'submodules' also drops the recursive listing.
+                   With no kinds, every entry for the path is dropped.
+            path: The repository path the entries belong to.
+        """
+        real_path = os.path.realpath(path)
+        kinds = set(kinds)
+        if "submodules" in kinds:
+            kinds.add("submodules-recursive")
+        with self._lock:
+            for key in list(self._cache):
+                if key[1] == real_path and (not kinds or key[0] in kinds):
+                    del self._cache[key]
+
+    def preload(self, entries: dict):
+        """
+        Adds entries computed elsewhere (see snapshot), e.g. by the 'ggg daemon'
+        process that keeps them up to date between commands.
+        """
+        with self._lock:
+            self._cache.update(entries)
+
+    def snapshot(self) -> dict:
+        """Returns a copy of the cached entries, keyed by (kind, real path)."""
+        with self._lock:
+            return dict(self._cache)
+
+    def clear(self):
+        """Drops every cached entry."""
+        with self._lock:
+            self._cache.clear()
+
+
+_current_context: Optional[RepoContext] = None
+_current_context_lock = threading.Lock()
+# Kept across resets, so commands run back to back (see 'ggg batch') share one instance
+_shared_git_ops: Optional[GitOperations] = None
+# Entries every new context starts with (see set_context_seed)
+_seed: dict = {}
+
+def get_repo_context() -> RepoContext:
+    """Returns the context of the running command, creating it on first use."""
+    global _current_context, _shared_git_ops
+    with _current_context_lock:
+        if _current_context is None:
+            _current_context = RepoContext(_shared_git_ops)
+            _shared_git_ops = _current_context.git_ops
+            if _seed:
+                _current_context.preload(_seed)
+        return _current_context
+
+def reset_repo_context():
+    """Discards the current context so the next command starts with a fresh one."""
+    global _current_context
+    with _current_context_lock:
+        _current_context = None
+
+def set_context_seed(entries: dict):
+    """
+    Sets entries that every new context starts with. Used by 'ggg daemon',
+    which validates them against the files on disk before each command.
+    """
+    global _seed
+    with _current_context_lock:
+        _seed = dict(entries)
@@ -0,0 +1,109 @@
+# gfr/utils/git/discovery.py
+import os
+from dataclasses import dataclass
+from typing import Optional
+
+from .submodules import load_submodules
+
+@dataclass
+class RepoLocation:
+    """Where a repository lives on disk, as found by discover_repository."""
+    # Top-level directory of the working tree (what `git rev-parse --show-toplevel` prints)
+    worktree_root: str
+    # The repository's git directory (a '.git' folder, '.git/modules/<name>' or '.git/worktrees/<name>')
+    git_dir: str
+    # The directory holding shared data such as config and refs (differs from git_dir for linked worktrees)
+    common_dir: str
+    # Worktree root of the outermost superproject; equal to worktree_root when not inside a submodule
+    superproject_root: str
+
+    @property
+    def is_submodule(self) -> bool:
+        return self.superproject_root != self.worktree_root
+
+def discover_repository(start: str = ".") -> Optional[RepoLocation]:
+    """
+    Finds the repository containing a path without running git.
+
+    Walks up from the path until it finds a '.git' directory or a '.git' file
+    (used by submodules and linked worktrees), following 'gitdir:' indirection
+    and 'commondir' links. It then keeps walking to find the superproject, if
+    the repository is registered as a submodule of an enclosing repository.
+    Respects GIT_CEILING_DIRECTORIES.
+
+    Args:
+        start (str): The path to start from (a file or directory).
+
+    Returns:
+        RepoLocation, or None if the path is not inside a Git repository.
+    """
+    found = _find_worktree(os.path.realpath(start))
+    if found is None:
+        return None
+    worktree_root, git_dir = found
+
+    common_dir = git_dir
+    commondir_file = os.path.join(git_dir, "commondir")
+    if os.path.isfile(commondir_file):
+        with open(commondir_file, "r", encoding="utf-8") as f:
+            common_dir = os.path.normpath(os.path.join(git_dir, f.read().strip()))
+
+    return RepoLocation(
+        worktree_root=worktree_root,
+        git_dir=git_dir,
+        common_dir=common_dir,
+        superproject_root=_find_superproject_root(worktree_root),
+    )
+
+def is_worktree_root(path: str) -> bool:
+    """Checks whether path is itself the top level of a working tree (not just inside one)."""
+    return _git_dir_at(os.path.realpath(path)) is not None
+
+def _find_worktree(path: str) -> Optional[tuple[str, str]]:
+    """Walks up from path to the nearest worktree root. Returns (worktree_root, git_dir)."""
+    ceilings = {
+        os.path.abspath(ceiling)
+        for ceiling in os.getenv("GIT_CEILING_DIRECTORIES", "").split(os.pathsep)
+        if ceiling
+    }
+    current = path if os.path.isdir(path) else os.path.dirname(path)
+    while True:
+        git_dir = _git_dir_at(current)
+        if git_dir is not None:
+            return current, git_dir
+        parent = os.path.dirname(current)
+        if parent == current or parent in ceilings:
+            return None
+        current = parent
+
+def _git_dir_at(directory: str) -> Optional[str]:
+    """Returns the git directory for a worktree rooted at directory, if there is one."""
+    dot_git = os.path.join(directory, ".git")
+    if os.path.isdir(dot_git):
+        # Require HEAD so stray empty '.git' folders are not mistaken for repositories
+        return dot_git if os.path.exists(os.path.join(dot_git, "HEAD")) else None
+    if os.path.isfile(dot_git):
+        try:
+            with open(dot_git, "r", encoding="utf-8") as f:
+                content = f.read().strip()
+        except OSError:
+            return None
+        if content.startswith("gitdir:"):
+            return os.path.normpath(os.path.join(directory, content[len("gitdir:"):].strip()))
+    return None
+
+def _find_superproject_root(worktree_root: str) -> str:
+    """
+    Walks outwards while each enclosing repository lists the current one as a
+    submodule in its .gitmodules, and returns the outermost such repository.
+    """
+    root = worktree_root
+    while True:
+        enclosing = _find_worktree(os.path.dirname(root))
+        if enclosing is None:
+            return root
+        enclosing_root = enclosing[0]
+        relative_path = os.path.relpath(root, enclosing_root).replace(os.sep, "/")
+        if relative_path not in {submodule.path for submodule in load_submodules(enclosing_root)}:
+            return root
+        root = enclosing_root
@@ -0,0 +1,71 @@
+# gfr/utils/git/gitconfig.py
+import re
+from typing import Optional
+
+_SECTION_RE = re.compile(r'^\[\s*([A-Za-z0-9.-]+)(?:\s+"((?:[^"\\]|\\.)*)")?\s*\]')
+_ESCAPES = {"n": "\n", "t": "\t", "b": "\b", "\\": "\\", '"': '"'}
+
+def parse_git_config(text: str) -> dict[tuple[str, Optional[str]], dict[str, str]]:
+    """
+    Parses the git config file format used by .git/config and .gitmodules.
+
+    Supports subsections ([submodule "name"]), quoted values with escapes,
+    '#'/';' comments and backslash line continuations. Section and key names
+    are lower-cased, as git treats them case-insensitively; subsection names
+    are kept as-is. For repeated keys, the last value wins.
+
+    Returns:
+        A mapping of (section, subsection) to a mapping of key to value.
+    """
+    sections: dict[tuple[str, Optional[str]], dict[str, str]] = {}
+    current = None
+    lines = iter(text.splitlines())
+
+    for line in lines:
+        # Join continuation lines
+        while line.endswith("\\") and not line.endswith("\\\\"):
+            line = line[:-1] + next(lines, "")
+        stripped = line.strip()
+        if not stripped or stripped[0] in "#;":
+            continue
+
+        match = _SECTION_RE.match(stripped)
+        if match:
+            section, subsection = match.group(1).lower(), match.group(2)
+            if subsection is not None:
+                subsection = re.sub(r'\\(.)', r'\1', subsection)
+            current = sections.setdefault((section, subsection), {})
+            continue
+
+        if current is None:
+            continue
+        key, separator, raw_value = stripped.partition("=")
+        # A key without '=' is a boolean 'true'
+        current[key.strip().lower()] = _parse_value(raw_value) if separator else "true"
+
+    return sections
+
+def _parse_value(raw: str) -> str:
+    """Unquotes a config value and drops a trailing comment outside quotes."""
+    value = []
+    in_quotes = False
+    chars = iter(raw.strip())
+    for char in chars:
+        if char == '"':
+            in_quotes = not in_quotes
+        elif char == "\\":
+            escaped = next(chars, "")
+            value.append(_ESCAPES.get(escaped, escaped))
+        elif char in "#;" and not in_quotes:
+            break
+        else:
+            value.append(char)
+    return "".join(value).strip()
+
+def read_git_config(path: str) -> dict[tuple[str, Optional[str]], dict[str, str]]:
+    """Reads and parses a git config file. A missing file parses as empty."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return parse_git_config(f.read())
+    except FileNotFoundError:
+        return {}
@@ -0,0 +1,29 @@
+# gfr/utils/git/log.py
+from dataclasses import dataclass
+
+# Fields are separated by the ASCII unit separator and records by the record
+# separator, so subjects can contain anything except those two control bytes.
+FIELD_SEPARATOR = "\x1f"
+RECORD_SEPARATOR = "\x1e"
+LOG_FORMAT = FIELD_SEPARATOR.join(["%H", "%P", "%an", "%s"]) + RECORD_SEPARATOR
+
+@dataclass
+class LogEntry:
+    """One commit from `git log`."""
+    sha: str
+    parents: list[str]
+    author: str
+    subject: str
+
+    @property
+    def is_merge(self) -> bool:
+        return len(self.parents) > 1
+
+def parse_log_record(record: str) -> LogEntry | None:
+    """Parses one record produced with LOG_FORMAT. Returns None for the empty tail record."""
+    # git puts a newline between records, which ends up at the start of the next one
+    record = record.lstrip("\n")
+    if not record:
+        return None
+    sha, parents, author, subject = record.split(FIELD_SEPARATOR, 3)
+    return LogEntry(sha=sha, parents=parents.split(), author=author, subject=subject)
@@ -1,217 +1,191 @@
-import subprocess
-import sys
-import os
+from typing import Iterator, Optional
 from .exceptions import GitError
 from .repo_status import RepoStatus
+from .discovery import RepoLocation
+from .log import LogEntry
+from .progress import ProgressCallback
+from .tags import TagIndex
+from .async_operations import AsyncGitOperations, iterate_chunks_sync, run_sync
 
 class GitOperations:
     """
     Handles the execution of local Git commands.
+
+    A synchronous front for AsyncGitOperations: every git call runs on the
+    shared git event loop (see async_operations.run_sync), so calls made from
+    worker threads share one cap on running git processes. Async code should
+    use the AsyncGitOperations in 'aio' directly.
     """
 
+    def __init__(self, timeout: Optional[float] = None):
+        """
+        Args:
+            timeout: Seconds a single git call may take before it is killed
+                     (None waits forever).
+        """
+        self.aio = AsyncGitOperations(timeout)
+
+    @property
+    def context(self):
+        """The RepoContext whose memoized lookups mutating operations invalidate (set by RepoContext)."""
+        return self.aio.context
+
+    @context.setter
+    def context(self, value):
+        self.aio.context = value
+
     def _run_command(self, command: list[str], cwd: str = ".", strip: bool = True):
         """
         A private helper to run git commands and handle errors.
 
-        Args:
-            command (list[str]): The command to execute.
-            cwd (str): The working directory to run the command in.
-
         Raises:
             GitError: If the command fails.
         """
-        try:
-            # Resolve the path to an absolute path for consistency
-            abs_cwd = os.path.abspath(cwd)         
-            process = subprocess.Popen(
-                command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                cwd=abs_cwd
-            )
-            stdout, stderr = process.communicate()
-
-            if process.returncode != 0:
-                raise GitError(f"Git command failed: {command}\nError: {stderr.strip()}")
-            if strip:
-                return stdout.strip()
-            else:
-                return stdout
-
-        except FileNotFoundError:
-            raise GitError("`git` command not found. Is Git installed and in your PATH?")
-        except Exception as e:
-            raise GitError(f"An unexpected error occurred: {e}")
+        return run_sync(self.aio._run_command(command, cwd, strip))
 
     def is_git_repo(self, path: str = ".") -> bool:
-        """Checks if the given path is a Git repository."""
-        abs_path = os.path.abspath(path)
-        return os.path.isdir(os.path.join(abs_path, ".git"))
+        """Checks if the given path is inside a Git repository (including submodules and worktrees)."""
+        return self.aio.is_git_repo(path)
+
+    def is_repo_root(self, path: str = ".") -> bool:
+        """Checks if the given path is itself the top level of a Git repository."""
+        return self.aio.is_repo_root(path)
+
+    def get_location(self, path: str = ".") -> RepoLocation:
+        """
+        Finds the worktree root, git directory and superproject root for a path,
+        without running git.
+
+        Raises:
+            GitError: If the path is not inside a Git repository.
+        """
+        return self.aio.get_location(path)
 
     def init(self, path: str = "."):
         """Initializes a new Git repository in the specified path."""
-        self._run_command(["git", "init"], cwd=path)
+        run_sync(self.aio.init(path))
 
     def add_remote(self, remote_url: str, path: str = "."):
         """Adds a new remote named 'origin'."""
-        self._run_command(["git", "remote", "add", "origin", remote_url], cwd=path)
+        run_sync(self.aio.add_remote(remote_url, path))
 
-    def pull(self, branch_name: str, path: str = "."):
-        """Pulls a branch from the 'origin' remote."""
-        self._run_command(["git", "pull", "origin", branch_name], cwd=path)
+    def pull(self, branch_name: str, path: str = ".", progress: Optional[ProgressCallback] = None):
+        """
+        Pulls a branch from the 'origin' remote. With a progress callback,
+        git's transfer progress is reported as it arrives (on the git loop's thread).
+        """
+        run_sync(self.aio.pull(branch_name, path, progress))
 
     def create_branch(self, branch_name: str, start_point: str = "HEAD", path: str = "."):
         """Creates a new branch from a starting point."""
-        self._run_command(["git", "branch", branch_name, start_point], cwd=path)
+        run_sync(self.aio.create_branch(branch_name, start_point, path))
 
     def switch_branch(self, branch_name: str, path: str = "."):
         """Switches to an existing branch."""
-        self._run_command(["git", "checkout", branch_name], cwd=path)
+        run_sync(self.aio.switch_branch(branch_name, path))
 
-    def push_branch(self, branch_name: str, set_upstream: bool = False, path: str = "."):
+    def push_branch(self, branch_name: str, set_upstream: bool = False, path: str = ".", progress: Optional[ProgressCallback] = None):
         """Pushes a branch to the 'origin' remote."""
-        cmd = ["git", "push", "origin", branch_name]
-        if set_upstream:
-            cmd.insert(2, "-u")
-        self._run_command(cmd, cwd=path)
+        run_sync(self.aio.push_branch(branch_name, set_upstream, path, progress))
 
-    def fetch(self, remote: str = "origin", path: str = "."):
+    def fetch(self, remote: str = "origin", path: str = ".", progress: Optional[ProgressCallback] = None):
         """Fetches updates from a remote repository."""
-        self._run_command(["git", "fetch", remote], cwd=path)
+        run_sync(self.aio.fetch(remote, path, progress))
 
-    def clone(self, clone_url: str, repo_name: str, target_dir: str = ".") -> str:
+    def clone(self, clone_url: str, repo_name: str, target_dir: str = ".", progress: Optional[ProgressCallback] = None) -> str:
         """
         Clones a repository into a specific target directory.
         'git clone' will create a new folder named after the repo inside the target_dir.
         """
-        abs_target_dir = os.path.abspath(target_dir)
-        final_repo_path = os.path.join(abs_target_dir, repo_name)
-
-        if os.path.exists(final_repo_path):
-            raise GitError(f"Destination path '{final_repo_path}' already exists.")
-
-        try:
-            os.makedirs(abs_target_dir, exist_ok=True)
-        except OSError as e:
-            raise GitError(f"Could not create target directory '{abs_target_dir}': {e}")
-
-        self._run_command(["git", "clone", clone_url], cwd=abs_target_dir)
-        return final_repo_path
+        return run_sync(self.aio.clone(clone_url, repo_name, target_dir, progress))
 
     def add_submodule(self, repo_url: str, path: str, parent_path: str = "."):
         """Adds a new Git submodule."""
-        self._run_command(["git", "submodule", "add", repo_url, path], cwd=parent_path)
-        
+        run_sync(self.aio.add_submodule(repo_url, path, parent_path))
+
     def add(self, files: list[str], path: str = "."):
         """Adds file contents to the index."""
-        cmd = ["git", "add"] + files
-        self._run_command(cmd, cwd=path)
+        run_sync(self.aio.add(files, path))
 
     def commit(self, message: str, path: str = "."):
         """Records changes to the repository."""
-        self._run_command(["git", "commit", "-m", message], cwd=path)
-        
+        run_sync(self.aio.commit(message, path))
+
+    def has_staged_changes(self, path: str = ".") -> bool:
+        """Checks whether the index contains changes that are ready to be committed."""
+        return run_sync(self.aio.has_staged_changes(path))
+
     def get_root(self, path: str = ".") -> str:
         """Finds the root directory of the git repository."""
-        return self._run_command(["git", "rev-parse", "--show-toplevel"], cwd=path)
-
-    def get_submodules(self, path: str = ".") -> list[str]:
-        """Gets a list of submodule paths."""
-        try:
-            # This command lists submodules, e.g., " 1234abcd... path/to/submodule (HEAD)"
-            status_output = self._run_command(["git", "submodule", "status"], cwd=path)
-            if not status_output:
-                return []
-            # Extract just the path part
-            return [line.strip().split()[1] for line in status_output.splitlines()]
-        except GitError:
-            # If the command fails (e.g., no submodules), return an empty list
-            return []
-        
+        return self.aio.get_root(path)
+
+    def get_submodules(self, path: str = ".", recursive: bool = False) -> list[str]:
+        """
+        Gets a list of submodule paths, relative to path.
+        With recursive=True, nested submodules are included.
+        """
+        return run_sync(self.aio.get_submodules(path, recursive))
+
     def get_current_branch(self, path: str = ".") -> str:
         """Gets the name of the current active branch."""
-        return self._run_command(["git", "rev-parse", "--abbrev-ref", "HEAD"], cwd=path)
-    
-    def push_all(self, path: str = "."):
+        return run_sync(self.aio.get_current_branch(path))
+
+    def push_all(self, path: str = ".", progress: Optional[ProgressCallback] = None):
         """Pushes all branches to the remote."""
-        self._run_command(["git", "push", "--all"], cwd=path)
-        
-        
+        run_sync(self.aio.push_all(path, progress))
+
     def get_status(self, path: str = ".") -> RepoStatus:
         """
         Gets the detailed status of the repository at the given path, including
-        lists of files for each state.
+        lists of files for each state (see AsyncGitOperations.get_status).
+        """
+        return run_sync(self.aio.get_status(path))
+
+    def get_tree_status(self, path: str = ".", with_remotes: bool = False, jobs: int = 2) -> list[RepoStatus]:
+        """
+        Gets the status of a repository and all of its submodules, recursively,
+        running up to 'jobs' git processes (see AsyncGitOperations.get_tree_status).
+        """
+        return run_sync(self.aio.get_tree_status(path, with_remotes, jobs))
 
-        Args:
-            path (str): The path to the repository.
-
-        Returns:
-            RepoStatus: An object containing the branch and lists of files.
-        """
-        branch = self.get_current_branch(path)
-        status_output = self._run_command(["git", "status", "--porcelain"], cwd=path, strip=False)
-
-        staged_files = []
-        unstaged_files = []
-        untracked_files = []
-
-        if not status_output:
-            return RepoStatus(branch=branch)
-
-        for line in status_output.splitlines():
-            code = line[:2]
-            filename = line[3:]
-
-            if code == '??':
-                untracked_files.append(filename)
-            else:
-                # Staged changes (M, A, D, R, C in the first char)
-                if code[0] != ' ':
-                    staged_files.append(filename)
-                # Unstaged/Modified changes (M, D in the second char)
-                if code[1] != ' ':
-                    unstaged_files.append(filename)
-        
-        return RepoStatus(
-            branch=branch,
-            staged=staged_files,
-            unstaged=unstaged_files,
-            untracked=untracked_files
-        )
-        
     def get_remote_url(self, remote_name: str = "origin", path: str = ".") -> str:
-        """Gets the URL of a specified remote."""
-        return self._run_command(["git", "config", "--get", f"remote.{remote_name}.url"], cwd=path)
-    
+        """
+        Gets the URL of a specified remote.
+        Read straight from the repository's config file; git is only asked
+        when the remote is not defined there (e.g. it comes from an include).
+        """
+        return run_sync(self.aio.get_remote_url(remote_name, path))
+
     def delete_remote_branch(self, branch_name: str, remote_name: str = "origin", path: str = "."):
         """Deletes a branch from the specified remote."""
-        self._run_command(["git", "push", remote_name, "--delete", branch_name], cwd=path)
-        
+        run_sync(self.aio.delete_remote_branch(branch_name, remote_name, path))
+
     def delete_local_branch(self, branch_name: str, force: bool = False, path: str = "."):
         """Deletes a local branch."""
-        cmd = ["git", "branch", "-d", branch_name]
-        if force:
-            cmd[2] = "-D"
-        self._run_command(cmd, cwd=path)
-        
+        run_sync(self.aio.delete_local_branch(branch_name, force, path))
+
+    def iter_log(self, rev_range: str = "HEAD", path: str = ".") -> Iterator[LogEntry]:
+        """
+        Streams the commits in a revision range (e.g. 'v1.0.0..v1.1.0'), newest first,
+        parsed as the output of a single `git log` arrives.
+        """
+        return iterate_chunks_sync(self.aio._iter_log_chunks(rev_range, path))
+
+    def get_tag_index(self, path: str = ".") -> TagIndex:
+        """Builds a semver index of the repository's tags, reading refs in-process."""
+        return self.aio.get_tag_index(path)
+
     def get_latest_tag(self, path: str = ".") -> str | None:
         """
         Gets the latest version tag from the repository using semantic version sorting.
         Returns None if no tags are found.
         """
-        try:
-            # Sorts tags by version number (e.g., v1.10.0 comes after v1.9.0)
-            # and returns the most recent one.
-            return self._run_command(["git", "tag", "-l", "--sort=-v:refname"], cwd=path).splitlines()[0]
-        except (GitError, IndexError):
-            # Fails if no tags exist or command fails
-            return None
-        
+        return self.aio.get_latest_tag(path)
+
     def create_tag(self, tag_name: str, message: str, path: str = "."):
         """Creates a new annotated tag."""
-        self._run_command(["git", "tag", "-a", tag_name, "-m", message], cwd=path)
+        run_sync(self.aio.create_tag(tag_name, message, path))
 
     def push_tags(self, path: str = "."):
         """Pushes all tags to the remote."""
-        self._run_command(["git", "push", "--tags"], cwd=path)
\ No newline at end of file
+        run_sync(self.aio.push_tags(path))
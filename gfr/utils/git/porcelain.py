@@ -0,0 +1,140 @@
+# gfr/utils/git/porcelain.py
+from typing import Iterable, Iterator, Optional
+
+from .repo_status import RepoStatus
+
+# Number of space-separated fields that precede the path in each entry type.
+# See the "Porcelain Format Version 2" section of `git status --help`.
+_FIELDS_BEFORE_PATH = {"1": 8, "2": 9, "u": 10}
+
+# Header that separates repositories in a combined multi-repository stream
+REPO_MARKER = "# gfr.repo "
+
+class StatusParser:
+    """
+    Parses porcelain v2 records pushed to it one at a time with feed(), so
+    callers reading git's output as it arrives (synchronously or from an event
+    loop) never hold it in memory and never need to look ahead.
+
+    With tree=True, the records come from several repositories, each preceded
+    by a '# gfr.repo <path>' header (see parse_tree_status_v2).
+    """
+    def __init__(self, tree: bool = False):
+        self.tree = tree
+        self.status: Optional[RepoStatus] = None if tree else RepoStatus(branch="HEAD")
+        # Path of the last rename/copy entry, waiting for its original path
+        self._renamed_to: Optional[str] = None
+
+    def feed(self, record: str) -> Optional[RepoStatus]:
+        """
+        Applies one record (without its NUL terminator).
+
+        Returns:
+            Optional[RepoStatus]: In tree mode, the previous repository's status
+            once the header of the next one arrives; None otherwise.
+        """
+        if self._renamed_to is not None:
+            # Renames and copies are followed by a separate record with the original path
+            if self.status is not None:
+                self.status.renamed.append((record, self._renamed_to))
+            self._renamed_to = None
+        elif self.tree and record.startswith(REPO_MARKER):
+            finished = self.status
+            self.status = RepoStatus(branch="HEAD", path=record[len(REPO_MARKER):])
+            return finished
+        elif self.status is not None:
+            self._renamed_to = _apply_record(self.status, record)
+        return None
+
+    def close(self) -> Optional[RepoStatus]:
+        """Returns the status of the last (or only) repository."""
+        finished, self.status = self.status, None
+        return finished
+
+def parse_status_v2(records: Iterable[str]) -> RepoStatus:
+    """
+    Parses the NUL-separated records of `git status --porcelain=v2 --branch -z`.
+
+    Records are consumed one at a time, so the output never has to be held in
+    memory as a single string. Paths are taken verbatim, which keeps renames and
+    names with spaces, quotes or newlines intact.
+
+    Args:
+        records (Iterable[str]): The records, without their NUL terminators.
+
+    Returns:
+        RepoStatus: The parsed branch information and file lists.
+    """
+    parser = StatusParser()
+    for record in records:
+        parser.feed(record)
+    return parser.close()
+
+def parse_tree_status_v2(records: Iterable[str]) -> Iterator[RepoStatus]:
+    """
+    Parses the porcelain v2 output of several repositories from one stream.
+
+    Each repository's output must be preceded by a '# gfr.repo <path>' header,
+    optionally followed by '# gfr.remote <url>' or '# gfr.error <message>'
+    headers, as produced by GitOperations.get_tree_status.
+
+    Yields:
+        RepoStatus: One status per repository, in stream order.
+    """
+    parser = StatusParser(tree=True)
+    for record in records:
+        finished = parser.feed(record)
+        if finished is not None:
+            yield finished
+    last = parser.close()
+    if last is not None:
+        yield last
+
+def _apply_record(status: RepoStatus, record: str) -> Optional[str]:
+    """
+    Applies a single porcelain v2 record to the status.
+
+    Returns:
+        Optional[str]: For a rename or copy, its new path; the record that
+        follows holds the original path.
+    """
+    if not record:
+        return None
+    kind = record[0]
+
+    renamed_to = None
+    if kind == "#":
+        _parse_header(status, record)
+    elif kind == "?":
+        status.untracked.append(record[2:])
+    elif kind in _FIELDS_BEFORE_PATH:
+        fields = record.split(" ", _FIELDS_BEFORE_PATH[kind])
+        code, path = fields[1], fields[-1]
+        if kind == "2":
+            renamed_to = path
+        # Staged changes have a status in the first column, unstaged in the second
+        if code[0] != ".":
+            status.staged.append(path)
+        if code[1] != ".":
+            status.unstaged.append(path)
+    # Ignored entries ('!') are only reported when explicitly requested; skip them
+    return renamed_to
+
+def _parse_header(status: RepoStatus, record: str):
+    """Applies a '# branch.*' header line to the status."""
+    _, key, *values = record.split(" ", 2)
+    value = values[0] if values else ""
+
+    if key == "branch.head":
+        # Keep the same value `git rev-parse --abbrev-ref HEAD` reports for a detached HEAD
+        status.branch = "HEAD" if value == "(detached)" else value
+    elif key == "branch.upstream":
+        status.upstream = value
+    elif key == "branch.ab":
+        ahead, behind = value.split(" ")
+        status.ahead = int(ahead.lstrip("+"))
+        status.behind = int(behind.lstrip("-"))
+    elif key == "gfr.remote":
+        status.remote_url = value or None
+    elif key == "gfr.error":
+        status.error = value
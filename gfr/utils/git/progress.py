@@ -0,0 +1,53 @@
+# gfr/utils/git/progress.py
+import re
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+# Lines of git's diagnostics kept for error messages when output is streamed
+DIAGNOSTIC_LINES = 20
+
+# "Receiving objects:  45% (450/1000), 1.20 MiB | 2.40 MiB/s" (with ", done." once finished)
+_COUNTED_RE = re.compile(
+    r"^(?:remote:\s*)?(?P<phase>[A-Z][A-Za-z ]*?):\s+(?P<percent>\d+)%\s+\((?P<completed>\d+)/(?P<total>\d+)\)"
+    r"(?:,(?!\s*done)\s*(?P<detail>.*?))?(?P<done>,\s*done\.?)?\s*$"
+)
+# "Enumerating objects: 1234, done."
+_UNCOUNTED_RE = re.compile(r"^(?:remote:\s*)?(?P<phase>[A-Z][A-Za-z ]*?):\s+(?P<completed>\d+)(?P<done>,\s*done\.?)?\s*$")
+# Servers pad their progress lines with "erase to end of line" sequences
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*[A-Za-z]")
+
+@dataclass
+class GitProgress:
+    """One progress update from a git transfer (clone, fetch, pull, push)."""
+    phase: str
+    completed: int
+    total: Optional[int] = None
+    detail: str = ""
+    done: bool = False
+
+    @property
+    def percent(self) -> Optional[float]:
+        return self.completed * 100 / self.total if self.total else None
+
+ProgressCallback = Callable[[GitProgress], None]
+
+def parse_progress_line(line: str) -> Optional[GitProgress]:
+    """
+    Parses one line of git's --progress output (lines are ended by '\\r'
+    while a phase runs, and by '\\n' when it is done). Returns None for
+    anything else, such as hints, errors and ref updates.
+    """
+    line = _ANSI_RE.sub("", line).strip()
+    match = _COUNTED_RE.match(line)
+    if match:
+        return GitProgress(
+            phase=match.group("phase"),
+            completed=int(match.group("completed")),
+            total=int(match.group("total")),
+            detail=match.group("detail") or "",
+            done=bool(match.group("done")),
+        )
+    match = _UNCOUNTED_RE.match(line)
+    if match:
+        return GitProgress(phase=match.group("phase"), completed=int(match.group("completed")), done=bool(match.group("done")))
+    return None
@@ -0,0 +1,105 @@
+# gfr/utils/git/release_notes.py
+import re
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+from .log import LogEntry
+
+# Changelog sections, in the order used by CHANGELOG.md
+SECTIONS = ("Added", "Changed", "Fixed")
+BRANCH_SECTIONS = {"feature": "Added", "bugfix": "Fixed"}
+
+# 'Add login page (#6)', as written by 'ggg commit' on an issue branch
+_ISSUE_SUFFIX_RE = re.compile(r"\s*\(#(?P<num>\d+)\)$")
+# 'update svc1 with issue number 6: [Add login page]', the parent-repo commit written by 'ggg commit'
+_PARENT_COMMIT_RE = re.compile(r"^update .+? with issue number (?P<num>\d+): \[(?P<msg>.*)\]$")
+_PARENT_COMMIT_NO_ISSUE_RE = re.compile(r"^update .+?: \[(?P<msg>.*)\]$")
+# Any mention of an issue branch, e.g. in merge commits or "Update 'svc1' submodule after finishing 'feature/6-login'"
+_BRANCH_RE = re.compile(r"\b(?P<type>feature|bugfix|hotfix|release)/(?P<num>\d+)-")
+_SUBMODULE_UPDATE_RE = re.compile(r"^Update '.+' submodule after finishing '")
+
+@dataclass
+class NoteItem:
+    """The commits of one issue (or a single commit without an issue)."""
+    issue: Optional[str]
+    subjects: list[str] = field(default_factory=list)
+
+    def __str__(self) -> str:
+        text = "; ".join(self.subjects)
+        return f"{text} (#{self.issue})" if self.issue else text
+
+@dataclass
+class ReleaseNotes:
+    """Commits grouped into changelog sections."""
+    sections: dict[str, list[NoteItem]] = field(default_factory=lambda: {name: [] for name in SECTIONS})
+
+    @property
+    def is_empty(self) -> bool:
+        return not any(self.sections.values())
+
+    def items(self, section: str) -> list[str]:
+        """The entries of one section as changelog lines (without the leading '- ')."""
+        return [str(item) for item in self.sections.get(section, [])]
+
+    def to_markdown(self, heading_level: int = 3) -> str:
+        """Renders the non-empty sections as markdown."""
+        hashes = "#" * heading_level
+        blocks = [
+            f"{hashes} {section}\n" + "\n".join(f"- {item}" for item in items)
+            for section, items in self.sections.items()
+            if items
+        ]
+        return "\n\n".join(blocks)
+
+def build_release_notes(entries: Iterable[LogEntry]) -> ReleaseNotes:
+    """
+    Groups commits into Added / Changed / Fixed.
+
+    Commits are grouped by the issue number 'ggg commit' appends to messages
+    ('... (#6)'). An issue lands in a section according to the type of the
+    branch it was worked on (feature -> Added, bugfix -> Fixed, anything
+    else -> Changed), which is learned from merge commits and submodule
+    update commits mentioning 'feature/6-...'. Those bookkeeping commits are
+    not listed themselves. Commits without an issue are listed under Changed.
+
+    Args:
+        entries: Commits, typically streamed from GitOperations.iter_log.
+    """
+    issues: dict[str, NoteItem] = {}
+    branch_types: dict[str, str] = {}
+    loose: list[NoteItem] = []
+
+    for entry in entries:
+        for match in _BRANCH_RE.finditer(entry.subject):
+            branch_types.setdefault(match.group("num"), match.group("type"))
+        if entry.is_merge or entry.subject.startswith("Merge ") or _SUBMODULE_UPDATE_RE.match(entry.subject):
+            continue
+
+        issue, subject = _split_subject(entry.subject)
+        if issue is None:
+            loose.append(NoteItem(issue=None, subjects=[subject]))
+            continue
+        item = issues.setdefault(issue, NoteItem(issue=issue))
+        if subject not in item.subjects:
+            item.subjects.append(subject)
+
+    notes = ReleaseNotes()
+    # git log lists newest first; changelogs read better oldest first
+    for issue, item in reversed(list(issues.items())):
+        item.subjects.reverse()
+        notes.sections[BRANCH_SECTIONS.get(branch_types.get(issue), "Changed")].append(item)
+    notes.sections["Changed"].extend(reversed(loose))
+    return notes
+
+def _split_subject(subject: str) -> tuple[Optional[str], str]:
+    """Returns (issue number, message) for a commit subject."""
+    match = _PARENT_COMMIT_RE.match(subject)
+    if match:
+        return match.group("num"), match.group("msg")
+    match = _PARENT_COMMIT_NO_ISSUE_RE.match(subject)
+    if match:
+        return None, match.group("msg")
+    match = _ISSUE_SUFFIX_RE.search(subject)
+    if match:
+        return match.group("num"), subject[:match.start()]
+    return None, subject
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import List
+from typing import List, Optional, Tuple
 
 @dataclass
 class RepoStatus:
@@ -7,4 +7,18 @@ class RepoStatus:
     branch: str
     staged: List[str] = field(default_factory=list)
     unstaged: List[str] = field(default_factory=list)
-    untracked: List[str] = field(default_factory=list)
\ No newline at end of file
+    untracked: List[str] = field(default_factory=list)
+    upstream: Optional[str] = None
+    ahead: int = 0
+    behind: int = 0
+    # (original path, new path) for every rename or copy in the index
+    renamed: List[Tuple[str, str]] = field(default_factory=list)
+    # Filled in by bulk inspection (GitOperations.get_tree_status)
+    path: str = "."
+    remote_url: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def is_clean(self) -> bool:
+        """True when there is nothing staged, modified or untracked."""
+        return not (self.staged or self.unstaged or self.untracked)
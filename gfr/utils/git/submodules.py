@@ -0,0 +1,94 @@
+# gfr/utils/git/submodules.py
+import os
+from dataclasses import dataclass, asdict
+from typing import Optional
+
+from .gitconfig import parse_git_config
+from ..cache import cache_key, read_json_cache, write_json_cache
+
+@dataclass
+class Submodule:
+    """A submodule entry from a .gitmodules file."""
+    name: str
+    path: str
+    url: Optional[str] = None
+    branch: Optional[str] = None
+
+def load_submodules(repo_root: str, recursive: bool = False) -> list[Submodule]:
+    """
+    Lists the submodules of a repository by reading its .gitmodules file,
+    without running git.
+
+    Each parsed file is cached on disk and reused until the file's mtime or
+    size changes, so repeated lookups skip parsing entirely.
+
+    Args:
+        repo_root (str): The worktree root of the repository.
+        recursive (bool): Also include nested submodules that are checked out.
+
+    Returns:
+        list[Submodule]: Submodules in file order, with paths relative to repo_root.
+    """
+    submodules = _read_gitmodules(os.path.join(repo_root, ".gitmodules"))
+    if not recursive:
+        return submodules
+
+    result = []
+    for submodule in submodules:
+        result.append(submodule)
+        nested_root = os.path.join(repo_root, submodule.path)
+        for nested in load_submodules(nested_root, recursive=True):
+            nested.path = f"{submodule.path}/{nested.path}"
+            result.append(nested)
+    return result
+
+def _read_gitmodules(gitmodules_path: str) -> list[Submodule]:
+    """Parses one .gitmodules file, going through the on-disk cache."""
+    try:
+        stat = os.stat(gitmodules_path)
+    except OSError:
+        return []
+
+    abs_path = os.path.abspath(gitmodules_path)
+    cache_name = f"submodules-{cache_key(abs_path)}.json"
+    cached = read_json_cache(cache_name)
+    if cached and cached.get("mtime_ns") == stat.st_mtime_ns and cached.get("size") == stat.st_size:
+        return [Submodule(**entry) for entry in cached["submodules"]]
+
+    with open(gitmodules_path, "r", encoding="utf-8") as f:
+        config = parse_git_config(f.read())
+
+    submodules = [
+        Submodule(name=name, path=values["path"], url=values.get("url"), branch=values.get("branch"))
+        for (section, name), values in config.items()
+        if section == "submodule" and name is not None and "path" in values
+    ]
+    write_json_cache(cache_name, {
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "submodules": [asdict(submodule) for submodule in submodules],
+    })
+    return submodules
+
+def resolve_submodule_url(url: str, parent_url: Optional[str]) -> str:
+    """
+    Resolves a relative submodule URL ('../service.git') against the
+    superproject's remote URL, the same way git does. Absolute URLs are returned as-is.
+    """
+    if not parent_url or not url.startswith(("./", "../")):
+        return url
+
+    base = parent_url.rstrip("/")
+    remainder = url
+    while True:
+        if remainder.startswith("./"):
+            remainder = remainder[2:]
+        elif remainder.startswith("../"):
+            remainder = remainder[3:]
+            # Drop the last path component (scp-like URLs use ':' before the path)
+            cut = max(base.rfind("/"), base.rfind(":"))
+            if cut > 0:
+                base = base[:cut + 1] if base[cut] == ":" else base[:cut]
+        else:
+            break
+    return base + remainder if base.endswith(":") else f"{base}/{remainder}"
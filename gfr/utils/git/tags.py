@@ -0,0 +1,145 @@
+# gfr/utils/git/tags.py
+import os
+import re
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Optional
+
+# MAJOR.MINOR.PATCH[-prerelease][+build], with an optional 'v' prefix
+_SEMVER_RE = re.compile(
+    r"^v?(?P<major>0|[1-9]\d*)\.(?P<minor>0|[1-9]\d*)\.(?P<patch>0|[1-9]\d*)"
+    r"(?:-(?P<prerelease>[0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*))?"
+    r"(?:\+(?P<build>[0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*))?$"
+)
+
+@dataclass(frozen=True)
+class Version:
+    """A semantic version, as found in a tag name."""
+    major: int
+    minor: int
+    patch: int
+    prerelease: tuple[str, ...] = ()
+    build: str = ""
+
+    @property
+    def is_prerelease(self) -> bool:
+        return bool(self.prerelease)
+
+    def sort_key(self) -> tuple:
+        """
+        A key that orders versions by semver precedence: a prerelease comes
+        before its release, numeric identifiers compare numerically and before
+        alphanumeric ones, and build metadata is ignored.
+        """
+        prerelease = tuple(
+            (0, int(part), "") if part.isdigit() else (1, 0, part)
+            for part in self.prerelease
+        )
+        return self.major, self.minor, self.patch, 0 if self.prerelease else 1, prerelease
+
+    def bump(self, release_type: str) -> 'Version':
+        """
+        Returns the next 'major', 'minor' or 'patch' release. A prerelease of
+        exactly that release (e.g. 2.0.0-rc.1 for 'major') is finalized instead.
+        """
+        if release_type == "major":
+            if self.prerelease and self.minor == 0 and self.patch == 0:
+                return Version(self.major, 0, 0)
+            return Version(self.major + 1, 0, 0)
+        if release_type == "minor":
+            if self.prerelease and self.patch == 0:
+                return Version(self.major, self.minor, 0)
+            return Version(self.major, self.minor + 1, 0)
+        if self.prerelease:
+            return Version(self.major, self.minor, self.patch)
+        return Version(self.major, self.minor, self.patch + 1)
+
+    def __str__(self) -> str:
+        text = f"{self.major}.{self.minor}.{self.patch}"
+        if self.prerelease:
+            text += "-" + ".".join(self.prerelease)
+        if self.build:
+            text += "+" + self.build
+        return text
+
+def parse_version(tag: str) -> Optional[Version]:
+    """Parses a tag like 'v1.2.3', '1.2.3-rc.1' or 'v2.0.0+build.5'. Returns None if it isn't semver."""
+    match = _SEMVER_RE.match(tag)
+    if not match:
+        return None
+    prerelease = match.group("prerelease")
+    return Version(
+        major=int(match.group("major")),
+        minor=int(match.group("minor")),
+        patch=int(match.group("patch")),
+        prerelease=tuple(prerelease.split(".")) if prerelease else (),
+        build=match.group("build") or "",
+    )
+
+class TagIndex:
+    """
+    The semver tags of a repository, sorted by precedence.
+
+    Built once from the tag names; latest() is O(1) and before() is O(log n),
+    so release commands stay fast with tens of thousands of tags. Tags that
+    are not semantic versions are ignored.
+    """
+    def __init__(self, tag_names: Iterable[str]):
+        entries = sorted(
+            (version.sort_key(), name)
+            for name in tag_names
+            if (version := parse_version(name)) is not None
+        )
+        self._keys = [key for key, _ in entries]
+        self._names = [name for _, name in entries]
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def latest(self) -> Optional[str]:
+        """The tag with the highest version (prereleases included), or None."""
+        return self._names[-1] if self._names else None
+
+    def previous(self) -> Optional[str]:
+        """The tag just below the latest one, or None."""
+        return self._names[-2] if len(self._names) > 1 else None
+
+    def before(self, tag: str) -> Optional[str]:
+        """
+        The highest tag with a lower version than the given tag (which need not
+        exist). Returns None if there is none or the tag isn't semver.
+        """
+        version = parse_version(tag)
+        if version is None:
+            return None
+        position = bisect_left(self._keys, version.sort_key())
+        return self._names[position - 1] if position > 0 else None
+
+def read_tag_names(common_dir: str) -> Iterator[str]:
+    """
+    Lists tag names by reading refs/tags and packed-refs directly, without running git.
+
+    Args:
+        common_dir (str): The repository's common git directory (see RepoLocation).
+    """
+    seen = set()
+    tags_dir = os.path.join(common_dir, "refs", "tags")
+    for directory, _, files in os.walk(tags_dir):
+        for file_name in files:
+            name = os.path.relpath(os.path.join(directory, file_name), tags_dir).replace(os.sep, "/")
+            seen.add(name)
+            yield name
+
+    try:
+        with open(os.path.join(common_dir, "packed-refs"), "r", encoding="utf-8") as f:
+            for line in f:
+                # Skip the header and '^<sha>' lines that peel annotated tags
+                if line.startswith(("#", "^")):
+                    continue
+                _, _, ref = line.rstrip("\n").partition(" ")
+                if ref.startswith("refs/tags/"):
+                    name = ref[len("refs/tags/"):]
+                    if name not in seen:
+                        yield name
+    except FileNotFoundError:
+        pass
@@ -1,34 +1,131 @@
 import os
+import threading
+from typing import Callable, TypeVar
+
 from dotenv import load_dotenv
-from github import Github, GithubException
+from github import Github, GithubException, Organization
 
 # Import the manager and the custom exception
 from .repositories import RepositoryManager, GitHubError
 from .pull_requests import PullRequestManager
 from .issues import IssueManager
+from .http import DEFAULT_API_URL, GitHubSession
+from .ratelimit import RateLimiter
+from ..tracing import span
+
+T = TypeVar("T")
+
+_shared_api = None
+_shared_api_lock = threading.Lock()
 
 class GitHubAPI:
-    """A wrapper for the PyGithub library to handle auth and operations."""
-    def __init__(self):
-        """Initializes the GitHub API client and its managers."""
+    """
+    A wrapper for the PyGithub library to handle auth and operations.
+
+    Creating the client does not touch the network. The organization and user
+    objects are looked up on first use and shared by all managers, so commands
+    that never call GitHub pay no latency and work offline.
+
+    Frequently repeated reads (organization, repositories, labels) go through
+    a GitHubSession with an on-disk conditional-request cache. All calls,
+    including those made through PyGithub objects, are paced by one shared
+    RateLimiter (see GitHubAPI.call).
+    """
+    def __init__(self, base_url: str | None = None):
+        """
+        Initializes the GitHub API client and its managers.
+
+        Args:
+            base_url: The API to talk to, e.g. a local stand-in
+                      (python -m gfr.utils.github.standin). Defaults to
+                      GITHUB_API_URL, then to api.github.com.
+        """
         load_dotenv()
         token = os.getenv("GITHUB_TOKEN")
         self.org_name = os.getenv("GITHUB_ORGANIZATION")
         self.username = os.getenv("GITHUB_USERNAME")
+        # Opt-in: batch pull request create/label/assign/merge into GraphQL requests
+        self.use_graphql = os.getenv("GITHUB_GRAPHQL", "").lower() in ("1", "true", "yes")
 
         if not all([token, self.org_name, self.username]):
             raise GitHubError("Missing credentials in your .env file.")
 
+        api_url = base_url or os.getenv("GITHUB_API_URL") or DEFAULT_API_URL
+        self.limiter = RateLimiter()
+        # Retries are handled by the limiter, so PyGithub's own retry is disabled
+        self._gh = Github(token, base_url=api_url, retry=None)
+        self.http = GitHubSession(token, base_url=api_url, limiter=self.limiter)
+        self._org = None
+        self._user = None
+
+        # --- Initialize and expose managers ---
+        self.repos = RepositoryManager(self._gh, self)
+        self.issues = IssueManager(self._gh, self)
+        self.prs = PullRequestManager(self._gh, self)
+
+    @property
+    def org(self) -> 'Organization':
+        """The configured organization, fetched from GitHub on first access."""
+        if self._org is None:
+            self._org = self._lookup(self._get_organization, self.org_name)
+        return self._org
+
+    @property
+    def user(self) -> 'NamedUser':
+        """The configured user, fetched from GitHub on first access."""
+        if self._user is None:
+            self._user = self._lookup(self._gh.get_user, self.username)
+        return self._user
+
+    def close(self):
+        """
+        Closes pooled HTTP connections. The client stays usable (with the
+        organization and user it already looked up) and reconnects on demand.
+        """
+        self.http.close()
+        self._gh.close()
+
+    def call(self, func: Callable[[], T], idempotent: bool = True, description: str = "GitHub request") -> T:
+        """
+        Runs a PyGithub call through the rate limiter and records the budget
+        GitHub reported for it.
+
+        Args:
+            func: The call to make.
+            idempotent: False for calls that create or change something and must
+                        not be repeated after an unknown outcome (create, merge).
+            description: A short label used in retry messages.
+        """
         try:
-            self._gh = Github(token)
-            self._org = self._gh.get_organization(self.org_name)
-            self._user = self._gh.get_user(self.username)
+            with span(description, "api"):
+                return self.limiter.call(func, idempotent=idempotent, description=description)
+        finally:
+            requester = self._gh.requester
+            self.limiter.update_budget(*requester.rate_limiting, requester.rate_limiting_resettime)
+
+    def _get_organization(self, name: str) -> 'Organization':
+        data, headers = self.http.get_json(f"/orgs/{name}")
+        return self._gh.create_from_raw_data(Organization.Organization, data, headers)
+
+    def _lookup(self, getter, name: str):
+        """Runs a deferred lookup, translating failures into a GitHubError."""
+        try:
+            return getter(name)
         except GithubException as e:
             error_message = f"Authentication or organization lookup failed. Details: {e.data.get('message', 'Unknown error')}"
             error_tip = "\nPlease check your network connection and ensure your GITHUB_TOKEN is correct and has the required permissions."
             raise GitHubError(error_message + error_tip)
 
-        # --- Initialize and expose managers ---
-        self.repos = RepositoryManager(self._gh, self._org)
-        self.issues = IssueManager(self._gh, self._user)
-        self.prs = PullRequestManager(self._gh, self._user)
\ No newline at end of file
+def get_github_api() -> GitHubAPI:
+    """
+    Returns a GitHubAPI shared by every command run in this process.
+
+    A single 'ggg' invocation only ever creates one, but 'ggg batch' runs many
+    commands in one process; sharing the client keeps its HTTP connections,
+    the looked-up organization and the rate-limit budget between them.
+    """
+    global _shared_api
+    with _shared_api_lock:
+        if _shared_api is None:
+            _shared_api = GitHubAPI()
+        return _shared_api
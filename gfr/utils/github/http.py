@@ -0,0 +1,229 @@
+# gfr/utils/github/http.py
+import json
+import os
+import time
+from typing import Any, Optional
+
+import requests
+from github import BadCredentialsException, GithubException, UnknownObjectException
+
+from ..cache import atomic_write, cache_key, get_cache_dir
+from ..tracing import tracer, span
+from .ratelimit import RateLimiter
+
+DEFAULT_API_URL = "https://api.github.com"
+# Seconds a cached response is served without asking GitHub at all
+DEFAULT_CACHE_TTL = 60
+DEFAULT_CACHE_MAX_BYTES = 10 * 1024 * 1024
+
+class HTTPCache:
+    """
+    An on-disk cache of GET responses, keyed by request and revalidated with
+    ETag / Last-Modified.
+
+    Each entry is one JSON file. A hit refreshes the file's mtime, and when the
+    directory grows past max_bytes the least recently used entries are removed.
+    Responses can come from private repositories, so the directory and its
+    files are readable by the owner only.
+    """
+    def __init__(self, directory: str, ttl: float = DEFAULT_CACHE_TTL, max_bytes: int = DEFAULT_CACHE_MAX_BYTES):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        try:
+            # makedirs leaves an existing directory's mode alone, and its mode is masked by the umask
+            os.chmod(directory, 0o700)
+        except OSError:
+            pass
+
+    @classmethod
+    def from_env(cls) -> 'HTTPCache':
+        """Builds the default cache, honouring GFR_HTTP_CACHE_TTL and GFR_HTTP_CACHE_MAX_BYTES."""
+        return cls(
+            os.path.join(get_cache_dir(), "http"),
+            ttl=float(os.getenv("GFR_HTTP_CACHE_TTL", DEFAULT_CACHE_TTL)),
+            max_bytes=int(os.getenv("GFR_HTTP_CACHE_MAX_BYTES", DEFAULT_CACHE_MAX_BYTES)),
+        )
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> Optional[dict]:
+        """Returns a stored entry (marking it as recently used), or None."""
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return entry
+
+    def is_fresh(self, entry: dict) -> bool:
+        """Whether an entry is young enough to be served without revalidating."""
+        return time.time() - entry["stored_at"] < self.ttl
+
+    def put(self, key: str, entry: dict):
+        """Stores an entry and evicts old ones if the cache is over its size limit."""
+        entry["stored_at"] = time.time()
+        try:
+            atomic_write(self._path(key), json.dumps(entry).encode("utf-8"), mode=0o600)
+            self._evict()
+        except OSError:
+            # The cache is best-effort
+            pass
+
+    def _evict(self):
+        """Removes least recently used entries until the cache fits in max_bytes."""
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".json"):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, name))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(os.path.join(self.directory, name))
+            except OSError:
+                pass
+            total -= size
+
+
+class GitHubSession:
+    """
+    A small REST client for GitHub API reads that benefit from caching.
+
+    GET requests go through an HTTPCache: fresh entries are served locally,
+    stale ones are revalidated with If-None-Match / If-Modified-Since, and a
+    304 reply reuses the stored body (GitHub does not count 304s against the
+    rate limit). Requests that do go out are paced by a RateLimiter. Errors
+    are raised as PyGithub exceptions, so callers handle them the same way as
+    errors from PyGithub itself.
+    """
+    def __init__(
+        self,
+        token: str,
+        base_url: Optional[str] = None,
+        cache: Optional[HTTPCache] = None,
+        limiter: Optional[RateLimiter] = None,
+    ):
+        self.base_url = (base_url or DEFAULT_API_URL).rstrip("/")
+        self.cache = cache if cache is not None else HTTPCache.from_env()
+        self.limiter = limiter or RateLimiter()
+        self._token = token
+        self._session = requests.Session()
+        self._session.headers.update({
+            "Authorization": f"token {token}",
+            "Accept": "application/vnd.github+json",
+            "User-Agent": "gfr",
+        })
+
+    def close(self):
+        """Closes pooled connections; later requests open new ones."""
+        self._session.close()
+
+    def get_json(self, path: str) -> tuple[Any, dict]:
+        """
+        Fetches a JSON document from the API.
+
+        Args:
+            path (str): The API path, e.g. '/repos/org/name'.
+
+        Returns:
+            A tuple of (parsed body, response headers).
+
+        Raises:
+            GithubException: If GitHub answers with an error status.
+        """
+        url = f"{self.base_url}{path}"
+        # The token is part of the key so different accounts never share entries
+        key = cache_key(self._token, self._session.headers["Accept"], url)
+        entry = self.cache.get(key)
+        if entry is not None and self.cache.is_fresh(entry):
+            tracer.add_event(f"GET {path}", status="cached")
+            return entry["body"], entry["headers"]
+
+        headers = {}
+        if entry is not None:
+            if entry["headers"].get("etag"):
+                headers["If-None-Match"] = entry["headers"]["etag"]
+            if entry["headers"].get("last-modified"):
+                headers["If-Modified-Since"] = entry["headers"]["last-modified"]
+
+        response = self.limiter.call(lambda: self._send("GET", url, headers=headers), description=f"GET {path}")
+        if response.status_code == 304 and entry is not None:
+            self.cache.put(key, entry)
+            return entry["body"], entry["headers"]
+
+        body = response.json()
+        response_headers = {name.lower(): value for name, value in response.headers.items()}
+        if "etag" in response_headers or "last-modified" in response_headers:
+            self.cache.put(key, {"body": body, "headers": response_headers})
+        return body, response_headers
+
+    def graphql(self, query: str, variables: Optional[dict] = None, idempotent: bool = True) -> dict:
+        """
+        Runs a GraphQL operation (never cached).
+
+        Args:
+            query (str): The GraphQL document.
+            variables (dict): Values for the document's variables.
+            idempotent (bool): False for mutations that must not be repeated.
+
+        Returns:
+            The response's 'data' object.
+
+        Raises:
+            GithubException: On an error status, or if GitHub reports GraphQL errors.
+        """
+        payload = {"query": query, "variables": variables or {}}
+        response = self.limiter.call(
+            lambda: self._send("POST", graphql_url(self.base_url), json=payload),
+            idempotent=idempotent,
+            description="GraphQL request",
+        )
+        body = response.json()
+        if body.get("errors"):
+            message = "; ".join(error.get("message", "Unknown error") for error in body["errors"])
+            raise GithubException(response.status_code, {"message": message, "errors": body["errors"]}, dict(response.headers))
+        return body["data"]
+
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Sends one request, raising error responses as PyGithub exceptions."""
+        path = url[len(self.base_url):] if url.startswith(self.base_url) else url
+        with span(f"{method} {path}", "http", url=url) as current:
+            response = self._session.request(method, url, timeout=15, **kwargs)
+            current.set(status=response.status_code, bytes=len(response.content))
+        if response.status_code >= 400:
+            raise _to_github_exception(response)
+        self.limiter.update(response.headers)
+        return response
+
+
+def graphql_url(base_url: str) -> str:
+    """The GraphQL endpoint for a REST base URL (GitHub Enterprise serves it from /api/graphql)."""
+    base_url = base_url.rstrip("/")
+    if base_url.endswith("/api/v3"):
+        return base_url[:-len("/v3")] + "/graphql"
+    return f"{base_url}/graphql"
+
+def _to_github_exception(response: requests.Response) -> GithubException:
+    """Converts an error response into the matching PyGithub exception."""
+    try:
+        data = response.json()
+    except ValueError:
+        data = {"message": response.text}
+    headers = dict(response.headers)
+    if response.status_code == 401:
+        return BadCredentialsException(response.status_code, data, headers)
+    if response.status_code == 404:
+        return UnknownObjectException(response.status_code, data, headers)
+    return GithubException(response.status_code, data, headers)
@@ -1,13 +1,15 @@
 # gfr/utils/github/issues.py
-from github import Github, GithubException, Repository, AuthenticatedUser
+from github import Github, GithubException, Repository
 from .exceptions import GitHubError
+from ..tracing import traced
 
 class IssueManager:
     """Handles all actions related to GitHub issues."""
-    def __init__(self, gh: Github, user: AuthenticatedUser):
+    def __init__(self, gh: Github, api: 'GitHubAPI'):
         self._gh = gh
-        self._user = user
+        self._api = api
 
+    @traced("github")
     def create(self, repo: Repository.Repository, title: str, body: str, labels: list[str]) -> 'Issue':
         """
         Creates a new issue in a specified repository.
@@ -22,11 +24,15 @@ class IssueManager:
             The created Issue object from PyGithub.
         """
         try:
-            issue = repo.create_issue(
-                title=title,
-                body=body,
-                assignee=self._user,
-                labels=labels
+            issue = self._api.call(
+                lambda: repo.create_issue(
+                    title=title,
+                    body=body,
+                    assignee=self._api.username,
+                    labels=labels
+                ),
+                idempotent=False,
+                description="Creating issue",
             )
             return issue
         except GithubException as e:
@@ -1,12 +1,44 @@
-from github import Github, GithubException, Repository, AuthenticatedUser
+import json
+
+from github import Github, GithubException, Repository
 from .exceptions import GitHubError
+from ..tracing import traced
+
+# Resolves the node IDs needed by the mutations below, in one request.
+# Label lookups are added per call as aliases (label0, label1, ...).
+RESOLVE_TARGETS_QUERY = """
+query ResolvePullRequestTargets($owner: String!, $name: String!, $assignee: String!) {
+  repository(owner: $owner, name: $name) {
+    id
+%(labels)s  }
+  user(login: $assignee) { id }
+}
+"""
+
+CREATE_PULL_REQUEST_MUTATION = """
+mutation CreatePullRequest($repositoryId: ID!, $base: String!, $head: String!, $title: String!, $body: String!) {
+  createPullRequest(input: {repositoryId: $repositoryId, baseRefName: $base, headRefName: $head, title: $title, body: $body}) {
+    pullRequest { id number url }
+  }
+}
+"""
+
+# Mutations in one document run in order, so labels and assignee are set before the merge
+FINALIZE_PULL_REQUEST_MUTATION = """
+mutation FinalizePullRequest($pullRequestId: ID!, $labelIds: [ID!]!, $assigneeIds: [ID!]!) {
+  addLabelsToLabelable(input: {labelableId: $pullRequestId, labelIds: $labelIds}) { clientMutationId }
+  addAssigneesToAssignable(input: {assignableId: $pullRequestId, assigneeIds: $assigneeIds}) { clientMutationId }
+  mergePullRequest(input: {pullRequestId: $pullRequestId}) { pullRequest { merged } }
+}
+"""
 
 class PullRequestManager:
     """Handles all actions related to GitHub Pull Requests."""
-    def __init__(self, gh: Github, user: AuthenticatedUser):
+    def __init__(self, gh: Github, api: 'GitHubAPI'):
         self._gh = gh
-        self._user = user
+        self._api = api
 
+    @traced("github")
     def create(self, repo: Repository.Repository, title: str, body: str, head: str, base: str, labels: list[str]) -> 'PullRequest':
         """
         Creates a new pull request.
@@ -23,21 +55,102 @@ class PullRequestManager:
             The created PullRequest object.
         """
         try:
-            pr = repo.create_pull(
-                title=title,
-                body=body,
-                head=head,
-                base=base
+            pr = self._api.call(
+                lambda: repo.create_pull(
+                    title=title,
+                    body=body,
+                    head=head,
+                    base=base
+                ),
+                idempotent=False,
+                description="Creating pull request",
             )
-            pr.set_labels(*labels)
-            pr.add_to_assignees(self._user)
+            # Setting labels and assignees is safe to repeat
+            self._api.call(lambda: pr.set_labels(*labels), description="Labelling pull request")
+            self._api.call(lambda: pr.add_to_assignees(self._api.username), description="Assigning pull request")
             return pr
         except GithubException as e:
             raise GitHubError(f"Failed to create pull request. Details: {e.data.get('message', 'Unknown error')}")
 
+    @traced("github")
     def merge(self, pr: 'PullRequest'):
         """Merges a pull request."""
         try:
-            pr.merge()
+            self._api.call(pr.merge, idempotent=False, description=f"Merging pull request #{pr.number}")
         except GithubException as e:
             raise GitHubError(f"Failed to merge pull request. Details: {e.data.get('message', 'Unknown error')}")
+
+    @traced("github")
+    def create_and_merge(self, repo_name: str, title: str, body: str, head: str, base: str, labels: list) -> str:
+        """
+        Creates a pull request, labels and assigns it, and merges it.
+
+        With GITHUB_GRAPHQL enabled this takes three GraphQL requests (resolve
+        IDs, create, then label + assign + merge) instead of five or more REST
+        calls. If a label does not exist yet, the REST path is used, since it
+        creates missing labels.
+
+        Args:
+            repo_name: The name of the repository in the configured organization.
+            title: The title of the PR.
+            body: The description/body of the PR.
+            head: The name of the source branch.
+            base: The name of the target branch.
+            labels: Label names or Label objects to apply.
+
+        Returns:
+            The URL of the merged pull request.
+        """
+        label_names = [getattr(label, "name", label) for label in labels]
+        if self._api.use_graphql:
+            try:
+                targets = self._resolve_targets(repo_name, label_names)
+            except GithubException as e:
+                raise GitHubError(f"Failed to look up '{repo_name}' for the pull request. Details: {e.data.get('message', 'Unknown error')}")
+            if targets is not None:
+                return self._create_and_merge_graphql(targets, title, body, head, base)
+
+        repo = self._api.repos.get(repo_name)
+        pr = self.create(repo, title, body, head=head, base=base, labels=label_names)
+        self.merge(pr)
+        return pr.html_url
+
+    def _resolve_targets(self, repo_name: str, label_names: list[str]) -> 'dict | None':
+        """Looks up the repository, label and assignee IDs. Returns None if a label is missing."""
+        label_fields = "".join(f"    label{i}: label(name: {json.dumps(name)}) {{ id }}\n" for i, name in enumerate(label_names))
+        data = self._api.http.graphql(
+            RESOLVE_TARGETS_QUERY % {"labels": label_fields},
+            {"owner": self._api.org_name, "name": repo_name, "assignee": self._api.username},
+        )
+        repository = data.get("repository")
+        if repository is None:
+            raise GitHubError(f"Repository '{repo_name}' not found in organization '{self._api.org_name}'.")
+        label_ids = [(repository.get(f"label{i}") or {}).get("id") for i in range(len(label_names))]
+        if not all(label_ids):
+            return None
+        return {
+            "repository_id": repository["id"],
+            "label_ids": label_ids,
+            "assignee_ids": [data["user"]["id"]] if data.get("user") else [],
+        }
+
+    def _create_and_merge_graphql(self, targets: dict, title: str, body: str, head: str, base: str) -> str:
+        try:
+            data = self._api.http.graphql(
+                CREATE_PULL_REQUEST_MUTATION,
+                {"repositoryId": targets["repository_id"], "base": base, "head": head, "title": title, "body": body},
+                idempotent=False,
+            )
+        except GithubException as e:
+            raise GitHubError(f"Failed to create pull request. Details: {e.data.get('message', 'Unknown error')}")
+
+        pr = data["createPullRequest"]["pullRequest"]
+        try:
+            self._api.http.graphql(
+                FINALIZE_PULL_REQUEST_MUTATION,
+                {"pullRequestId": pr["id"], "labelIds": targets["label_ids"], "assigneeIds": targets["assignee_ids"]},
+                idempotent=False,
+            )
+        except GithubException as e:
+            raise GitHubError(f"Created pull request {pr['url']} but failed to merge it. Details: {e.data.get('message', 'Unknown error')}")
+        return pr["url"]
@@ -0,0 +1,182 @@
+# gfr/utils/github/ratelimit.py
+import random
+import threading
+import time
+from typing import Callable, Mapping, Optional, TypeVar
+
+import requests
+from github import GithubException
+from rich.console import Console
+
+from ..settings import settings
+
+console = Console(stderr=True)
+
+T = TypeVar("T")
+
+class RateLimiter:
+    """
+    Paces GitHub API calls using the rate limit GitHub reports.
+
+    The budget (X-RateLimit-Remaining / -Limit / -Reset) is updated after every
+    call. When it runs out, or GitHub asks us to slow down (429, or a 403 with
+    Retry-After / a secondary rate limit message), every caller waits until the
+    window reopens and the call is sent again.
+
+    Idempotent calls (reads) are additionally retried on server and network
+    errors, with jittered exponential backoff. Non-idempotent calls (create,
+    merge, ...) are never retried after an error that may have reached GitHub;
+    they are only resent after a rate-limit rejection, and run one at a time.
+    """
+    def __init__(
+        self,
+        max_retries: int = 5,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._sleep = sleep
+        self._clock = clock
+
+        self.remaining: Optional[int] = None
+        self.limit: Optional[int] = None
+        self.reset_at: Optional[float] = None
+        # Set after a rate-limit rejection; nobody sends requests before this time
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+
+    def call(self, func: Callable[[], T], idempotent: bool = True, description: str = "GitHub request") -> T:
+        """
+        Runs one API call under the limiter.
+
+        Args:
+            func: The call to make. May raise GithubException or requests errors.
+            idempotent: Whether the call is safe to repeat after an unknown outcome.
+            description: A short label used in messages.
+
+        Returns:
+            Whatever func returns.
+        """
+        if idempotent:
+            return self._call(func, idempotent, description)
+        with self._write_lock:
+            return self._call(func, idempotent, description)
+
+    def _call(self, func: Callable[[], T], idempotent: bool, description: str) -> T:
+        attempt = 0
+        while True:
+            self._wait_for_budget(description)
+            try:
+                return func()
+            except GithubException as e:
+                delay = self._retry_delay_for_error(e, attempt, idempotent)
+                if delay is None:
+                    raise
+            except requests.RequestException:
+                if not idempotent or attempt >= self.max_retries:
+                    raise
+                delay = self._backoff(attempt)
+            attempt += 1
+            if delay > 0:
+                console.print(f"[yellow]{description} failed; retrying in {delay:.1f}s (attempt {attempt}/{self.max_retries})...[/yellow]")
+                self._sleep(delay)
+
+    def update(self, headers: Optional[Mapping[str, str]]):
+        """Updates the budget from response headers (case-insensitive)."""
+        if not headers:
+            return
+        headers = {name.lower(): value for name, value in headers.items()}
+        if "x-ratelimit-remaining" not in headers and "x-ratelimit-reset" not in headers:
+            return
+        with self._lock:
+            if "x-ratelimit-remaining" in headers:
+                self.remaining = int(float(headers["x-ratelimit-remaining"]))
+            if "x-ratelimit-limit" in headers:
+                self.limit = int(float(headers["x-ratelimit-limit"]))
+            if "x-ratelimit-reset" in headers:
+                self.reset_at = float(headers["x-ratelimit-reset"])
+        self.report()
+
+    def update_budget(self, remaining: int, limit: int, reset_at: float):
+        """Updates the budget from values PyGithub already parsed (negative/zero means unknown)."""
+        if limit < 0:
+            return
+        with self._lock:
+            self.remaining, self.limit = remaining, limit
+            if reset_at:
+                self.reset_at = float(reset_at)
+        self.report()
+
+    def report(self):
+        """Prints the remaining budget in verbose mode."""
+        if settings.verbose and self.remaining is not None:
+            reset = time.strftime("%H:%M:%S", time.localtime(self.reset_at)) if self.reset_at else "unknown"
+            console.print(f"[dim]GitHub API budget: {self.remaining}/{self.limit} requests left, resets at {reset}.[/dim]")
+
+    def _wait_for_budget(self, description: str):
+        """Sleeps until a request may be sent."""
+        with self._lock:
+            now = self._clock()
+            wait_until = self._blocked_until
+            if self.remaining == 0 and self.reset_at:
+                wait_until = max(wait_until, self.reset_at)
+            delay = wait_until - now
+        if delay > 0:
+            console.print(f"[yellow]GitHub rate limit reached; {description} will be sent in {delay:.0f}s...[/yellow]")
+            self._sleep(delay)
+            with self._lock:
+                # The window has reopened; the next response refreshes the real numbers
+                if self.remaining == 0:
+                    self.remaining = None
+
+    def _retry_delay_for_error(self, error: GithubException, attempt: int, idempotent: bool) -> Optional[float]:
+        """Returns how long to wait before resending after an error, or None to give up."""
+        if attempt >= self.max_retries:
+            return None
+        self.update(error.headers)
+
+        if self._is_rate_limited(error):
+            delay = self._rate_limit_delay(error.headers or {}, attempt)
+            with self._lock:
+                self._blocked_until = max(self._blocked_until, self._clock() + delay)
+            # The wait itself happens in _wait_for_budget, shared with other callers
+            return 0.0
+        if idempotent and error.status >= 500:
+            return self._backoff(attempt)
+        return None
+
+    def _is_rate_limited(self, error: GithubException) -> bool:
+        if error.status == 429:
+            return True
+        if error.status != 403:
+            return False
+        headers = {name.lower(): value for name, value in (error.headers or {}).items()}
+        message = str((error.data or {}).get("message", "")) if isinstance(error.data, dict) else ""
+        return (
+            "retry-after" in headers
+            or headers.get("x-ratelimit-remaining") == "0"
+            or "rate limit" in message.lower()
+        )
+
+    def _rate_limit_delay(self, headers: Mapping[str, str], attempt: int) -> float:
+        """How long GitHub asks us to wait, falling back to backoff when it doesn't say."""
+        headers = {name.lower(): value for name, value in headers.items()}
+        if "retry-after" in headers:
+            try:
+                return float(headers["retry-after"])
+            except ValueError:
+                pass
+        if headers.get("x-ratelimit-remaining") == "0" and "x-ratelimit-reset" in headers:
+            return max(0.0, float(headers["x-ratelimit-reset"]) - self._clock()) + 1
+        # Secondary limits without hints: GitHub recommends waiting at least a minute
+        return max(60.0, self._backoff(attempt))
+
+    def _backoff(self, attempt: int) -> float:
+        """Exponential backoff with jitter: a random delay in [cap/2, cap]."""
+        cap = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return random.uniform(cap / 2, cap)
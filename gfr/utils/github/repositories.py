@@ -1,22 +1,28 @@
-from github import Github, GithubException, Organization, Repository, UnknownObjectException
+from urllib.parse import quote
 
-# We can keep the custom error here or move it to a shared exceptions file
-class GitHubError(Exception):
-    pass
+from github import Github, GithubException, Label, Repository, UnknownObjectException
+from .exceptions import GitHubError
+from ..tracing import traced
 
 class RepositoryManager:
-    def __init__(self, gh: Github, org: Organization):
+    def __init__(self, gh: Github, api: 'GitHubAPI'):
         self._gh = gh
-        self._org = org
+        self._api = api
 
+    @traced("github")
     def create(self, name: str, description: str, private: bool, readmefile: bool = True) -> 'Repository':
         """Creates a new repository in the configured organization."""
         try:
-            repo = self._org.create_repo(
-                name=name,
-                description=description,
-                private=private,
-                auto_init=readmefile,
+            org = self._api.org
+            repo = self._api.call(
+                lambda: org.create_repo(
+                    name=name,
+                    description=description,
+                    private=private,
+                    auto_init=readmefile,
+                ),
+                idempotent=False,
+                description=f"Creating repository '{name}'",
             )
             return repo
         except GithubException as e:
@@ -25,6 +31,7 @@ class RepositoryManager:
             else:
                 raise GitHubError(f"An API error occurred: {e.data.get('message', 'Unknown error')}")
             
+    @traced("github")
     def get(self, name: str) -> Repository.Repository:
         """
         Retrieves a single repository by its name.
@@ -39,13 +46,16 @@ class RepositoryManager:
             GitHubError: If the repository is not found.
         """
         try:
-            return self._org.get_repo(name)
+            # Fetch by full name so the organization itself never needs to be loaded
+            data, headers = self._api.http.get_json(f"/repos/{self._api.org_name}/{name}")
+            return self._gh.create_from_raw_data(Repository.Repository, data, headers)
         except GithubException as e:
             if e.status == 404:
-                raise GitHubError(f"Repository '{name}' not found in organization '{self._org.login}'.")
+                raise GitHubError(f"Repository '{name}' not found in organization '{self._api.org_name}'.")
             else:
                 raise GitHubError(f"Failed to get repository '{name}'. Details: {e.data.get('message', 'Unknown error')}")
             
+    @traced("github")
     def edit(self, repo: Repository.Repository, default_branch: str):
         """
         Edits repository settings.
@@ -55,32 +65,51 @@ class RepositoryManager:
             default_branch (str): The name to set as the default branch.
         """
         try:
-            repo.edit(default_branch=default_branch)
+            self._api.call(lambda: repo.edit(default_branch=default_branch), description="Editing repository settings")
         except GithubException as e:
             raise GitHubError(f"Failed to edit repository settings. Details: {e.data.get('message', 'Unknown error')}")
 
+    @traced("github")
     def create_release(self, repo: Repository.Repository, tag_name: str, name: str, message: str):
         """Creates a new GitHub Release."""
         try:
-            return repo.create_git_release(tag=tag_name, name=name, message=message, prerelease=False)
+            return self._api.call(
+                lambda: repo.create_git_release(tag=tag_name, name=name, message=message, prerelease=False),
+                idempotent=False,
+                description=f"Creating release '{tag_name}'",
+            )
         except GithubException as e:
             raise GitHubError(f"Failed to create release. Details: {e.data.get('message', 'Unknown error')}")
         
+    @traced("github")
     def compare_commits(self, repo: Repository.Repository, base: str, head: str) -> list[str]:
         """Compares two commits/tags and returns a formatted list of commit messages."""
         try:
-            comparison = repo.compare(base, head)
-            return [f"- {commit.commit.message.splitlines()[0]} by @{commit.author.login}" for commit in comparison.commits]
+            def compare():
+                comparison = repo.compare(base, head)
+                return [
+                    # Commits whose author email isn't linked to a GitHub account have no 'author'
+                    f"- {commit.commit.message.splitlines()[0]} by "
+                    + (f"@{commit.author.login}" if commit.author else commit.commit.author.name)
+                    for commit in comparison.commits
+                ]
+            return self._api.call(compare, description=f"Comparing {base}...{head}")
         except GithubException as e:
             raise GitHubError(f"Failed to compare commits. Details: {e.data.get('message', 'Unknown error')}")
         
+    @traced("github")
     def get_or_create_label(self, repo: Repository.Repository, name: str, color: str, description: str = "") -> 'Label':
         """Gets a label by name, creating it if it doesn't exist."""
         try:
-            return repo.get_label(name)
+            data, headers = self._api.http.get_json(f"/repos/{repo.full_name}/labels/{quote(name, safe='')}")
+            return self._gh.create_from_raw_data(Label.Label, data, headers)
         except UnknownObjectException:
             try:
-                return repo.create_label(name=name, color=color, description=description)
+                return self._api.call(
+                    lambda: repo.create_label(name=name, color=color, description=description),
+                    idempotent=False,
+                    description=f"Creating label '{name}'",
+                )
             except GithubException as e:
                 raise GitHubError(f"Failed to create label '{name}'. Details: {e.data.get('message', 'Unknown error')}")
             
\ No newline at end of file
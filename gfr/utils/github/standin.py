@@ -0,0 +1,701 @@
+# gfr/utils/github/standin.py
+"""
+A local stand-in for the GitHub API, for running gfr workflows offline.
+
+It implements the REST and GraphQL endpoints gfr uses (organization and
+user lookup, repositories, issues, labels, pull requests and merges,
+releases, compare) on an in-memory store. When given a git root, every
+repository is backed by a bare repository there. 'create' then makes a real
+bare repository, merging a pull request really merges the branches, and
+compare lists the real commits. Whole workflows like 'init', 'feature
+finish' and 'release finish' therefore work end to end.
+
+Each response can be slowed down by a fixed latency plus random jitter.
+Primary rate limits, secondary rate limits and server errors can be
+injected, to see how gfr behaves under GitHub's real conditions.
+
+Sessions can be recorded and replayed. With --record, the stand-in proxies
+to the real API and writes every exchange, with its timing, to a file.
+With --replay, recorded answers are served back with their original
+timing, so production timing profiles can be reproduced and benchmarked.
+
+Usage:
+    python -m gfr.utils.github.standin --port 8765 --latency 80 --jitter 30 --git-root /tmp/remotes
+    GITHUB_API_URL=http://127.0.0.1:8765 ggg feature finish svc1
+"""
+import argparse
+import json
+import os
+import random
+import re
+import subprocess
+import sys
+import threading
+import time
+import zlib
+from collections import deque
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional
+from urllib.parse import unquote, urlsplit
+
+DEFAULT_PORT = 8765
+# Labels GitHub adds to every new repository
+DEFAULT_LABELS = {
+    "bug": ("d73a4a", "Something isn't working"),
+    "documentation": ("0075ca", "Improvements or additions to documentation"),
+    "enhancement": ("a2eeef", "New feature or request"),
+    "question": ("d876e3", "Further information is requested"),
+}
+# Response headers kept in recordings; everything else is transport detail
+_RECORDED_HEADERS = ("content-type", "etag", "last-modified", "link", "retry-after", "location")
+
+class StandinError(Exception):
+    """An error answer: HTTP status, GitHub-style message and validation errors."""
+    def __init__(self, status: int, message: str, headers: Optional[dict] = None, errors: Optional[list] = None):
+        super().__init__(message)
+        self.status = status
+        self.headers = headers or {}
+        self.errors = errors
+
+@dataclass
+class Conditions:
+    """Injected network conditions."""
+    latency: float = 0.0
+    jitter: float = 0.0
+    rate_limit: int = 5000
+    rate_limit_window: float = 3600.0
+    secondary_every: int = 0
+    retry_after: int = 1
+    error_rate: float = 0.0
+
+class GitHubStore:
+    """
+    The stand-in's data: one organization, one authenticated user, and
+    their repositories with issues, pull requests, labels and releases.
+    """
+    def __init__(self, org: str, user: str, base_url: str, git_root: Optional[str] = None):
+        self.org = org
+        self.user = user
+        self.base_url = base_url.rstrip("/")
+        self.git_root = os.path.abspath(git_root) if git_root else None
+        self.repos: dict[str, dict] = {}
+        self._next_id = 1
+        self.lock = threading.RLock()
+
+    def _id(self) -> int:
+        self._next_id += 1
+        return self._next_id
+
+    # --- Objects in GitHub's JSON shape ---
+
+    def org_json(self) -> dict:
+        return {
+            "login": self.org, "id": 1, "node_id": "O_1",
+            "url": f"{self.base_url}/orgs/{self.org}",
+            "repos_url": f"{self.base_url}/orgs/{self.org}/repos",
+            "html_url": f"{self.base_url}/{self.org}",
+            "type": "Organization",
+        }
+
+    def user_json(self, login: Optional[str] = None) -> dict:
+        login = login or self.user
+        return {
+            "login": login, "id": abs(hash(login)) % 10**6, "node_id": f"U_{login}",
+            "url": f"{self.base_url}/users/{login}",
+            "html_url": f"{self.base_url}/{login}",
+            "type": "User",
+        }
+
+    def clone_url(self, name: str) -> str:
+        if self.git_root:
+            return os.path.join(self.git_root, f"{name}.git")
+        return f"{self.base_url}/{self.org}/{name}.git"
+
+    def repo(self, name: str) -> dict:
+        """Looks up a repository. With a git root, an existing bare repository is adopted on first use."""
+        with self.lock:
+            if name not in self.repos:
+                if self.git_root and os.path.isdir(self.clone_url(name)):
+                    self._add_repo(name, description="", private=True)
+                else:
+                    raise StandinError(404, "Not Found")
+            return self.repos[name]
+
+    def _add_repo(self, name: str, description: str, private: bool) -> dict:
+        repo_id = self._id()
+        url = f"{self.base_url}/repos/{self.org}/{name}"
+        clone_url = self.clone_url(name)
+        self.repos[name] = {
+            "id": repo_id, "node_id": f"R_{repo_id}", "name": name, "full_name": f"{self.org}/{name}",
+            "owner": self.user_json(self.org) | {"type": "Organization"},
+            "private": private, "description": description,
+            "url": url,
+            # With a git root, the web URL is the bare repository too, so 'ggg create' can clone it
+            "html_url": clone_url if self.git_root else f"{self.base_url}/{self.org}/{name}",
+            "clone_url": clone_url, "ssh_url": clone_url,
+            "default_branch": "main",
+            "labels": {
+                label: self._label_json(name, label, color, text)
+                for label, (color, text) in DEFAULT_LABELS.items()
+            },
+            "issues": {}, "releases": [], "next_number": 1,
+        }
+        return self.repos[name]
+
+    def public_repo(self, repo: dict) -> dict:
+        return {key: value for key, value in repo.items() if key not in ("labels", "issues", "releases", "next_number")}
+
+    def _label_json(self, repo_name: str, name: str, color: str, description: str) -> dict:
+        label_id = self._id()
+        return {
+            "id": label_id, "node_id": f"L_{label_id}", "name": name, "color": color, "description": description,
+            "url": f"{self.base_url}/repos/{self.org}/{repo_name}/labels/{name}",
+        }
+
+    def issue_json(self, issue: dict) -> dict:
+        return {key: value for key, value in issue.items() if not key.startswith("_")}
+
+    # --- Operations ---
+
+    def create_repo(self, name: str, description: str, private: bool, auto_init: bool) -> dict:
+        with self.lock:
+            if name in self.repos or (self.git_root and os.path.exists(self.clone_url(name))):
+                raise StandinError(422, "Repository creation failed.", errors=[{"message": "name already exists on this account"}])
+            repo = self._add_repo(name, description, private)
+            if self.git_root:
+                _init_bare_repository(self.clone_url(name), name, auto_init)
+            return repo
+
+    def edit_repo(self, name: str, changes: dict) -> dict:
+        with self.lock:
+            repo = self.repo(name)
+            if "default_branch" in changes:
+                repo["default_branch"] = changes["default_branch"]
+                if self.git_root:
+                    _git(self.clone_url(name), ["symbolic-ref", "HEAD", f"refs/heads/{changes['default_branch']}"])
+            if "description" in changes:
+                repo["description"] = changes["description"]
+            return repo
+
+    def label(self, repo_name: str, name: str) -> dict:
+        with self.lock:
+            label = self.repo(repo_name)["labels"].get(name)
+            if label is None:
+                raise StandinError(404, "Not Found")
+            return label
+
+    def create_label(self, repo_name: str, name: str, color: str, description: str) -> dict:
+        with self.lock:
+            repo = self.repo(repo_name)
+            if name in repo["labels"]:
+                raise StandinError(422, "Validation Failed", errors=[{"code": "already_exists"}])
+            repo["labels"][name] = self._label_json(repo_name, name, color, description)
+            return repo["labels"][name]
+
+    def create_issue(self, repo_name: str, title: str, body: str, labels: list[str], assignees: list[str], pull: Optional[dict] = None) -> dict:
+        with self.lock:
+            repo = self.repo(repo_name)
+            number = repo["next_number"]
+            repo["next_number"] += 1
+            issue_id = self._id()
+            kind = "pulls" if pull else "issues"
+            issue = {
+                "id": issue_id, "node_id": f"{'PR' if pull else 'I'}_{issue_id}", "number": number,
+                "title": title, "body": body, "state": "open",
+                "url": f"{repo['url']}/{kind}/{number}",
+                "html_url": f"{self.base_url}/{self.org}/{repo_name}/{'pull' if pull else 'issues'}/{number}",
+                "issue_url": f"{repo['url']}/issues/{number}",
+                "labels": [self._find_or_create_label(repo_name, label) for label in labels],
+                "assignees": [self.user_json(login) for login in assignees],
+                "user": self.user_json(),
+                "_repo": repo_name,
+            }
+            if pull:
+                issue.update(pull, merged=False, mergeable=True)
+            repo["issues"][number] = issue
+            return issue
+
+    def _find_or_create_label(self, repo_name: str, name: str) -> dict:
+        labels = self.repo(repo_name)["labels"]
+        if name not in labels:
+            # Like GitHub, applying an unknown label creates it
+            labels[name] = self._label_json(repo_name, name, "ededed", "")
+        return labels[name]
+
+    def issue(self, repo_name: str, number: int) -> dict:
+        with self.lock:
+            issue = self.repo(repo_name)["issues"].get(number)
+            if issue is None:
+                raise StandinError(404, "Not Found")
+            return issue
+
+    def find_by_node_id(self, node_id: str) -> tuple[str, dict]:
+        with self.lock:
+            for name, repo in self.repos.items():
+                if repo["node_id"] == node_id:
+                    return name, repo
+                for issue in repo["issues"].values():
+                    if issue["node_id"] == node_id:
+                        return name, issue
+        raise StandinError(404, f"Could not resolve to a node with the global id of '{node_id}'.")
+
+    def create_pull(self, repo_name: str, title: str, body: str, head: str, base: str) -> dict:
+        with self.lock:
+            repo = self.repo(repo_name)
+            if self.git_root:
+                for branch in (head, base):
+                    if not _git_ref(self.clone_url(repo_name), branch):
+                        raise StandinError(422, "Validation Failed", errors=[{"field": "head" if branch == head else "base", "code": "invalid"}])
+            pull = {
+                "head": {"ref": head, "label": f"{self.org}:{head}"},
+                "base": {"ref": base, "label": f"{self.org}:{base}", "repo": self.public_repo(repo)},
+            }
+            return self.create_issue(repo_name, title, body, [], [], pull=pull)
+
+    def merge_pull(self, repo_name: str, number: int) -> dict:
+        with self.lock:
+            pull = self.issue(repo_name, number)
+            if "head" not in pull:
+                raise StandinError(404, "Not Found")
+            if pull["merged"]:
+                raise StandinError(405, "Pull Request is not mergeable")
+            sha = "0" * 40
+            if self.git_root:
+                sha = _merge_branches(self.clone_url(repo_name), pull["head"]["ref"], pull["base"]["ref"],
+                                      f"Merge pull request #{number} from {self.org}/{pull['head']['ref']}\n\n{pull['title']}")
+            pull.update(merged=True, state="closed", merge_commit_sha=sha)
+            return {"sha": sha, "merged": True, "message": "Pull Request successfully merged"}
+
+    def create_release(self, repo_name: str, tag: str, name: str, body: str, prerelease: bool) -> dict:
+        with self.lock:
+            repo = self.repo(repo_name)
+            if any(release["tag_name"] == tag for release in repo["releases"]):
+                raise StandinError(422, "Validation Failed", errors=[{"field": "tag_name", "code": "already_exists"}])
+            release_id = self._id()
+            release = {
+                "id": release_id, "node_id": f"RE_{release_id}", "tag_name": tag, "name": name, "body": body,
+                "prerelease": prerelease, "draft": False,
+                "url": f"{repo['url']}/releases/{release_id}",
+                "html_url": f"{self.base_url}/{self.org}/{repo_name}/releases/tag/{tag}",
+            }
+            repo["releases"].append(release)
+            return release
+
+    def compare(self, repo_name: str, base: str, head: str) -> dict:
+        repo = self.repo(repo_name)
+        commits = []
+        if self.git_root:
+            log = _git(self.clone_url(repo_name), ["log", "--reverse", "--format=%H%x1f%an%x1f%ae%x1f%B%x1e", f"{base}..{head}"], check=False)
+            for record in filter(None, (entry.strip("\n") for entry in log.split("\x1e"))):
+                sha, author, email, message = record.split("\x1f", 3)
+                commits.append({
+                    "sha": sha, "url": f"{repo['url']}/commits/{sha}", "author": None,
+                    "commit": {"message": message.strip(), "author": {"name": author, "email": email}},
+                })
+        return {
+            "url": f"{repo['url']}/compare/{base}...{head}", "status": "ahead" if commits else "identical",
+            "ahead_by": len(commits), "behind_by": 0, "total_commits": len(commits), "commits": commits, "files": [],
+        }
+
+def _git(git_dir: str, args: list[str], check: bool = True, stdin: Optional[str] = None) -> str:
+    result = subprocess.run(["git", "--git-dir", git_dir, *args], capture_output=True, text=True, input=stdin)
+    if check and result.returncode != 0:
+        raise StandinError(500, f"git {' '.join(args)} failed: {result.stderr.strip()}")
+    return result.stdout
+
+def _git_ref(git_dir: str, branch: str) -> Optional[str]:
+    return _git(git_dir, ["rev-parse", "--verify", "-q", f"refs/heads/{branch}"], check=False).strip() or None
+
+def _init_bare_repository(path: str, name: str, auto_init: bool):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    subprocess.run(["git", "init", "-q", "--bare", "--initial-branch=main", path], check=True, capture_output=True)
+    if auto_init:
+        blob = _git(path, ["hash-object", "-w", "--stdin"], stdin=f"# {name}\n").strip()
+        tree = _git(path, ["mktree"], stdin=f"100644 blob {blob}\tREADME.md\n").strip()
+        commit = _git(path, ["-c", "user.name=GitHub", "-c", "user.email=noreply@github.com", "commit-tree", tree, "-m", "Initial commit"]).strip()
+        _git(path, ["update-ref", "refs/heads/main", commit])
+
+def _merge_branches(git_dir: str, head: str, base: str, message: str) -> str:
+    """Merges head into base inside a bare repository, like GitHub's merge button. Returns the merge commit."""
+    head_sha, base_sha = _git_ref(git_dir, head), _git_ref(git_dir, base)
+    if not head_sha or not base_sha:
+        raise StandinError(404, "Branch not found")
+    result = subprocess.run(["git", "--git-dir", git_dir, "merge-tree", "--write-tree", base_sha, head_sha], capture_output=True, text=True)
+    if result.returncode != 0:
+        raise StandinError(405, "Pull Request is not mergeable")
+    tree = result.stdout.splitlines()[0]
+    commit = _git(git_dir, ["-c", "user.name=GitHub", "-c", "user.email=noreply@github.com",
+                            "commit-tree", tree, "-p", base_sha, "-p", head_sha, "-m", message]).strip()
+    _git(git_dir, ["update-ref", f"refs/heads/{base}", commit, base_sha])
+    return commit
+
+# --- GraphQL (only the operations gfr sends) ---
+
+_LABEL_ALIAS_RE = re.compile(r'(label\d+): label\(name: ("(?:[^"\\]|\\.)*")\)')
+
+def run_graphql(store: GitHubStore, query: str, variables: dict) -> dict:
+    if "ResolvePullRequestTargets" in query:
+        try:
+            repo = store.repo(variables["name"]) if variables.get("owner") == store.org else None
+        except StandinError:
+            repo = None
+        data = {"repository": None, "user": {"id": f"U_{variables.get('assignee')}"}}
+        if repo is not None:
+            data["repository"] = {"id": repo["node_id"]}
+            for alias, name in _LABEL_ALIAS_RE.findall(query):
+                label = repo["labels"].get(json.loads(name))
+                data["repository"][alias] = {"id": label["node_id"]} if label else None
+        return {"data": data}
+
+    if "CreatePullRequest" in query:
+        repo_name, _ = store.find_by_node_id(variables["repositoryId"])
+        pull = store.create_pull(repo_name, variables["title"], variables["body"], variables["head"], variables["base"])
+        return {"data": {"createPullRequest": {"pullRequest": {"id": pull["node_id"], "number": pull["number"], "url": pull["html_url"]}}}}
+
+    if "FinalizePullRequest" in query:
+        repo_name, pull = store.find_by_node_id(variables["pullRequestId"])
+        with store.lock:
+            labels = {label["node_id"]: label for label in store.repo(repo_name)["labels"].values()}
+            pull["labels"] += [labels[label_id] for label_id in variables.get("labelIds", []) if label_id in labels]
+            pull["assignees"] += [store.user_json(assignee[2:]) for assignee in variables.get("assigneeIds", [])]
+        store.merge_pull(repo_name, pull["number"])
+        return {"data": {
+            "addLabelsToLabelable": {"clientMutationId": None},
+            "addAssigneesToAssignable": {"clientMutationId": None},
+            "mergePullRequest": {"pullRequest": {"merged": True}},
+        }}
+
+    return {"errors": [{"message": "This operation is not supported by the GitHub stand-in."}]}
+
+# --- REST routes: (method, pattern, handler(store, match, body) -> (status, json)) ---
+
+def _repo_route(path: str) -> str:
+    return r"^/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)" + path + "$"
+
+def _route_user(store, match, body):
+    login = match.group("login")
+    if login != store.user:
+        raise StandinError(404, "Not Found")
+    return 200, store.user_json(login)
+
+def _route_org(store, match, body):
+    if match.group("org") != store.org:
+        raise StandinError(404, "Not Found")
+    return 200, store.org_json()
+
+def _route_create_repo(store, match, body):
+    repo = store.create_repo(body["name"], body.get("description", ""), body.get("private", False), body.get("auto_init", False))
+    return 201, store.public_repo(repo)
+
+def _route_issue_labels(store, match, body):
+    issue = store.issue(match.group("repo"), int(match.group("number")))
+    with store.lock:
+        names = body if isinstance(body, list) else body.get("labels", [])
+        issue["labels"] = [store._find_or_create_label(match.group("repo"), name) for name in names]
+    return 200, issue["labels"]
+
+def _route_assignees(store, match, body):
+    issue = store.issue(match.group("repo"), int(match.group("number")))
+    with store.lock:
+        issue["assignees"] += [store.user_json(login) for login in body.get("assignees", [])]
+    return 201, store.issue_json(issue)
+
+ROUTES = [
+    ("GET", r"^/user$", lambda store, match, body: (200, store.user_json())),
+    ("GET", r"^/users/(?P<login>[^/]+)$", _route_user),
+    ("GET", r"^/orgs/(?P<org>[^/]+)$", _route_org),
+    ("POST", r"^/orgs/(?P<org>[^/]+)/repos$", _route_create_repo),
+    ("GET", _repo_route(""), lambda store, match, body: (200, store.public_repo(store.repo(match.group("repo"))))),
+    ("PATCH", _repo_route(""), lambda store, match, body: (200, store.public_repo(store.edit_repo(match.group("repo"), body)))),
+    ("GET", _repo_route("/labels/(?P<name>[^/]+)"), lambda store, match, body: (200, store.label(match.group("repo"), unquote(match.group("name"))))),
+    ("POST", _repo_route("/labels"), lambda store, match, body: (201, store.create_label(match.group("repo"), body["name"], body.get("color", "ededed"), body.get("description", "")))),
+    ("POST", _repo_route("/issues"), lambda store, match, body: (201, store.issue_json(store.create_issue(
+        match.group("repo"), body["title"], body.get("body", ""), body.get("labels", []),
+        body.get("assignees", []) + ([body["assignee"]] if body.get("assignee") else []))))),
+    ("GET", _repo_route("/issues/(?P<number>\\d+)"), lambda store, match, body: (200, store.issue_json(store.issue(match.group("repo"), int(match.group("number")))))),
+    ("PUT", _repo_route("/issues/(?P<number>\\d+)/labels"), _route_issue_labels),
+    ("POST", _repo_route("/issues/(?P<number>\\d+)/assignees"), _route_assignees),
+    ("POST", _repo_route("/pulls"), lambda store, match, body: (201, store.issue_json(store.create_pull(
+        match.group("repo"), body["title"], body.get("body", ""), body["head"], body["base"])))),
+    ("GET", _repo_route("/pulls/(?P<number>\\d+)"), lambda store, match, body: (200, store.issue_json(store.issue(match.group("repo"), int(match.group("number")))))),
+    ("PUT", _repo_route("/pulls/(?P<number>\\d+)/merge"), lambda store, match, body: (200, store.merge_pull(match.group("repo"), int(match.group("number"))))),
+    ("POST", _repo_route("/releases"), lambda store, match, body: (201, store.create_release(
+        match.group("repo"), body["tag_name"], body.get("name", ""), body.get("body", ""), body.get("prerelease", False)))),
+    ("GET", _repo_route("/compare/(?P<base>.+)\\.\\.\\.(?P<head>.+)"), lambda store, match, body: (200, store.compare(
+        match.group("repo"), unquote(match.group("base")), unquote(match.group("head"))))),
+]
+_COMPILED_ROUTES = [(method, re.compile(pattern), handler) for method, pattern, handler in ROUTES]
+
+class Recording:
+    """
+    Recorded exchanges, replayed in order per (method, path).
+
+    The file is JSON lines: a header {"upstream": URL} followed by one
+    object per exchange with method, path, status, duration, headers and body.
+    """
+    def __init__(self, upstream: str, entries: list[dict]):
+        self.upstream = upstream.rstrip("/")
+        self._queues: dict[tuple[str, str], deque] = {}
+        self._last: dict[tuple[str, str], dict] = {}
+        self._lock = threading.Lock()
+        for entry in entries:
+            self._queues.setdefault((entry["method"], entry["path"]), deque()).append(entry)
+
+    @classmethod
+    def load(cls, path: str) -> 'Recording':
+        with open(path, "r", encoding="utf-8") as f:
+            lines = [json.loads(line) for line in f if line.strip()]
+        if not lines or "upstream" not in lines[0]:
+            raise ValueError(f"{path} is not a stand-in recording.")
+        return cls(lines[0]["upstream"], lines[1:])
+
+    def next(self, method: str, path: str) -> Optional[dict]:
+        """The next recorded answer for a request; the last one is repeated once the queue runs out."""
+        key = (method, path)
+        with self._lock:
+            queue = self._queues.get(key)
+            if queue:
+                self._last[key] = queue.popleft()
+            return self._last.get(key)
+
+class StandinServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], org: str, user: str, conditions: Conditions,
+                 git_root: Optional[str] = None, seed: Optional[int] = None,
+                 replay: Optional[Recording] = None, time_scale: float = 1.0,
+                 record_path: Optional[str] = None, upstream: Optional[str] = None):
+        super().__init__(address, StandinHandler)
+        host, port = self.server_address[:2]
+        self.base_url = f"http://{host}:{port}"
+        self.store = GitHubStore(org, user, self.base_url, git_root)
+        self.conditions = conditions
+        self.random = random.Random(seed)
+        self.replay = replay
+        self.time_scale = time_scale
+        self.upstream = upstream.rstrip("/") if upstream else None
+        self._record_file = None
+        if record_path:
+            self._record_file = open(record_path, "w", encoding="utf-8")
+            self._record_file.write(json.dumps({"upstream": self.upstream}) + "\n")
+        self._limit_lock = threading.Lock()
+        self._window_start = time.time()
+        self._used = 0
+        self._writes = 0
+
+    def server_close(self):
+        super().server_close()
+        if self._record_file:
+            self._record_file.close()
+
+    def record(self, entry: dict):
+        with self._limit_lock:
+            self._record_file.write(json.dumps(entry) + "\n")
+            self._record_file.flush()
+
+    def delay(self):
+        conditions = self.conditions
+        seconds = conditions.latency + self.random.uniform(-conditions.jitter, conditions.jitter)
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def check_limits(self, method: str) -> dict:
+        """Counts a request against the budget. Returns rate-limit headers, or raises an injected error."""
+        conditions = self.conditions
+        with self._limit_lock:
+            now = time.time()
+            if now - self._window_start >= conditions.rate_limit_window:
+                self._window_start, self._used = now, 0
+            reset = int(self._window_start + conditions.rate_limit_window)
+            exhausted = self._used >= conditions.rate_limit
+            if not exhausted:
+                self._used += 1
+            headers = {
+                "X-RateLimit-Limit": str(conditions.rate_limit),
+                "X-RateLimit-Remaining": str(max(0, conditions.rate_limit - self._used)),
+                "X-RateLimit-Used": str(self._used),
+                "X-RateLimit-Reset": str(reset),
+                "X-RateLimit-Resource": "core",
+            }
+            if exhausted:
+                raise StandinError(403, "API rate limit exceeded for user.", headers)
+            if method != "GET" and conditions.secondary_every:
+                self._writes += 1
+                if self._writes % conditions.secondary_every == 0:
+                    raise StandinError(403, "You have exceeded a secondary rate limit. Please wait a few minutes before you try again.",
+                                       headers | {"Retry-After": str(conditions.retry_after)})
+            if conditions.error_rate and self.random.random() < conditions.error_rate:
+                raise StandinError(502, "Server Error", headers)
+            return headers
+
+class StandinHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: StandinServer
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def do_PUT(self):
+        self._handle("PUT")
+
+    def do_PATCH(self):
+        self._handle("PATCH")
+
+    def do_DELETE(self):
+        self._handle("DELETE")
+
+    def log_message(self, format, *args):
+        if os.getenv("GFR_STANDIN_LOG"):
+            super().log_message(format, *args)
+
+    def _handle(self, method: str):
+        length = int(self.headers.get("Content-Length") or 0)
+        raw_body = self.rfile.read(length) if length else b""
+        path = urlsplit(self.path).path
+        # GitHub Enterprise style prefixes map to the same endpoints
+        for prefix in ("/api/v3", "/api"):
+            if path.startswith(prefix + "/"):
+                path = path[len(prefix):]
+
+        if self.server.upstream:
+            return self._proxy(method, raw_body)
+        if self.server.replay and self._replay(method, path):
+            return
+
+        self.server.delay()
+        headers = {}
+        try:
+            headers = self.server.check_limits(method)
+            body = json.loads(raw_body) if raw_body else {}
+            if method == "POST" and path == "/graphql":
+                status, data = 200, run_graphql(self.server.store, body.get("query", ""), body.get("variables") or {})
+            else:
+                status, data = self._route(method, path, body)
+        except StandinError as e:
+            status, headers = e.status, headers | e.headers
+            data = {"message": str(e), "documentation_url": "https://docs.github.com/rest"}
+            if e.errors:
+                data["errors"] = e.errors
+        except (KeyError, ValueError) as e:
+            status, data = 422, {"message": f"Validation Failed: {e}"}
+        self._send_json(method, status, data, headers)
+
+    def _route(self, method: str, path: str, body: Any) -> tuple[int, Any]:
+        for route_method, pattern, handler in _COMPILED_ROUTES:
+            match = pattern.match(path)
+            if match and route_method == method:
+                return handler(self.server.store, match, body)
+        raise StandinError(404, "Not Found")
+
+    def _send_json(self, method: str, status: int, data: Any, headers: dict):
+        payload = json.dumps(data).encode("utf-8")
+        etag = f'"{zlib.crc32(payload):08x}"'
+        if method == "GET" and status == 200 and self.headers.get("If-None-Match") == etag:
+            # Unchanged: an empty 304, which GitHub doesn't count against the rate limit
+            status, payload = 304, b""
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        if method == "GET" and status in (200, 304):
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "private, max-age=60")
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _replay(self, method: str, path: str) -> bool:
+        entry = self.server.replay.next(method, path)
+        if entry is None:
+            return False
+        time.sleep(entry["duration"] * self.server.time_scale)
+        payload = entry["body"].replace(self.server.replay.upstream, self.server.base_url).encode("utf-8")
+        self.send_response(entry["status"])
+        for name, value in entry["headers"].items():
+            self.send_header(name, value.replace(self.server.replay.upstream, self.server.base_url))
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+        return True
+
+    def _proxy(self, method: str, raw_body: bytes):
+        import requests
+        upstream = self.server.upstream
+        headers = {name: value for name, value in self.headers.items() if name.lower() not in ("host", "content-length", "connection", "accept-encoding")}
+        started = time.perf_counter()
+        response = requests.request(method, upstream + self.path, headers=headers, data=raw_body or None, timeout=30, allow_redirects=False)
+        duration = time.perf_counter() - started
+
+        kept_headers = {name: value for name, value in response.headers.items()
+                        if name.lower() in _RECORDED_HEADERS or name.lower().startswith("x-ratelimit")}
+        if self.server._record_file:
+            self.server.record({
+                "method": method, "path": urlsplit(self.path).path, "status": response.status_code,
+                "duration": round(duration, 4), "headers": kept_headers, "body": response.text,
+            })
+        payload = response.text.replace(upstream, self.server.base_url).encode("utf-8")
+        self.send_response(response.status_code)
+        for name, value in kept_headers.items():
+            self.send_header(name, value.replace(upstream, self.server.base_url))
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+def serve_in_background(server: StandinServer) -> threading.Thread:
+    """Runs a stand-in on a daemon thread (e.g. from a benchmark script). Stop it with server.shutdown()."""
+    thread = threading.Thread(target=server.serve_forever, name="github-standin", daemon=True)
+    thread.start()
+    return thread
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m gfr.utils.github.standin", description="A local stand-in for the GitHub API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="Port to listen on (0 picks a free one).")
+    parser.add_argument("--org", default=os.getenv("GITHUB_ORGANIZATION", "standin-org"), help="The organization it serves.")
+    parser.add_argument("--user", default=os.getenv("GITHUB_USERNAME", "standin-user"), help="The authenticated user.")
+    parser.add_argument("--git-root", help="Directory of bare repositories (NAME.git) backing the repositories.")
+    parser.add_argument("--latency", type=float, default=0.0, help="Milliseconds added to every response.")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random +/- milliseconds added to the latency.")
+    parser.add_argument("--seed", type=int, help="Seed for jitter and injected errors, for repeatable runs.")
+    parser.add_argument("--rate-limit", type=int, default=5000, help="Requests allowed per window before 403s (default: 5000).")
+    parser.add_argument("--rate-limit-window", type=float, default=3600.0, help="Seconds per rate-limit window (default: 3600).")
+    parser.add_argument("--secondary-every", type=int, default=0, help="Answer every Nth write with a secondary rate limit (403 + Retry-After).")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds for secondary rate limits.")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 502 (0-1).")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--record", metavar="FILE", help="Proxy to --upstream and record every exchange to FILE.")
+    mode.add_argument("--replay", metavar="FILE", help="Answer from a recording, with its timing; unrecorded requests are simulated.")
+    parser.add_argument("--upstream", default="https://api.github.com", help="The real API, for --record.")
+    parser.add_argument("--time-scale", type=float, default=1.0, help="Multiply replayed durations (e.g. 0.5 for twice as fast).")
+    arguments = parser.parse_args()
+
+    conditions = Conditions(
+        latency=arguments.latency / 1000, jitter=arguments.jitter / 1000,
+        rate_limit=arguments.rate_limit, rate_limit_window=arguments.rate_limit_window,
+        secondary_every=arguments.secondary_every, retry_after=arguments.retry_after, error_rate=arguments.error_rate,
+    )
+    try:
+        replay = Recording.load(arguments.replay) if arguments.replay else None
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    server = StandinServer(
+        (arguments.host, arguments.port), arguments.org, arguments.user, conditions,
+        git_root=arguments.git_root, seed=arguments.seed, replay=replay, time_scale=arguments.time_scale,
+        record_path=arguments.record, upstream=arguments.upstream if arguments.record else None,
+    )
+    print(f"GitHub stand-in for '{arguments.org}' listening on {server.base_url}")
+    print(f"  export GITHUB_API_URL={server.base_url} GITHUB_ORGANIZATION={arguments.org} GITHUB_USERNAME={arguments.user}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+# gfr/utils/parallel.py
+import contextvars
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Git work is mostly spent waiting on subprocesses and the network,
+# so a small thread pool is enough to keep several repositories busy.
+DEFAULT_JOBS = min(8, (os.cpu_count() or 1) + 4)
+
+def run_ordered(func: Callable[[T], R], items: Iterable[T], jobs: int = DEFAULT_JOBS) -> Iterator[Tuple[T, Optional[R], Optional[Exception]]]:
+    """
+    Runs a function over items on a bounded worker pool.
+
+    Results are yielded in the original order of the items as soon as each one
+    (and every item before it) is ready. A failing item does not stop the others;
+    its exception is yielded instead of a result.
+
+    Args:
+        func: The function to call for each item.
+        items: The items to process.
+        jobs: The maximum number of concurrent workers.
+
+    Yields:
+        Tuples of (item, result, error) where exactly one of result/error is set.
+    """
+    items = list(items)
+    executor = ThreadPoolExecutor(max_workers=max(1, jobs))
+    try:
+        # Each worker runs in a copy of the caller's context, so profiling spans nest correctly
+        futures = [executor.submit(contextvars.copy_context().run, func, item) for item in items]
+        for item, future in zip(items, futures):
+            try:
+                yield item, future.result(), None
+            except Exception as e:
+                yield item, None, e
+    finally:
+        # Drop work that hasn't started yet if the caller stops early (e.g. Ctrl+C)
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,118 @@
+# gfr/utils/scheduler.py
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Optional
+
+from .parallel import DEFAULT_JOBS
+from .tracing import span
+
+@dataclass
+class TaskResult:
+    """The outcome of a scheduled task: 'done', 'failed' or 'skipped'."""
+    state: str
+    value: Any = None
+    error: Optional[Exception] = None
+
+class TaskScheduler:
+    """
+    A small dependency-graph scheduler.
+
+    Tasks are registered with the names of the tasks they depend on. Each task
+    starts on the worker pool as soon as all of its dependencies have finished
+    successfully; if a dependency fails, everything downstream of it is skipped.
+    """
+    def __init__(self, jobs: int = DEFAULT_JOBS):
+        self.jobs = max(1, jobs)
+        self._tasks: dict[str, Callable[[], Any]] = {}
+        self._deps: dict[str, set[str]] = {}
+
+    def add(self, name: str, func: Callable[[], Any], depends_on: Iterable[str] = ()):
+        """Registers a task. Dependencies may be added before or after the task itself."""
+        if name in self._tasks:
+            raise ValueError(f"Task '{name}' is already scheduled.")
+        self._tasks[name] = func
+        self._deps[name] = set(depends_on)
+
+    def run(self) -> dict[str, TaskResult]:
+        """
+        Runs every task, respecting dependencies.
+
+        Returns:
+            A mapping of task name to its TaskResult, in registration order.
+
+        Raises:
+            ValueError: If a task depends on an unknown task or the graph has a cycle.
+        """
+        self._validate()
+        results: dict[str, TaskResult] = {}
+        pending = {name: set(deps) for name, deps in self._deps.items()}
+        dependents: dict[str, list[str]] = {name: [] for name in self._tasks}
+        for name, deps in self._deps.items():
+            for dep in deps:
+                dependents[dep].append(name)
+
+        def _skip(name: str):
+            # Mark a task and everything that (transitively) needs it as skipped
+            stack = [name]
+            while stack:
+                current = stack.pop()
+                if current in results:
+                    continue
+                results[current] = TaskResult("skipped")
+                pending.pop(current, None)
+                stack.extend(dependents[current])
+
+        with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            running = {}
+
+            def _submit_ready():
+                for name in [n for n, deps in pending.items() if not deps]:
+                    del pending[name]
+                    running[executor.submit(contextvars.copy_context().run, self._run_task, name)] = name
+
+            _submit_ready()
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        results[name] = TaskResult("done", value=future.result())
+                    except Exception as e:
+                        results[name] = TaskResult("failed", error=e)
+                        for dependent in dependents[name]:
+                            _skip(dependent)
+                        continue
+                    for dependent in dependents[name]:
+                        if dependent in pending:
+                            pending[dependent].discard(name)
+                _submit_ready()
+
+        return {name: results[name] for name in self._tasks}
+
+    def _run_task(self, name: str) -> Any:
+        with span(name, "task"):
+            return self._tasks[name]()
+
+    def _validate(self):
+        """Checks that all dependencies exist and that the graph is acyclic."""
+        for name, deps in self._deps.items():
+            unknown = deps - self._tasks.keys()
+            if unknown:
+                raise ValueError(f"Task '{name}' depends on unknown task(s): {', '.join(sorted(unknown))}")
+
+        visited, in_progress = set(), set()
+
+        def _visit(name: str):
+            if name in visited:
+                return
+            if name in in_progress:
+                raise ValueError(f"Dependency cycle detected at task '{name}'.")
+            in_progress.add(name)
+            for dep in self._deps[name]:
+                _visit(dep)
+            in_progress.discard(name)
+            visited.add(name)
+
+        for name in self._tasks:
+            _visit(name)
@@ -0,0 +1,9 @@
+# gfr/utils/settings.py
+from dataclasses import dataclass
+
+@dataclass
+class Settings:
+    """Global options given on the command line before the subcommand (e.g. 'ggg --verbose push')."""
+    verbose: bool = False
+
+settings = Settings()
@@ -0,0 +1,276 @@
+# gfr/utils/tracing.py
+import contextvars
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator, Optional
+
+from .cache import atomic_write
+
+@dataclass
+class Span:
+    """One timed operation (a command, a git subprocess, a GitHub call) and what ran inside it."""
+    name: str
+    category: str
+    start: float
+    thread_id: int
+    attrs: dict[str, Any] = field(default_factory=dict)
+    end: Optional[float] = None
+    children: list['Span'] = field(default_factory=list)
+    # Zero-duration occurrences inside the span: (time, description, attrs)
+    events: list[tuple[float, str, dict]] = field(default_factory=list)
+
+    @property
+    def duration(self) -> float:
+        """Seconds the span took (so far, if it is still open)."""
+        return (self.end if self.end is not None else time.perf_counter()) - self.start
+
+    def set(self, **attrs):
+        """Records details such as an exit status or the size of the output."""
+        self.attrs.update(attrs)
+
+    def __bool__(self) -> bool:
+        return True
+
+class _DisabledSpan:
+    """Stands in for a Span when tracing is off, so call sites need no checks."""
+    def set(self, **attrs):
+        pass
+
+    def __bool__(self) -> bool:
+        # Lets call sites skip computing details nobody will see: 'if span: ...'
+        return False
+
+_DISABLED = _DisabledSpan()
+_current_span: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar("gfr_current_span", default=None)
+
+class Tracer:
+    """
+    Collects spans for the running command.
+
+    Off by default; enabled for the whole process by trace_command when
+    '--profile' or '--trace-file' is given. Spans nest through a context
+    variable, so work started from a span (including on worker threads that
+    copy the context, see parallel.run_ordered) is recorded under it.
+    """
+    def __init__(self):
+        self.enabled = False
+        self.roots: list[Span] = []
+        self.origin = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def start_span(self, name: str, category: str, attrs: dict) -> Span:
+        parent = _current_span.get()
+        thread_id = threading.get_ident()
+        if parent is not None and threading.current_thread().name == "gfr-git":
+            # Git calls run on the shared event loop (see git.async_operations), on behalf of the caller's thread
+            thread_id = parent.thread_id
+        current = Span(name=name, category=category, start=time.perf_counter(), thread_id=thread_id, attrs=attrs)
+        with self._lock:
+            (parent.children if parent else self.roots).append(current)
+        return current
+
+    def add_event(self, description: str, **attrs):
+        """Records a zero-duration event in the current span, if there is one."""
+        parent = _current_span.get()
+        if parent is not None:
+            with self._lock:
+                parent.events.append((time.perf_counter(), description, attrs))
+
+    def walk(self) -> Iterator[tuple[Span, int]]:
+        """Yields every span with its depth, parents before children."""
+        stack = [(root, 0) for root in reversed(self.roots)]
+        while stack:
+            current, depth = stack.pop()
+            yield current, depth
+            stack.extend((child, depth + 1) for child in reversed(current.children))
+
+tracer = Tracer()
+
+@contextmanager
+def span(name: str, category: str = "gfr", activate: bool = True, **attrs):
+    """
+    Times a block as a span under the current one.
+
+    Args:
+        name: What is being done, e.g. 'git push'.
+        category: The kind of work ('command', 'git', 'github', 'http', 'task').
+        activate: Whether spans started inside the block nest under this one.
+                  Generators must pass False, as their body runs interleaved
+                  with the caller's code.
+        attrs: Details to record, such as argv or cwd.
+
+    Yields:
+        The Span, for recording results with .set(); a stand-in when tracing is off.
+    """
+    if not tracer.enabled:
+        yield _DISABLED
+        return
+    current = tracer.start_span(name, category, attrs)
+    token = _current_span.set(current) if activate else None
+    try:
+        yield current
+    except BaseException as e:
+        exit_code = getattr(e, "exit_code", None)
+        if exit_code is not None:
+            # typer.Exit and friends end a command on purpose; only their code matters
+            current.attrs.setdefault("exit", exit_code)
+        elif not isinstance(e, GeneratorExit):
+            current.attrs.setdefault("error", type(e).__name__)
+        raise
+    finally:
+        current.end = time.perf_counter()
+        if token is not None:
+            _current_span.reset(token)
+
+def traced(category: str, name: Optional[str] = None):
+    """Decorator that records every call of a function as a span (named after the function by default)."""
+    def decorator(func: Callable) -> Callable:
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            with span(label, category):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+class _GitHubRequestLog(logging.Handler):
+    """Turns PyGithub's debug log of each HTTP request into events on the current span."""
+    def emit(self, record: logging.LogRecord):
+        # PyGithub logs: verb, scheme, host, url, request headers, input, status, response headers, output
+        if not isinstance(record.args, tuple) or len(record.args) != 9:
+            return
+        verb, _, _, url, _, _, status, _, output = record.args
+        size = len(output.encode("utf-8")) if isinstance(output, str) else None
+        tracer.add_event(f"{verb} {url.split('?')[0]}", status=status, bytes=size)
+
+@contextmanager
+def trace_command(name: str, profile: bool = False, trace_file: Optional[str] = None):
+    """
+    Traces a command: enables the tracer and wraps the command in a top-level
+    span. When the outermost traced command ends, prints a summary tree
+    (profile) and/or writes a Chrome trace (trace_file). Commands run inside
+    another traced command (e.g. by 'ggg batch') nest under it instead.
+    """
+    if not (profile or trace_file or tracer.enabled):
+        yield
+        return
+
+    outermost = not tracer.enabled
+    request_logger = logging.getLogger("github.Requester")
+    if outermost:
+        tracer.roots = []
+        tracer.enabled = True
+        handler = _GitHubRequestLog()
+        previous_level, previous_propagate = request_logger.level, request_logger.propagate
+        request_logger.addHandler(handler)
+        request_logger.setLevel(logging.DEBUG)
+        # PyGithub prints everything logged under 'github' to stderr; keep the debug records to ourselves
+        request_logger.propagate = False
+    try:
+        with span(name, "command"):
+            yield
+    finally:
+        if outermost:
+            request_logger.removeHandler(handler)
+            request_logger.setLevel(previous_level)
+            request_logger.propagate = previous_propagate
+            tracer.enabled = False
+            if trace_file:
+                write_chrome_trace(trace_file)
+            if profile:
+                print_summary()
+
+def to_chrome_trace() -> dict:
+    """
+    Exports the recorded spans in the Chrome trace-event format, which
+    Perfetto (ui.perfetto.dev) and chrome://tracing can open.
+    """
+    pid = os.getpid()
+    thread_numbers: dict[int, int] = {}
+    events = []
+
+    def microseconds(moment: float) -> float:
+        return round((moment - tracer.origin) * 1_000_000, 1)
+
+    for current, _ in tracer.walk():
+        tid = thread_numbers.setdefault(current.thread_id, len(thread_numbers) + 1)
+        events.append({
+            "name": current.name,
+            "cat": current.category,
+            "ph": "X",
+            "ts": microseconds(current.start),
+            "dur": round(current.duration * 1_000_000, 1),
+            "pid": pid,
+            "tid": tid,
+            "args": current.attrs,
+        })
+        for moment, description, attrs in current.events:
+            events.append({
+                "name": description, "cat": "http", "ph": "i", "s": "t",
+                "ts": microseconds(moment), "pid": pid, "tid": tid, "args": attrs,
+            })
+    for thread_id, tid in thread_numbers.items():
+        label = "main" if tid == 1 else f"worker {tid - 1}"
+        events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": label}})
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+def write_chrome_trace(path: str):
+    """Writes the recorded spans to a Chrome trace-event JSON file."""
+    atomic_write(path, json.dumps(to_chrome_trace(), default=str).encode("utf-8"))
+
+def print_summary():
+    """Prints the recorded spans as a tree with durations, followed by totals per kind of work."""
+    from rich.console import Console
+    from rich.markup import escape
+    from rich.tree import Tree
+
+    console = Console(stderr=True)
+    tree = Tree("[bold]Profile[/bold]")
+
+    def add(parent: Tree, current: Span):
+        node = parent.add(_describe(current, escape))
+        for _, description, attrs in current.events:
+            node.add(f"[dim]{escape(description)} → {attrs.get('status')}[/dim]")
+        for child in current.children:
+            add(node, child)
+
+    for root in tracer.roots:
+        add(tree, root)
+    console.print(tree)
+
+    # Time per kind of work, counting nested calls of the same kind only once
+    totals: dict[str, list] = {}
+
+    def count(current: Span, inside: frozenset):
+        if current.category in ("git", "github", "http") and current.category not in inside:
+            total = totals.setdefault(current.category, [0, 0.0])
+            total[0] += 1
+            total[1] += current.duration
+        for child in current.children:
+            count(child, inside | {current.category})
+
+    for root in tracer.roots:
+        count(root, frozenset())
+    for category, (calls, seconds) in sorted(totals.items()):
+        console.print(f"  {category}: {calls} call(s), {seconds * 1000:.0f} ms in total")
+
+def _describe(current: Span, escape: Callable[[str], str]) -> str:
+    milliseconds = current.duration * 1000
+    color = "red" if "error" in current.attrs else ("yellow" if milliseconds >= 1000 else "cyan")
+    details = []
+    if "cwd" in current.attrs:
+        details.append(os.path.relpath(current.attrs["cwd"]))
+    for key in ("exit", "status", "bytes", "error"):
+        if current.attrs.get(key) is not None:
+            details.append(f"{key}={current.attrs[key]}")
+    suffix = f" [dim]({escape(', '.join(details))})[/dim]" if details else ""
+    return f"[{color}]{milliseconds:8.1f} ms[/{color}]  {escape(current.name)}{suffix}"
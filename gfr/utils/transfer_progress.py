@@ -0,0 +1,82 @@
+# gfr/utils/transfer_progress.py
+from typing import Optional
+
+from rich.console import Console
+from rich.progress import BarColumn, Progress, SpinnerColumn, TaskID, TaskProgressColumn, TextColumn
+from rich.progress_bar import ProgressBar
+from rich.status import Status
+from rich.table import Table
+
+from .git.progress import GitProgress, ProgressCallback
+
+class TransferProgress:
+    """
+    Live progress bars for git transfers, one row per repository, for
+    commands that push or pull many repositories at once.
+
+    Lines printed on the console while it is shown appear above the bars.
+    When the console isn't a terminal nothing is drawn and track() returns
+    None, so git isn't asked for progress output at all.
+    """
+    def __init__(self, console: Console):
+        self.enabled = console.is_terminal
+        self._progress = Progress(
+            SpinnerColumn(),
+            TextColumn("[cyan]{task.fields[repo]}"),
+            TextColumn("{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
+            TextColumn("[dim]{task.fields[detail]}"),
+            console=console,
+            transient=True,
+        )
+        self._tasks: dict[str, TaskID] = {}
+
+    def __enter__(self) -> 'TransferProgress':
+        if self.enabled:
+            self._progress.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.enabled:
+            self._progress.stop()
+
+    def track(self, repo: str) -> Optional[ProgressCallback]:
+        """Adds a row for a repository and returns the callback that moves its bar."""
+        if not self.enabled:
+            return None
+        task = self._progress.add_task("waiting", repo=repo, detail="", total=None)
+        self._tasks[repo] = task
+
+        def update(event: GitProgress):
+            self._progress.update(task, description=event.phase, completed=event.completed, total=event.total, detail=event.detail)
+        return update
+
+    def finish(self, repo: str):
+        """Removes a repository's row once its transfer is over."""
+        task = self._tasks.pop(repo, None)
+        if task is not None:
+            self._progress.remove_task(task)
+
+def status_progress(status: Status, message: str) -> Optional[ProgressCallback]:
+    """
+    Shows a transfer's progress bar inside an active console.status spinner,
+    next to the given message. Sets the message straight away; returns None
+    (no progress needed) when the console isn't a terminal.
+    """
+    status.update(message)
+    if not status.console.is_terminal:
+        return None
+
+    def update(event: GitProgress):
+        line = Table.grid(padding=(0, 1))
+        for overflow in ("fold", "fold", "fold", "ellipsis"):
+            line.add_column(no_wrap=True, overflow=overflow)
+        line.add_row(
+            message,
+            ProgressBar(total=event.total, completed=event.completed, width=20),
+            f"{event.phase} {event.percent:.0f}%" if event.percent is not None else event.phase,
+            f"[dim]{event.detail}[/dim]",
+        )
+        status.update(line)
+    return update
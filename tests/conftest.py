@@ -0,0 +1,34 @@
+# tests/conftest.py
+import os
+import subprocess
+
+import pytest
+
+@pytest.fixture(autouse=True)
+def isolated_env(tmp_path, monkeypatch):
+    """Keeps git identity, protocol settings and gfr's caches out of the user's home."""
+    gitconfig = tmp_path / "gitconfig"
+    gitconfig.write_text(
+        "[user]\n\tname = Test\n\temail = test@example.com\n"
+        "[init]\n\tdefaultBranch = main\n"
+        "[protocol \"file\"]\n\tallow = always\n"
+    )
+    monkeypatch.setenv("GIT_CONFIG_GLOBAL", str(gitconfig))
+    monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "1")
+    monkeypatch.setenv("GFR_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("HOME", str(tmp_path))
+
+def git(cwd, *args: str) -> str:
+    """Runs git in a directory and returns its stripped output."""
+    return subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True, text=True).stdout.strip()
+
+def make_repo(path, files: dict) -> str:
+    """Creates a repository with one commit holding the given files."""
+    os.makedirs(path, exist_ok=True)
+    git(path, "init", "-q")
+    for name, content in files.items():
+        with open(os.path.join(path, name), "w") as f:
+            f.write(content)
+    git(path, "add", ".")
+    git(path, "commit", "-q", "-m", "Initial commit")
+    return str(path)
@@ -0,0 +1,70 @@
+# tests/test_async_operations.py
+import asyncio
+import os
+import time
+
+import pytest
+
+from gfr.utils.git.async_operations import AsyncGitOperations, iterate_chunks_sync, run_sync
+from gfr.utils.git.exceptions import GitError
+from gfr.utils.git.operations import GitOperations
+from conftest import git, make_repo
+
+def test_iter_log_is_the_same_from_sync_and_async_code(tmp_path):
+    repo = make_repo(tmp_path / "repo", {"a.txt": "a\n"})
+    for number in range(3):
+        git(repo, "commit", "-q", "--allow-empty", "-m", f"Change {number}")
+
+    async def collect():
+        return [entry async for entry in AsyncGitOperations().iter_log(path=repo)]
+
+    entries = list(GitOperations().iter_log(path=repo))
+    assert entries == asyncio.run(collect())
+    assert [entry.subject for entry in entries] == ["Change 2", "Change 1", "Change 0", "Initial commit"]
+
+def test_stopping_a_stream_early_kills_what_git_started(tmp_path):
+    library = make_repo(tmp_path / "library", {"a.txt": "a\n"})
+    root = make_repo(tmp_path / "project", {"b.txt": "b\n"})
+    git(root, "submodule", "add", "-q", library, "library")
+    # The foreach script outlives git and keeps the pipe full
+    command = ["git", "submodule", "foreach", "--quiet", "while :; do printf 'x\\0'; done"]
+
+    started = time.perf_counter()
+    records = iterate_chunks_sync(GitOperations().aio._stream_chunks(command, cwd=root))
+    assert next(records) == "x"
+    records.close()
+    assert time.perf_counter() - started < 3
+
+def test_a_timed_out_command_is_killed(tmp_path):
+    # A builtin that serves until it is killed
+    socket_dir = tmp_path / "credentials"
+    socket_dir.mkdir(mode=0o700)
+    command = ["git", "credential-cache--daemon", str(socket_dir / "socket")]
+    started = time.perf_counter()
+    with pytest.raises(GitError, match="timed out"):
+        GitOperations(timeout=0.5)._run_command(command)
+    assert time.perf_counter() - started < 3
+
+def test_failures_carry_git_diagnostics(tmp_path):
+    repo = make_repo(tmp_path / "repo", {"a.txt": "a\n"})
+    with pytest.raises(GitError, match="not-a-branch"):
+        GitOperations().switch_branch("not-a-branch", path=repo)
+
+def test_run_sync_refuses_to_block_the_git_loop():
+    async def nested():
+        run_sync(asyncio.sleep(0))
+
+    with pytest.raises(RuntimeError, match="await the coroutine instead"):
+        run_sync(nested())
+
+def test_clone_reports_progress(tmp_path):
+    source = make_repo(tmp_path / "source", {f"file{number}.txt": f"{number}\n" for number in range(20)})
+    events = []
+    path = GitOperations().clone(f"file://{source}", "source", str(tmp_path / "clones"), progress=events.append)
+    assert os.path.isfile(os.path.join(path, "file0.txt"))
+    assert any(event.done for event in events)
+    assert all(event.total is None or event.completed <= event.total for event in events)
+
+def test_a_failing_transfer_reports_git_errors(tmp_path):
+    with pytest.raises(GitError, match="does not exist|not found|Could not read"):
+        GitOperations().clone(f"file://{tmp_path}/missing", "missing", str(tmp_path / "clones"), progress=lambda event: None)
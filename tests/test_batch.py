@@ -0,0 +1,22 @@
+# tests/test_batch.py
+from typer.testing import CliRunner
+
+from gfr.app import app
+from gfr.utils.git.context import reset_repo_context
+from gfr.utils.git.operations import GitOperations
+
+def test_unexpected_errors_fail_only_their_step(tmp_path, monkeypatch):
+    def broken_is_git_repo(self, path="."):
+        raise OSError("Disk on fire")
+
+    monkeypatch.setattr(GitOperations, "is_git_repo", broken_is_git_repo)
+    monkeypatch.chdir(tmp_path)
+    reset_repo_context()
+    steps = tmp_path / "steps.txt"
+    steps.write_text("status\nlink\n")
+
+    result = CliRunner().invoke(app, ["batch", "--keep-going", str(steps)])
+    assert result.exit_code == 1, result.output
+    assert "line 1: Disk on fire" in result.output
+    assert "line 2: Disk on fire" in result.output
+    assert "Ran 2 of 2 command(s): 0 succeeded, 2 failed" in result.output
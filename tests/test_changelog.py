@@ -0,0 +1,68 @@
+# tests/test_changelog.py
+import os
+import sys
+
+import pytest
+
+from gfr.utils.changelog import get_changelog_index, insert_changelog_entry, read_changelog_section
+
+HEADER = "# Changelog\n\nAll notable changes to this project are documented here.\n\n"
+V1 = "## [1.0.0] - 2025-01-01\n\n### Added\n- First release\n"
+V1_1 = "## [1.1.0] - 2025-02-01\n\n### Fixed\n- A bug\n"
+V2 = "## [2.0.0] - 2025-03-01\n\n### Changed\n- Everything"
+
+def _rebuilt_index(path: str, monkeypatch, tmp_path):
+    """The heading index built from scratch, bypassing the cache."""
+    monkeypatch.setenv("GFR_CACHE_DIR", str(tmp_path / "fresh-cache"))
+    return get_changelog_index(path)
+
+def test_entry_goes_above_the_newest_section(tmp_path):
+    path = tmp_path / "CHANGELOG.md"
+    path.write_text(HEADER + V1_1 + "\n" + V1)
+    insert_changelog_entry(str(path), V2)
+    assert path.read_text() == HEADER + V2 + "\n\n" + V1_1 + "\n" + V1
+
+def test_changelog_is_created_from_the_template(tmp_path):
+    path = tmp_path / "CHANGELOG.md"
+    insert_changelog_entry(str(path), V1, template="# Changelog\n")
+    assert path.read_text() == "# Changelog\n\n" + V1
+
+def test_first_entry_below_a_header_without_sections(tmp_path):
+    path = tmp_path / "CHANGELOG.md"
+    path.write_text("# Changelog")
+    insert_changelog_entry(str(path), V1)
+    assert path.read_text() == "# Changelog\n\n" + V1
+
+    path.write_text("# Changelog\n\n")
+    insert_changelog_entry(str(path), V1)
+    assert path.read_text() == "# Changelog\n\n" + V1
+
+def test_index_stays_in_sync_with_the_file(tmp_path, monkeypatch):
+    path = tmp_path / "CHANGELOG.md"
+    path.write_text(HEADER + V1)
+    assert [heading.version for heading in get_changelog_index(str(path))] == ["1.0.0"]
+
+    insert_changelog_entry(str(path), V1_1)
+    insert_changelog_entry(str(path), V2)
+    updated = get_changelog_index(str(path))
+
+    assert [heading.version for heading in updated] == ["2.0.0", "1.1.0", "1.0.0"]
+    assert updated == _rebuilt_index(str(path), monkeypatch, tmp_path)
+    with open(path, "rb") as f:
+        data = f.read()
+    assert all(data[heading.offset:].startswith(b"## ") for heading in updated)
+
+def test_read_changelog_section(tmp_path):
+    path = tmp_path / "CHANGELOG.md"
+    path.write_text(HEADER + V1_1 + "\n" + V1)
+    assert read_changelog_section(str(path), "v1.1.0") == V1_1
+    assert read_changelog_section(str(path), "1.0.0") == V1
+    assert read_changelog_section(str(path), "3.0.0") is None
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+def test_insert_keeps_the_file_mode(tmp_path):
+    path = tmp_path / "CHANGELOG.md"
+    path.write_text(HEADER + V1)
+    os.chmod(path, 0o640)
+    insert_changelog_entry(str(path), V1_1)
+    assert os.stat(path).st_mode & 0o777 == 0o640
@@ -0,0 +1,66 @@
+# tests/test_config.py
+import os
+
+import pytest
+import yaml
+
+from gfr.utils import config as config_module
+from gfr.utils.config import ConfigStore
+
+def _on_disk(path) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.safe_load(f)
+
+def _failing_write(*args, **kwargs):
+    raise OSError("disk full")
+
+def test_changes_are_written_once_on_flush(tmp_path):
+    path = str(tmp_path / ".gfr.yml")
+    store = ConfigStore(path)
+    store.set("last_used_microservice", "billing")
+    assert not os.path.exists(path)
+    store.flush()
+    assert _on_disk(path) == {"last_used_microservice": "billing"}
+
+def test_setting_the_current_value_writes_nothing(tmp_path):
+    path = tmp_path / ".gfr.yml"
+    path.write_text("last_used_microservice: billing\n")
+    store = ConfigStore(str(path))
+    store.set("last_used_microservice", "billing")
+    mtime = os.stat(path).st_mtime_ns
+    store.flush()
+    assert os.stat(path).st_mtime_ns == mtime
+
+def test_keys_written_by_another_process_survive(tmp_path):
+    path = tmp_path / ".gfr.yml"
+    store = ConfigStore(str(path))
+    path.write_text("other: kept\n")
+    store.set("last_used_microservice", "billing")
+    store.flush()
+    assert _on_disk(path) == {"other": "kept", "last_used_microservice": "billing"}
+    assert store.get("other") == "kept"
+
+def test_a_failed_write_keeps_the_changes_pending(tmp_path, monkeypatch):
+    path = str(tmp_path / ".gfr.yml")
+    store = ConfigStore(path)
+    store.set("last_used_microservice", "billing")
+    with monkeypatch.context() as patch:
+        patch.setattr(config_module, "atomic_write", _failing_write)
+        with pytest.raises(OSError):
+            store.flush()
+    assert not os.path.exists(path)
+
+    store.flush()
+    assert _on_disk(path) == {"last_used_microservice": "billing"}
+
+def test_a_value_set_after_a_failed_write_wins(tmp_path, monkeypatch):
+    path = str(tmp_path / ".gfr.yml")
+    store = ConfigStore(path)
+    store.set("last_used_microservice", "billing")
+    with monkeypatch.context() as patch:
+        patch.setattr(config_module, "atomic_write", _failing_write)
+        with pytest.raises(OSError):
+            store.flush()
+    store.set("last_used_microservice", "shipping")
+    store.flush()
+    assert _on_disk(path) == {"last_used_microservice": "shipping"}
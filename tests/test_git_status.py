@@ -0,0 +1,35 @@
+# tests/test_git_status.py
+import os
+
+import pytest
+
+from gfr.utils.git.operations import GitOperations
+from conftest import git, make_repo
+
+@pytest.fixture
+def project(tmp_path):
+    """A superproject with one submodule, each with a staged rename (a.txt -> c.txt)."""
+    library = make_repo(tmp_path / "library", {"a.txt": "library\n"})
+    root = make_repo(tmp_path / "project", {"a.txt": "project\n"})
+    git(root, "submodule", "add", "-q", library, "libs/library")
+    git(root, "commit", "-q", "-m", "Add library")
+    for repo in (root, os.path.join(root, "libs", "library")):
+        git(repo, "mv", "a.txt", "c.txt")
+    return root
+
+def test_get_status_reports_a_staged_rename(project):
+    status = GitOperations().get_status(project)
+    assert status.branch == "main"
+    assert status.renamed == [("a.txt", "c.txt")]
+    assert status.staged == ["c.txt"]
+
+@pytest.mark.parametrize("jobs", [1, 2, 4])
+def test_get_tree_status_reports_renames_in_every_repository(project, jobs):
+    root, library = GitOperations().get_tree_status(project, with_remotes=True, jobs=jobs)
+    assert root.path == "."
+    assert library.path == "libs/library"
+    for status in (root, library):
+        assert status.error is None
+        assert status.renamed == [("a.txt", "c.txt")]
+        assert status.staged == ["c.txt"]
+    assert library.remote_url.endswith("library")
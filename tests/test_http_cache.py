@@ -0,0 +1,40 @@
+# tests/test_http_cache.py
+import os
+import stat
+import sys
+
+import pytest
+
+from gfr.utils.github.http import HTTPCache
+
+def _mode(path) -> int:
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+def test_round_trip(tmp_path):
+    cache = HTTPCache(str(tmp_path / "http"), ttl=60)
+    cache.put("key", {"body": [1, 2], "headers": {"ETag": '"abc"'}})
+    entry = cache.get("key")
+    assert entry["body"] == [1, 2]
+    assert cache.is_fresh(entry)
+    assert cache.get("missing") is None
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+def test_entries_are_private(tmp_path):
+    directory = tmp_path / "http"
+    directory.mkdir(mode=0o755)
+    old_umask = os.umask(0o022)
+    try:
+        cache = HTTPCache(str(directory))
+        cache.put("key", {"body": "private", "headers": {}})
+    finally:
+        os.umask(old_umask)
+    assert _mode(directory) == 0o700
+    assert _mode(directory / "key.json") == 0o600
+
+def test_eviction_keeps_the_cache_under_max_bytes(tmp_path):
+    cache = HTTPCache(str(tmp_path / "http"), max_bytes=400)
+    for number in range(10):
+        cache.put(f"key{number}", {"body": "x" * 50, "headers": {}})
+    total = sum(os.path.getsize(tmp_path / "http" / name) for name in os.listdir(tmp_path / "http"))
+    assert total <= 400
+    assert cache.get("key9") is not None
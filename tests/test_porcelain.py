@@ -0,0 +1,84 @@
+# tests/test_porcelain.py
+from gfr.utils.git.porcelain import StatusParser, parse_status_v2, parse_tree_status_v2
+
+HEADERS = [
+    "# branch.oid 1234567890abcdef1234567890abcdef12345678",
+    "# branch.head main",
+    "# branch.upstream origin/main",
+    "# branch.ab +2 -1",
+]
+MODIFIED = "1 .M N... 100644 100644 100644 aaaaaaa bbbbbbb notes with spaces.txt"
+ADDED = "1 A. N... 000000 100644 100644 0000000 ccccccc new.txt"
+RENAMED = "2 R. N... 100644 100644 100644 ddddddd ddddddd R100 c.txt"
+UNMERGED = "u UU N... 100644 100644 100644 100644 eeeeeee fffffff 0000000 conflict.txt"
+SUBMODULE = "1 .M SC.. 160000 160000 160000 1111111 1111111 libs/core"
+
+def test_branch_headers():
+    status = parse_status_v2(HEADERS)
+    assert status.branch == "main"
+    assert status.upstream == "origin/main"
+    assert (status.ahead, status.behind) == (2, 1)
+
+def test_detached_head_reports_head():
+    status = parse_status_v2(["# branch.oid 1234567", "# branch.head (detached)"])
+    assert status.branch == "HEAD"
+
+def test_file_lists():
+    status = parse_status_v2(HEADERS + [MODIFIED, ADDED, "? untracked.txt", "! ignored.log"])
+    assert status.staged == ["new.txt"]
+    assert status.unstaged == ["notes with spaces.txt"]
+    assert status.untracked == ["untracked.txt"]
+    assert not status.is_clean
+
+def test_rename_from_a_list():
+    status = parse_status_v2(HEADERS + [RENAMED, "a.txt", "? after.txt"])
+    assert status.renamed == [("a.txt", "c.txt")]
+    assert status.staged == ["c.txt"]
+    # The original path is not mistaken for an entry of its own
+    assert status.untracked == ["after.txt"]
+
+def test_rename_whose_original_path_looks_like_an_entry():
+    status = parse_status_v2([RENAMED, "? tricky"])
+    assert status.renamed == [("? tricky", "c.txt")]
+    assert status.untracked == []
+
+def test_unmerged_entry_is_staged_and_unstaged():
+    status = parse_status_v2([UNMERGED])
+    assert status.staged == ["conflict.txt"]
+    assert status.unstaged == ["conflict.txt"]
+
+def test_submodule_entry():
+    status = parse_status_v2([SUBMODULE])
+    assert status.unstaged == ["libs/core"]
+    assert status.staged == []
+
+def test_clean_repository():
+    status = parse_status_v2(HEADERS)
+    assert status.is_clean
+
+def test_tree_stream():
+    records = [
+        "# gfr.repo libs/core", "# gfr.remote git@example.com:org/core.git", *HEADERS, RENAMED, "a.txt",
+        "# gfr.repo libs/core/vendor", "# gfr.error Could not read the status of this submodule.",
+        "# gfr.repo libs/empty", "# gfr.remote ", "# branch.head main",
+    ]
+    core, vendor, empty = parse_tree_status_v2(records)
+    assert core.path == "libs/core"
+    assert core.remote_url == "git@example.com:org/core.git"
+    assert core.renamed == [("a.txt", "c.txt")]
+    assert vendor.error == "Could not read the status of this submodule."
+    assert empty.remote_url is None
+    assert empty.is_clean
+
+def test_tree_stream_ignores_records_before_the_first_header():
+    statuses = list(parse_tree_status_v2(["? stray", "# gfr.repo sub", "? file"]))
+    assert [(s.path, s.untracked) for s in statuses] == [("sub", ["file"])]
+
+def test_feed_returns_each_repository_when_the_next_one_starts():
+    parser = StatusParser(tree=True)
+    assert parser.feed("# gfr.repo one") is None
+    assert parser.feed(RENAMED) is None
+    assert parser.feed("a.txt") is None
+    finished = parser.feed("# gfr.repo two")
+    assert finished.path == "one" and finished.renamed == [("a.txt", "c.txt")]
+    assert parser.close().path == "two"
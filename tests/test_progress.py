@@ -0,0 +1,35 @@
+# tests/test_progress.py
+import pytest
+
+from gfr.utils.git.progress import GitProgress, parse_progress_line
+
+@pytest.mark.parametrize("line, expected", [
+    ("Receiving objects:  45% (450/1000), 1.20 MiB | 2.40 MiB/s",
+     GitProgress("Receiving objects", 450, 1000, "1.20 MiB | 2.40 MiB/s")),
+    ("Receiving objects: 100% (1000/1000), 2.50 MiB | 2.40 MiB/s, done.",
+     GitProgress("Receiving objects", 1000, 1000, "2.50 MiB | 2.40 MiB/s", done=True)),
+    ("Resolving deltas: 100% (10/10), done.", GitProgress("Resolving deltas", 10, 10, done=True)),
+    ("remote: Counting objects:  50% (5/10)", GitProgress("Counting objects", 5, 10)),
+    ("remote: Enumerating objects: 1234, done.", GitProgress("Enumerating objects", 1234, done=True)),
+    ("Enumerating objects: 12", GitProgress("Enumerating objects", 12)),
+    # Servers pad their lines with 'erase to end of line' sequences
+    ("remote: Compressing objects:  20% (2/10)\x1b[K", GitProgress("Compressing objects", 2, 10)),
+])
+def test_progress_lines(line, expected):
+    assert parse_progress_line(line) == expected
+
+@pytest.mark.parametrize("line", [
+    "To github.com:org/repo.git",
+    "   1234567..89abcde  main -> main",
+    " ! [rejected]        main -> main (fetch first)",
+    "error: failed to push some refs to 'github.com:org/repo.git'",
+    "hint: Updates were rejected because the remote contains work that you do",
+    "Cloning into 'repo'...",
+    "",
+])
+def test_other_lines_are_not_progress(line):
+    assert parse_progress_line(line) is None
+
+def test_percent():
+    assert GitProgress("Writing objects", 1, 4).percent == 25
+    assert GitProgress("Enumerating objects", 12).percent is None
@@ -0,0 +1,75 @@
+# tests/test_push.py
+import os
+
+import pytest
+from typer.testing import CliRunner
+
+from gfr.commands import acp as acp_command
+from gfr.commands import add as add_command
+from gfr.commands import push as push_command
+from gfr.utils.git.context import reset_repo_context
+from gfr.utils.git.operations import GitOperations
+from conftest import git, make_repo
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """A superproject and one submodule, both pushing to bare remotes."""
+    for name in ("project", "library"):
+        git(tmp_path, "init", "-q", "--bare", f"{name}.git")
+        make_repo(tmp_path / name, {"README.md": f"{name}\n"})
+        git(tmp_path / name, "remote", "add", "origin", str(tmp_path / f"{name}.git"))
+    git(tmp_path / "library", "push", "-q", "origin", "main")
+    root = tmp_path / "project"
+    git(root, "submodule", "add", "-q", str(tmp_path / "library.git"), "library")
+    git(root, "commit", "-q", "-m", "Add library")
+    monkeypatch.chdir(root)
+    reset_repo_context()
+    yield root
+    reset_repo_context()
+
+def test_push_summarizes_every_repository(project):
+    result = CliRunner().invoke(push_command.app, ["--jobs", "2"])
+    assert result.exit_code == 0, result.output
+    assert "All repositories have been pushed successfully" in result.output
+    assert git(project, "ls-remote", "--heads", "origin", "main")
+
+def test_unexpected_errors_are_reported_as_failures(project, monkeypatch):
+    push_all = GitOperations.push_all
+
+    def flaky_push_all(self, path=".", progress=None):
+        if os.path.basename(path) == "library":
+            raise OSError("Too many open files")
+        push_all(self, path, progress)
+
+    monkeypatch.setattr(GitOperations, "push_all", flaky_push_all)
+    result = CliRunner().invoke(push_command.app, [])
+    assert result.exit_code == 1
+    assert "Push failed for library: Too many open files" in result.output
+    assert "1 of 2 repositories failed to push" in result.output
+
+@pytest.fixture
+def in_subdirectory(project, monkeypatch):
+    """Runs commands from a plain directory below the project root."""
+    (project / "docs").mkdir()
+    monkeypatch.chdir(project / "docs")
+    return project
+
+def test_push_from_subdirectory(in_subdirectory):
+    result = CliRunner().invoke(push_command.app, [])
+    assert result.exit_code == 0, result.output
+    assert "All repositories have been pushed successfully" in result.output
+
+def test_add_resolves_submodule_from_subdirectory(in_subdirectory):
+    (in_subdirectory / "library" / "README.md").write_text("changed\n")
+    result = CliRunner().invoke(add_command.app, ["library", "README.md"])
+    assert result.exit_code == 0, result.output
+    assert git(in_subdirectory / "library", "diff", "--cached", "--name-only") == "README.md"
+
+def test_acp_all_from_subdirectory_commits_whole_tree(in_subdirectory):
+    (in_subdirectory / "README.md").write_text("changed\n")
+    (in_subdirectory / "library" / "README.md").write_text("changed\n")
+    result = CliRunner().invoke(acp_command.app, ["ALL", "Update"])
+    assert result.exit_code == 0, result.output
+    assert git(in_subdirectory, "status", "--porcelain") == ""
+    assert git(in_subdirectory / "library", "status", "--porcelain") == ""
+    assert git(in_subdirectory, "rev-parse", "HEAD") == git(in_subdirectory, "rev-parse", "origin/main")
@@ -0,0 +1,94 @@
+# tests/test_scheduler.py
+import threading
+import time
+
+import pytest
+
+from gfr.utils.scheduler import TaskScheduler
+
+class Recorder:
+    """Records when tasks start and finish, from any worker thread."""
+    def __init__(self):
+        self.events = []
+        self._lock = threading.Lock()
+
+    def task(self, name: str, fail: bool = False, delay: float = 0.0):
+        def run():
+            with self._lock:
+                self.events.append(("start", name))
+            time.sleep(delay)
+            with self._lock:
+                self.events.append(("end", name))
+            if fail:
+                raise RuntimeError(f"{name} failed")
+            return name.upper()
+        return run
+
+    def position(self, kind: str, name: str) -> int:
+        return self.events.index((kind, name))
+
+def test_tasks_start_after_their_dependencies_finish():
+    recorder = Recorder()
+    scheduler = TaskScheduler(jobs=4)
+    # Registered before its dependencies, as 'acp ALL' does for nested submodules
+    scheduler.add("root", recorder.task("root"), depends_on=["a", "b"])
+    scheduler.add("a", recorder.task("a", delay=0.05), depends_on=["a/nested"])
+    scheduler.add("a/nested", recorder.task("a/nested"))
+    scheduler.add("b", recorder.task("b"))
+
+    results = scheduler.run()
+
+    assert list(results) == ["root", "a", "a/nested", "b"]
+    assert all(result.state == "done" for result in results.values())
+    assert results["root"].value == "ROOT"
+    assert recorder.position("end", "a/nested") < recorder.position("start", "a")
+    assert recorder.position("end", "a") < recorder.position("start", "root")
+    assert recorder.position("end", "b") < recorder.position("start", "root")
+
+def test_a_failure_skips_everything_downstream_only():
+    recorder = Recorder()
+    scheduler = TaskScheduler(jobs=2)
+    scheduler.add("leaf", recorder.task("leaf", fail=True))
+    scheduler.add("middle", recorder.task("middle"), depends_on=["leaf"])
+    scheduler.add("top", recorder.task("top"), depends_on=["middle", "other"])
+    scheduler.add("other", recorder.task("other"))
+
+    results = scheduler.run()
+
+    assert results["leaf"].state == "failed"
+    assert str(results["leaf"].error) == "leaf failed"
+    assert results["middle"].state == "skipped"
+    assert results["top"].state == "skipped"
+    assert results["other"].state == "done"
+    assert ("start", "middle") not in recorder.events
+    assert ("start", "top") not in recorder.events
+
+def test_independent_tasks_run_concurrently():
+    barrier = threading.Barrier(2, timeout=5)
+    scheduler = TaskScheduler(jobs=2)
+    scheduler.add("one", barrier.wait)
+    scheduler.add("two", barrier.wait)
+    results = scheduler.run()
+    assert [result.state for result in results.values()] == ["done", "done"]
+
+def test_duplicate_tasks_are_rejected():
+    scheduler = TaskScheduler()
+    scheduler.add("task", lambda: None)
+    with pytest.raises(ValueError, match="already scheduled"):
+        scheduler.add("task", lambda: None)
+
+def test_unknown_dependencies_are_rejected():
+    scheduler = TaskScheduler()
+    scheduler.add("task", lambda: None, depends_on=["missing"])
+    with pytest.raises(ValueError, match="unknown task"):
+        scheduler.run()
+
+def test_cycles_are_rejected_before_anything_runs():
+    ran = []
+    scheduler = TaskScheduler()
+    scheduler.add("free", lambda: ran.append("free"))
+    scheduler.add("a", lambda: None, depends_on=["b"])
+    scheduler.add("b", lambda: None, depends_on=["a"])
+    with pytest.raises(ValueError, match="cycle"):
+        scheduler.run()
+    assert ran == []
@@ -0,0 +1,75 @@
+# tests/test_tags.py
+import os
+
+import pytest
+
+from gfr.utils.git.tags import TagIndex, Version, parse_version, read_tag_names
+from conftest import git, make_repo
+
+def test_parse_version():
+    assert parse_version("v1.2.3") == Version(1, 2, 3)
+    assert parse_version("1.2.3-rc.1+build.5") == Version(1, 2, 3, ("rc", "1"), "build.5")
+    assert str(parse_version("v2.0.0-beta.2+sha.abc")) == "2.0.0-beta.2+sha.abc"
+
+@pytest.mark.parametrize("tag", ["release-1", "v1.2", "1.2.3.4", "v01.2.3", "1.2.3-", "latest"])
+def test_non_semver_tags_are_rejected(tag):
+    assert parse_version(tag) is None
+
+def test_precedence_follows_semver():
+    # The example ordering from the semver specification, shuffled
+    ordered = ["1.0.0-alpha", "1.0.0-alpha.1", "1.0.0-alpha.beta", "1.0.0-beta",
+               "1.0.0-beta.2", "1.0.0-beta.11", "1.0.0-rc.1", "1.0.0"]
+    shuffled = ordered[3:] + ordered[:3]
+    assert sorted(shuffled, key=lambda tag: parse_version(tag).sort_key()) == ordered
+
+def test_build_metadata_does_not_affect_precedence():
+    assert parse_version("1.0.0+a").sort_key() == parse_version("1.0.0+b").sort_key()
+
+@pytest.mark.parametrize("version, release_type, expected", [
+    ("1.2.3", "patch", "1.2.4"),
+    ("1.2.3", "minor", "1.3.0"),
+    ("1.2.3", "major", "2.0.0"),
+    ("2.0.0-rc.1", "major", "2.0.0"),
+    ("1.3.0-beta", "minor", "1.3.0"),
+    ("1.2.4-rc.2", "patch", "1.2.4"),
+    ("1.3.1-rc.1", "minor", "1.4.0"),
+])
+def test_bump(version, release_type, expected):
+    assert str(parse_version(version).bump(release_type)) == expected
+
+def test_tag_index():
+    index = TagIndex(["v1.9.0", "v1.10.0", "nightly", "v1.10.0-rc.1", "v0.1.0", "v1.2.0"])
+    assert len(index) == 5
+    assert index.latest() == "v1.10.0"
+    assert index.previous() == "v1.10.0-rc.1"
+    assert index.before("v1.10.0-rc.1") == "v1.9.0"
+    # The tag doesn't have to exist
+    assert index.before("v1.5.0") == "v1.2.0"
+    assert index.before("v0.1.0") is None
+    assert index.before("nightly") is None
+
+def test_empty_tag_index():
+    index = TagIndex(["nightly"])
+    assert len(index) == 0
+    assert index.latest() is None
+    assert index.previous() is None
+
+def test_read_tag_names_reads_loose_and_packed_refs(tmp_path):
+    repo = make_repo(tmp_path / "repo", {"a.txt": "a\n"})
+    git(repo, "tag", "v1.0.0")
+    git(repo, "tag", "-a", "v1.1.0", "-m", "Release 1.1.0")
+    git(repo, "pack-refs", "--all")
+    git(repo, "tag", "v1.2.0")
+    git(repo, "tag", "release/v2.0.0")
+    # Moved after packing: both loose and packed now, listed once
+    git(repo, "tag", "-f", "v1.0.0")
+
+    names = list(read_tag_names(os.path.join(repo, ".git")))
+
+    assert sorted(names) == ["release/v2.0.0", "v1.0.0", "v1.1.0", "v1.2.0"]
+    assert sorted(names) == sorted(git(repo, "tag", "--list").splitlines())
+    assert TagIndex(names).latest() == "v1.2.0"
+
+def test_read_tag_names_without_tags(tmp_path):
+    repo = make_repo(tmp_path / "repo", {"a.txt": "a\n"})
+    assert list(read_tag_names(os.path.join(repo, ".git"))) == []